@@ -0,0 +1,306 @@
+"""
+benchmarks of result parsing and instruction insertion, run with
+    python -m benchmarks.suite --output new.json --compare old.json
+timings are in seconds (minimum and median of the repeats), memory is peak of traced allocations in bytes.
+benchmarks are registered only for functions (and parameters) available in the installed version of qiskit_utils,
+so the same suite can produce the report of an older version to compare against
+"""
+import argparse
+import inspect
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from qiskit import __version__ as qiskit_version
+from qiskit.circuit.library import XGate
+
+from benchmarks.synthetic import make_gate_circuit, make_measured_circuit, make_result, spread_positions
+import qiskit_utils
+
+REGRESSION_THRESHOLD = 1.2
+
+
+class Benchmark(NamedTuple):
+    """
+    benchmark is a function called with the value returned by setup, only the function is timed
+    """
+    name: str
+    params: Dict[str, Any]
+    setup: Callable[[], Any]
+    function: Callable[[Any], Any]
+
+
+def parse_benchmarks(quick: bool = False) -> Iterator[Benchmark]:
+    """
+    :param quick: if true only small configurations are generated
+    :return: benchmarks of parse_result and parse_counts on synthetic results
+    """
+    configurations = [(5, (5,), 32), (20, (8, 8, 4), 1000), (64, (16, 16, 16, 16), 4000)]
+    if quick:
+        configurations = configurations[:2]
+
+    variants = {}
+    for variant, function_name, kwargs in [
+        ("parse_result", "parse_result", {}),
+        ("parse_result_vectorized", "parse_result", {"vectorized": True}),
+        ("parse_result_raw_counts", "parse_result", {"raw_counts": True}),
+        ("parse_counts", "parse_counts", {}),
+        ("parse_counts_raw_counts", "parse_counts", {"raw_counts": True}),
+        ("parse_counts_as_array", "parse_counts", {"as_array": True}),
+    ]:
+        function = _get_function(function_name, *kwargs)
+        if function is not None:
+            variants[variant] = lambda args, function=function, kwargs=kwargs: function(*args, **kwargs)
+
+    for num_qubits, creg_sizes, num_outcomes in configurations:
+        circuit = make_measured_circuit(num_qubits, creg_sizes)
+        result = make_result(circuit, num_outcomes)
+        params = {"num_qubits": num_qubits, "creg_sizes": list(creg_sizes), "num_outcomes": num_outcomes}
+        for variant, function in variants.items():
+            if variant == "parse_counts_as_array" and num_qubits > 28:
+                continue
+            name = f"{variant}[q={num_qubits},cregs={len(creg_sizes)},outcomes={num_outcomes}]"
+            yield Benchmark(name, params, lambda result=result, circuit=circuit: (result, circuit), function)
+
+
+def insert_benchmarks(quick: bool = False) -> Iterator[Benchmark]:
+    """
+    :param quick: if true only small configurations are generated
+    :return: benchmarks of insert_instruction at different positions, of inserting batches of instructions and of
+    inserting one instruction into many circuits
+    """
+    insert_instruction = _get_function("insert_instruction")
+    insert_instructions = _get_function("insert_instructions")
+    insert_into_many = _get_function("insert_into_many", "in_place", "share_data")
+
+    num_qubits = 10
+    sizes = [1000, 100000] if not quick else [1000, 10000]
+    for num_instructions in sizes:
+        circuit = make_gate_circuit(num_qubits, num_instructions)
+        for position_name, position in (("start", 0), ("middle", num_instructions // 2), ("end", num_instructions)):
+            yield Benchmark(
+                f"insert_instruction[n={num_instructions},at={position_name}]",
+                {"num_instructions": num_instructions, "position": position},
+                lambda circuit=circuit: circuit.copy(),
+                lambda copied, position=position: insert_instruction(copied, XGate(), [0], [], position),
+            )
+
+        for batch_size in (10, 100):
+            positions = spread_positions(num_instructions, batch_size)
+            params = {"num_instructions": num_instructions, "batch_size": batch_size}
+            yield Benchmark(
+                f"insert_instruction_loop[n={num_instructions},batch={batch_size}]", params,
+                lambda circuit=circuit: circuit.copy(),
+                lambda copied, positions=positions: [
+                    insert_instruction(copied, XGate(), [0], [], position + i) for i, position in enumerate(positions)
+                ],
+            )
+            if insert_instructions is None:
+                continue
+            yield Benchmark(
+                f"insert_instructions[n={num_instructions},batch={batch_size}]", params,
+                lambda circuit=circuit: circuit.copy(),
+                lambda copied, positions=positions: insert_instructions(
+                    copied, [(XGate(), [0], [], position) for position in positions]),
+            )
+
+    if insert_into_many is None:
+        return
+    num_circuits = 1000 if not quick else 100
+    circuits = [make_gate_circuit(num_qubits, 1000) for _ in range(num_circuits)]
+    for share_data in (False, True):
+        yield Benchmark(
+            f"insert_into_many[circuits={num_circuits},n=1000,share_data={share_data}]",
+            {"num_circuits": num_circuits, "num_instructions": 1000, "share_data": share_data},
+            lambda: None,
+            lambda _, share_data=share_data: insert_into_many(
+                circuits, XGate(), [0], [], 500, in_place=False, share_data=share_data),
+        )
+
+
+def _get_function(name: str, *parameters: str) -> Optional[Callable[..., Any]]:
+    """
+    :param name: name of a public function of qiskit_utils
+    :param parameters: names of parameters the benchmark passes to the function
+    :return: the function, None if the installed version of qiskit_utils doesn't have it or any of the parameters
+    """
+    function = getattr(qiskit_utils, name, None)
+    if function is None or not set(parameters) <= set(inspect.signature(function).parameters):
+        return None
+    return function
+
+
+IMPORT_STATEMENTS = {
+    "import[qiskit_utils]": "import qiskit_utils",
+    "import[parse_counts]": "from qiskit_utils import parse_counts",
+}
+
+_IMPORT_TIMER = """
+import time, tracemalloc
+if {trace}:
+    tracemalloc.start()
+start = time.perf_counter()
+{statement}
+duration = time.perf_counter() - start
+print(duration, tracemalloc.get_traced_memory()[1])
+"""
+
+
+def run_import_benchmark(statement: str, repeat: int) -> Dict[str, Any]:
+    """
+    time the import statement in fresh interpreters (so nothing is imported yet), memory is measured in a separate
+    run as tracing allocations slows imports down
+    :param statement: import statement to time
+    :param repeat: number of timed runs
+    :return: report of the benchmark
+    """
+    timings = [_run_import_timer(statement, trace=False)[0] for _ in range(repeat)]
+    _, peak_memory = _run_import_timer(statement, trace=True)
+    return {
+        "params": {"statement": statement},
+        "repeat": repeat,
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "peak_memory": peak_memory,
+    }
+
+
+def _run_import_timer(statement: str, trace: bool) -> Tuple[float, int]:
+    """
+    :param statement: import statement to time
+    :param trace: if true allocations are traced
+    :return: tuple of duration of the import and peak of traced allocations
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", _IMPORT_TIMER.format(statement=statement, trace=trace)],
+        check=True, capture_output=True, text=True,
+    ).stdout.split()
+    return float(output[0]), int(output[1])
+
+
+def run_benchmark(benchmark: Benchmark, repeat: int) -> Dict[str, Any]:
+    """
+    :param benchmark: benchmark to run
+    :param repeat: number of timed runs
+    :return: report of the benchmark
+    """
+    timings = []
+    for _ in range(repeat):
+        args = benchmark.setup()
+        start = time.perf_counter()
+        benchmark.function(args)
+        timings.append(time.perf_counter() - start)
+
+    args = benchmark.setup()
+    tracemalloc.start()
+    try:
+        benchmark.function(args)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "params": benchmark.params,
+        "repeat": repeat,
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "peak_memory": peak_memory,
+    }
+
+
+def run_suite(repeat: int = 5, quick: bool = False, name_filter: Optional[str] = None) -> Dict[str, Any]:
+    """
+    :param repeat: number of timed runs of every benchmark
+    :param quick: if true only small configurations are run
+    :param name_filter: if provided only benchmarks whose names contain it are run
+    :return: report of the suite, can be saved as json
+    """
+    benchmarks = {}
+    for benchmark in [*parse_benchmarks(quick), *insert_benchmarks(quick)]:
+        if name_filter is not None and name_filter not in benchmark.name:
+            continue
+        benchmarks[benchmark.name] = run_benchmark(benchmark, repeat)
+        print(f"{benchmark.name}: {benchmarks[benchmark.name]['median']:.6f}s", file=sys.stderr)
+    for name, statement in IMPORT_STATEMENTS.items():
+        if name_filter is not None and name_filter not in name:
+            continue
+        benchmarks[name] = run_import_benchmark(statement, repeat)
+        print(f"{name}: {benchmarks[name]['median']:.6f}s", file=sys.stderr)
+
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "qiskit": qiskit_version,
+            "platform": platform.platform(),
+        },
+        "benchmarks": benchmarks,
+    }
+
+
+def compare_reports(
+        old_report: Dict[str, Any], new_report: Dict[str, Any],
+        threshold: float = REGRESSION_THRESHOLD) -> List[Dict[str, Any]]:
+    """
+    compare medians and peak memory of benchmarks present in both reports
+    :param old_report: report of the baseline version
+    :param new_report: report of the new version
+    :param threshold: ratio of new to old median above which benchmark is marked as regressed
+    :return: list of comparisons (one per benchmark)
+    """
+    comparisons = []
+    for name, new in new_report["benchmarks"].items():
+        old = old_report["benchmarks"].get(name)
+        if old is None:
+            continue
+        time_ratio = new["median"] / old["median"] if old["median"] else float("inf")
+        memory_ratio = new["peak_memory"] / old["peak_memory"] if old["peak_memory"] else float("inf")
+        comparisons.append({
+            "name": name,
+            "old_median": old["median"],
+            "new_median": new["median"],
+            "time_ratio": time_ratio,
+            "memory_ratio": memory_ratio,
+            "regressed": time_ratio > threshold,
+        })
+    return comparisons
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="benchmarks of qiskit_utils")
+    parser.add_argument("--output", help="path of json file where the report is saved")
+    parser.add_argument("--compare", help="path of json report of a previous run to compare against")
+    parser.add_argument("--repeat", type=int, default=5, help="number of timed runs of every benchmark")
+    parser.add_argument("--quick", action="store_true", help="run only small configurations")
+    parser.add_argument("--filter", help="run only benchmarks whose names contain this string")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="ratio of medians above which benchmark is reported as regressed")
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.repeat, args.quick, args.filter)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if not args.compare:
+        return 0
+
+    with open(args.compare) as old_file:
+        comparisons = compare_reports(json.load(old_file), report, args.threshold)
+    for comparison in comparisons:
+        marker = "REGRESSED" if comparison["regressed"] else ""
+        print(f"{comparison['name']}: {comparison['old_median']:.6f}s -> {comparison['new_median']:.6f}s "
+              f"(x{comparison['time_ratio']:.2f} time, x{comparison['memory_ratio']:.2f} memory) {marker}",
+              file=sys.stderr)
+    return 1 if any(comparison["regressed"] for comparison in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+import random
+from typing import List, Sequence
+
+from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
+from qiskit.result import Result
+
+
+def make_measured_circuit(num_qubits: int, creg_sizes: Sequence[int], seed: int = 0) -> QuantumCircuit:
+    """
+    create circuit with the given classical registers where the first sum(creg_sizes) qubits (or all qubits if there
+    are fewer) are measured into randomly permuted clbits
+    :param num_qubits: number of qubits of the circuit
+    :param creg_sizes: sizes of classical registers (in order of circuit.cregs)
+    :param seed: seed of the permutation
+    :return: circuit with measurements
+    """
+    circuit = QuantumCircuit(QuantumRegister(num_qubits), *[ClassicalRegister(size) for size in creg_sizes])
+    clbits = list(range(circuit.num_clbits))
+    random.Random(seed).shuffle(clbits)
+    for qubit, clbit in zip(range(num_qubits), clbits):
+        circuit.measure(qubit, clbit)
+    return circuit
+
+
+def make_result(circuit: QuantumCircuit, num_outcomes: int, shots_per_outcome: int = 1, seed: int = 0) -> Result:
+    """
+    create result of the circuit (as returned by a backend) with the given number of distinct random outcomes,
+    no simulation is run so the result can be arbitrarily wide
+    :param circuit: circuit for which the result is created
+    :param num_outcomes: number of distinct measured states (at most 2 ** circuit.num_clbits)
+    :param shots_per_outcome: number of times each state was measured
+    :param seed: seed of the outcomes
+    :return: result with one experiment
+    """
+    memory_slots = circuit.num_clbits
+    if num_outcomes > 2 ** memory_slots:
+        raise ValueError("number of outcomes is larger than number of possible states")
+
+    rng = random.Random(seed)
+    outcomes = set()
+    while len(outcomes) < num_outcomes:
+        outcomes.add(rng.getrandbits(memory_slots) if memory_slots else 0)
+
+    return Result.from_dict({
+        "backend_name": "synthetic",
+        "backend_version": "0.0.0",
+        "qobj_id": "synthetic",
+        "job_id": "synthetic",
+        "success": True,
+        "results": [{
+            "shots": num_outcomes * shots_per_outcome,
+            "success": True,
+            "data": {"counts": {hex(outcome): shots_per_outcome for outcome in outcomes}},
+            "header": {
+                "creg_sizes": [[creg.name, creg.size] for creg in circuit.cregs],
+                "memory_slots": memory_slots,
+                "n_qubits": circuit.num_qubits,
+            },
+        }],
+    })
+
+
+def make_gate_circuit(num_qubits: int, num_instructions: int) -> QuantumCircuit:
+    """
+    :param num_qubits: number of qubits of the circuit
+    :param num_instructions: number of instructions of the circuit
+    :return: circuit with alternating layers of h and cx gates
+    """
+    circuit = QuantumCircuit(num_qubits)
+    for i in range(num_instructions):
+        qubit = i % num_qubits
+        if (i // num_qubits) % 2 and num_qubits > 1:
+            circuit.cx(qubit, (qubit + 1) % num_qubits)
+        else:
+            circuit.h(qubit)
+    return circuit
+
+
+def spread_positions(num_instructions: int, count: int) -> List[int]:
+    """
+    :param num_instructions: number of instructions of the circuit
+    :param count: number of positions
+    :return: positions spread evenly over the circuit
+    """
+    return [num_instructions * i // count for i in range(count)]
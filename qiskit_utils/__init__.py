@@ -1,4 +1,80 @@
-from qiskit_utils.insert import insert_instruction
-from qiskit_utils.enhanced_circuit import QuantumCircuitEnhanced
-from qiskit_utils.parse_result import parse_result
-from qiskit_utils.parse_counts import parse_counts
+"""
+submodules (and qiskit with them) are imported on first access of their names, so importing the package is cheap
+"""
+import sys
+from importlib import import_module
+from types import ModuleType
+from typing import Any, List
+
+_LAZY_ATTRIBUTES = {
+    "insert_instruction": "qiskit_utils.insert",
+    "insert_instructions": "qiskit_utils.insert",
+    "insert_into_many": "qiskit_utils.insert",
+    "QuantumCircuitEnhanced": "qiskit_utils.enhanced_circuit",
+    "parse_result": "qiskit_utils.parse_result",
+    "parse_counts": "qiskit_utils.parse_counts",
+    "MeasurementPlan": "qiskit_utils.measurement_plan",
+    "parse_results_batch": "qiskit_utils.parse_batch",
+    "parse_counts_batch": "qiskit_utils.parse_batch",
+    "parse_memory": "qiskit_utils.parse_memory",
+    "unpack_memory": "qiskit_utils.parse_memory",
+    "parse_all": "qiskit_utils.parse_all",
+    "parse_marginals": "qiskit_utils.parse_marginals",
+    "expectation_values": "qiskit_utils.expectation",
+    "CountsAccumulator": "qiskit_utils.accumulator",
+    "aparse_result": "qiskit_utils.async_parse",
+    "aparse_counts": "qiskit_utils.async_parse",
+    "parse_as_completed": "qiskit_utils.async_parse",
+    "ResultCache": "qiskit_utils.result_cache",
+    "iter_result_file": "qiskit_utils.stream_results",
+    "marginals_to_record_batch": "qiskit_utils.arrow_export",
+    "counts_to_record_batch": "qiskit_utils.arrow_export",
+    "ParquetExporter": "qiskit_utils.arrow_export",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        return _import_submodule(name)
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def _import_submodule(name: str) -> ModuleType:
+    """
+    submodules (e.g. qiskit_utils.insert) are accessible as attributes of the package without importing them first
+    :param name: name of the submodule
+    :return: the submodule
+    """
+    if name.startswith("__"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name = f"{__name__}.{name}"
+    try:
+        return import_module(module_name)
+    except ModuleNotFoundError as error:
+        if error.name != module_name:
+            raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+class _LazyModule(ModuleType):
+    """
+    importing a submodule sets it as an attribute of the package, for submodules named the same as the function
+    they define (e.g. parse_result) the function is set instead so the public name keeps referring to the function
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if isinstance(value, ModuleType) and _LAZY_ATTRIBUTES.get(name) == value.__name__:
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _LazyModule
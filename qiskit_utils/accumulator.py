@@ -0,0 +1,104 @@
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Measure, Qubit
+from qiskit.result import Result
+
+from qiskit_utils.measurement_plan import MeasurementPlan, get_plan
+from qiskit_utils.raw_counts import get_raw_counts
+
+
+class CountsAccumulator:
+    """
+    accumulates counts of many results of the same circuit (e.g. results of many jobs) into per-qubit marginals
+    (as returned by parse_result) and qubit-ordered counts (as returned by parse_counts), totals are updated
+    in place so every update costs only as much as parsing the new result
+    """
+
+    def __init__(self, circuit: QuantumCircuit, measurement_names: Set[str]={Measure().name},
+                 measurement_plan: Optional[MeasurementPlan] = None):
+        """
+        :param circuit: circuit for which the results are run
+        :param measurement_names: names of instructions which are treated as measurements
+        :param measurement_plan: precompiled plan of the circuit, if not provided it's taken from
+        MeasurementPlan.from_circuit
+        """
+        self.circuit = circuit
+        self.plan = get_plan(circuit, measurement_names, measurement_plan)
+        self.shots = 0
+        self._counts: Dict[str, int] = {}
+        self._ones = [0] * self.plan.num_qubits
+        self._memory_slots: Optional[int] = None
+        self._shifts: List[Tuple[int, int]] = []
+        self._parsed_states: Dict[int, Tuple[str, List[int]]] = {}
+
+    def update(self, qiskit_result: Result, experiment: Optional[int] = None) -> "CountsAccumulator":
+        """
+        add counts of the result to the totals
+        :param qiskit_result: result returned by backend.run(circuit)
+        :param experiment: index of the experiment, can be omitted if result contains only one experiment
+        :return: the accumulator
+        """
+        counts, memory_slots = get_raw_counts(qiskit_result, experiment, self.plan.num_clbits)
+        if memory_slots != self._memory_slots:
+            self._memory_slots = memory_slots
+            self._shifts = self.plan.get_bit_shifts(memory_slots)
+            self._parsed_states = {}
+
+        for state, count in counts.items():
+            parsed_state = self._parsed_states.get(state)
+            if parsed_state is None:
+                parsed_state = self._parse_state(state)
+                self._parsed_states[state] = parsed_state
+            key, measured_ones = parsed_state
+
+            self._counts[key] = self._counts.get(key, 0) + count
+            for qubit_index in measured_ones:
+                self._ones[qubit_index] += count
+            self.shots += count
+        return self
+
+    def update_many(self, qiskit_results: Iterable[Result]) -> "CountsAccumulator":
+        """
+        add counts of every result to the totals, results are consumed one at a time so it can be a generator
+        :param qiskit_results: results returned by backend.run(circuit)
+        :return: the accumulator
+        """
+        for qiskit_result in qiskit_results:
+            self.update(qiskit_result)
+        return self
+
+    def counts(self) -> Dict[str, int]:
+        """
+        :return: snapshot of accumulated counts in the same format as parse_counts returns
+        """
+        return dict(self._counts)
+
+    def marginals(self, indexed_results: bool = True) -> Dict[Union[Qubit, int], Dict[str, int]]:
+        """
+        :param indexed_results: if true keys for dictionary are indices if false it's Qubit objects
+        :return: snapshot of accumulated per-qubit results in the same format as parse_result returns
+        """
+        if not self.shots:
+            return {}
+        return {
+            qubit_index if indexed_results else self.circuit.qubits[qubit_index]: {
+                '0': self.shots - self._ones[qubit_index], '1': self._ones[qubit_index]
+            }
+            for qubit_index, _ in self.plan.measurements
+        }
+
+    def _parse_state(self, state: int) -> Tuple[str, List[int]]:
+        """
+        :param state: state as stored by the backend (see raw_counts.get_raw_counts)
+        :return: tuple of the state in parse_counts format and indices of qubits measured as 1
+        """
+        new_state = ['-'] * self.plan.num_qubits
+        measured_ones = []
+        for qubit_index, shift in self._shifts:
+            if state >> shift & 1:
+                new_state[qubit_index] = '1'
+                measured_ones.append(qubit_index)
+            else:
+                new_state[qubit_index] = '0'
+        return ''.join(new_state), measured_ones
@@ -0,0 +1,207 @@
+"""
+export of parsed results into Arrow record batches and Parquet files, requires pyarrow
+(pip install qiskit_utils[arrow]). columns are built as numpy arrays and wrapped by Arrow without copying,
+record batches can be handed to pandas (batch.to_pandas()) or Polars (polars.from_arrow(batch)).
+count columns are int64, or float64 for counts which aren't integers (e.g. mitigated counts)
+"""
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+
+def marginals_to_record_batch(
+        parsed_results: Sequence[Dict[int, Dict[str, Union[int, float]]]], experiments: Optional[Sequence[int]] = None,
+        float_counts: Optional[bool] = None) -> Any:
+    """
+    convert per-qubit results of many experiments (as returned by parse_result or parse_results_batch with indexed
+    results, or by mitigate_marginals) into a record batch with columns experiment, qubit, count_0 and count_1
+    (one row per measured qubit)
+    :param parsed_results: parsed results of experiments
+    :param experiments: identifiers of experiments, if None i-th experiment is identified by i
+    :param float_counts: if true count columns are float64, if false they are int64 and ValueError is raised for
+    counts which aren't integers, if None the type is chosen from the counts
+    :return: pyarrow.RecordBatch
+    """
+    pa = _import_pyarrow()
+
+    experiments = _get_experiments(parsed_results, experiments)
+    num_rows = sum(len(parsed) for parsed in parsed_results)
+    experiment_column = np.empty(num_rows, dtype=np.int64)
+    qubit_column = np.empty(num_rows, dtype=np.int32)
+
+    row = 0
+    for experiment, parsed in zip(experiments, parsed_results):
+        next_row = row + len(parsed)
+        experiment_column[row:next_row] = experiment
+        qubit_column[row:next_row] = list(parsed.keys())
+        row = next_row
+    zeros = [qubit_counts['0'] for parsed in parsed_results for qubit_counts in parsed.values()]
+    ones = [qubit_counts['1'] for parsed in parsed_results for qubit_counts in parsed.values()]
+    (zeros_column, ones_column), float_counts = _count_columns([zeros, ones], float_counts)
+
+    return pa.RecordBatch.from_arrays(
+        [pa.array(experiment_column), pa.array(qubit_column), pa.array(zeros_column), pa.array(ones_column)],
+        schema=marginals_schema(float_counts),
+    )
+
+
+def counts_to_record_batch(
+        parsed_counts: Sequence[Dict[str, Union[int, float]]], experiments: Optional[Sequence[int]] = None,
+        float_counts: Optional[bool] = None) -> Any:
+    """
+    convert qubit-ordered counts of many experiments (as returned by parse_counts or parse_counts_batch, or mitigated
+    counts) into a record batch with columns experiment, state and count (one row per measured state)
+    :param parsed_counts: parsed counts of experiments
+    :param experiments: identifiers of experiments, if None i-th experiment is identified by i
+    :param float_counts: if true the count column is float64, if false it's int64 and ValueError is raised for
+    counts which aren't integers, if None the type is chosen from the counts
+    :return: pyarrow.RecordBatch
+    """
+    pa = _import_pyarrow()
+
+    experiments = _get_experiments(parsed_counts, experiments)
+    lengths = np.fromiter((len(counts) for counts in parsed_counts), dtype=np.int64, count=len(parsed_counts))
+    experiment_column = np.repeat(np.asarray(experiments, dtype=np.int64), lengths)
+    states = [state for counts in parsed_counts for state in counts]
+    counts = [count for experiment_counts in parsed_counts for count in experiment_counts.values()]
+    (count_column,), float_counts = _count_columns([counts], float_counts)
+
+    return pa.RecordBatch.from_arrays(
+        [pa.array(experiment_column), pa.array(states, type=pa.string()), pa.array(count_column)],
+        schema=counts_schema(float_counts),
+    )
+
+
+def marginals_schema(float_counts: bool = False) -> Any:
+    """
+    :param float_counts: if true count columns are float64 instead of int64
+    :return: pyarrow.Schema of record batches returned by marginals_to_record_batch
+    """
+    pa = _import_pyarrow()
+    count_type = pa.float64() if float_counts else pa.int64()
+    return pa.schema([
+        ("experiment", pa.int64()), ("qubit", pa.int32()), ("count_0", count_type), ("count_1", count_type),
+    ])
+
+
+def counts_schema(float_counts: bool = False) -> Any:
+    """
+    :param float_counts: if true the count column is float64 instead of int64
+    :return: pyarrow.Schema of record batches returned by counts_to_record_batch
+    """
+    pa = _import_pyarrow()
+    count_type = pa.float64() if float_counts else pa.int64()
+    return pa.schema([("experiment", pa.int64()), ("state", pa.string()), ("count", count_type)])
+
+
+class ParquetExporter:
+    """
+    writes batches of parsed results into Parquet files, files are kept open and every written batch is appended
+    as a new row group so results can be exported as they are parsed. batches are appended only within one exporter,
+    Parquet files can't be extended once closed so an existing file is never appended to (see overwrite)
+    """
+
+    def __init__(self, marginals_path: Optional[Union[str, os.PathLike]] = None,
+                 counts_path: Optional[Union[str, os.PathLike]] = None, compression: str = "zstd",
+                 float_counts: bool = False, overwrite: bool = False):
+        """
+        :param marginals_path: path of Parquet file with marginals (see marginals_to_record_batch),
+        if None marginals can't be written
+        :param counts_path: path of Parquet file with counts (see counts_to_record_batch), if None counts can't be written
+        :param compression: compression codec of the files
+        :param float_counts: if true count columns are float64 (e.g. for mitigated counts), otherwise they are int64
+        and writing counts which aren't integers raises ValueError
+        :param overwrite: if true existing files are replaced, otherwise FileExistsError is raised if any of them exists
+        """
+        _import_pyarrow()
+        import pyarrow.parquet as pq
+
+        paths = [path for path in (marginals_path, counts_path) if path is not None]
+        if not overwrite:
+            for path in paths:
+                if os.path.exists(path):
+                    raise FileExistsError(f"{os.fspath(path)} already exists, pass overwrite=True to replace it")
+
+        self._float_counts = float_counts
+        self._marginals_writer = None
+        self._counts_writer = None
+        if marginals_path is not None:
+            self._marginals_writer = pq.ParquetWriter(
+                marginals_path, marginals_schema(float_counts), compression=compression)
+        if counts_path is not None:
+            self._counts_writer = pq.ParquetWriter(counts_path, counts_schema(float_counts), compression=compression)
+
+    def write_marginals(
+            self, parsed_results: Sequence[Dict[int, Dict[str, int]]],
+            experiments: Optional[Sequence[int]] = None) -> None:
+        """
+        append marginals of experiments to the marginals file
+        :param parsed_results: parsed results of experiments (see marginals_to_record_batch)
+        :param experiments: identifiers of experiments, if None i-th experiment is identified by i
+        """
+        if self._marginals_writer is None:
+            raise ValueError("exporter was created without path of marginals file")
+        self._marginals_writer.write_batch(marginals_to_record_batch(parsed_results, experiments, self._float_counts))
+
+    def write_counts(self, parsed_counts: Sequence[Dict[str, int]], experiments: Optional[Sequence[int]] = None) -> None:
+        """
+        append counts of experiments to the counts file
+        :param parsed_counts: parsed counts of experiments (see counts_to_record_batch)
+        :param experiments: identifiers of experiments, if None i-th experiment is identified by i
+        """
+        if self._counts_writer is None:
+            raise ValueError("exporter was created without path of counts file")
+        self._counts_writer.write_batch(counts_to_record_batch(parsed_counts, experiments, self._float_counts))
+
+    def close(self) -> None:
+        for writer in (self._marginals_writer, self._counts_writer):
+            if writer is not None:
+                writer.close()
+
+    def __enter__(self) -> "ParquetExporter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _count_columns(
+        columns: Sequence[List[Union[int, float]]], float_counts: Optional[bool]) -> Tuple[List[np.ndarray], bool]:
+    """
+    :param columns: lists of counts
+    :param float_counts: if true columns are float64, if false int64, if None float64 only if any count is a float
+    :return: tuple of count columns and whether they are float64
+    """
+    arrays = [np.asarray(column) if column else np.zeros(0, dtype=np.int64) for column in columns]
+    has_floats = any(array.dtype.kind == 'f' for array in arrays)
+    if float_counts is None:
+        float_counts = has_floats
+    elif has_floats and not float_counts:
+        raise ValueError("counts aren't integers (e.g. mitigated counts), export them with float_counts=True")
+    dtype = np.float64 if float_counts else np.int64
+    return [array.astype(dtype, copy=False) for array in arrays], float_counts
+
+
+def _get_experiments(parsed: Sequence[Any], experiments: Optional[Sequence[int]]) -> Sequence[int]:
+    """
+    :param parsed: parsed experiments
+    :param experiments: identifiers of experiments or None
+    :return: identifiers of experiments
+    """
+    if experiments is None:
+        return range(len(parsed))
+    if len(experiments) != len(parsed):
+        raise ValueError("number of experiment identifiers doesn't match number of parsed experiments")
+    return experiments
+
+
+def _import_pyarrow() -> Any:
+    """
+    :return: pyarrow module
+    """
+    try:
+        import pyarrow
+    except ImportError as error:
+        raise ImportError("arrow export requires pyarrow, install it with pip install qiskit_utils[arrow]") from error
+    return pyarrow
@@ -0,0 +1,111 @@
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Sequence, Set, Tuple, Union
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Measure, Qubit
+from qiskit.providers import JobV1
+from qiskit.result import Result
+
+from qiskit_utils.parse_counts import parse_counts
+from qiskit_utils.parse_result import parse_result
+
+JobOrResult = Union[JobV1, Result]
+
+
+async def aparse_result(
+        job_or_result: JobOrResult, circuit: QuantumCircuit, measurement_names: Set[str]={Measure().name},
+        executor: Optional[Executor] = None, **kwargs: Any) -> Dict[Union[Qubit, int], Dict[str, int]]:
+    """
+    asynchronous version of parse_result, waiting for the job and parsing are done in the executor
+    so the event loop is not blocked
+    :param job_or_result: job returned by backend.run(circuit) or its result
+    :param circuit: circuit for which the job was run
+    :param executor: executor where the job is awaited and the result is parsed, if None default executor of the loop
+    is used
+    :param kwargs: other arguments of parse_result (e.g. indexed_results, raw_counts)
+    :return: dictionary containing parsed results (see parse_result)
+    """
+    return await _parse_in_executor(parse_result, job_or_result, circuit, measurement_names, executor, kwargs)
+
+
+async def aparse_counts(
+        job_or_result: JobOrResult, circuit: QuantumCircuit, measurement_names: Set[str]={Measure().name},
+        executor: Optional[Executor] = None, **kwargs: Any) -> Dict[str, int]:
+    """
+    asynchronous version of parse_counts, waiting for the job and parsing are done in the executor
+    so the event loop is not blocked
+    :param job_or_result: job returned by backend.run(circuit) or its result
+    :param circuit: circuit for which the job was run
+    :param executor: executor where the job is awaited and the result is parsed, if None default executor of the loop
+    is used
+    :param kwargs: other arguments of parse_counts (e.g. raw_counts)
+    :return: dictionary containing parsed counts (see parse_counts)
+    """
+    return await _parse_in_executor(parse_counts, job_or_result, circuit, measurement_names, executor, kwargs)
+
+
+async def parse_as_completed(
+        jobs_or_results: Sequence[JobOrResult], circuits: Sequence[QuantumCircuit],
+        measurement_names: Set[str]={Measure().name}, counts: bool = True, executor: Optional[Executor] = None,
+        **kwargs: Any) -> AsyncIterator[Tuple[int, Any]]:
+    """
+    parse many jobs at once and yield their parsed results in the order the jobs complete
+    :param jobs_or_results: jobs returned by backend.run(circuit) or their results
+    :param circuits: circuits for which the jobs were run (i-th circuit corresponds to i-th job)
+    :param counts: if true jobs are parsed with parse_counts, otherwise with parse_result
+    :param executor: executor where the jobs are awaited and the results are parsed, if None default executor
+    of the loop is used
+    :param kwargs: other arguments of the parsing function
+    :return: async iterator of tuples (index of the job, parsed result)
+    """
+    if len(jobs_or_results) != len(circuits):
+        raise ValueError("number of circuits doesn't match number of jobs")
+
+    parser = parse_counts if counts else parse_result
+
+    async def parse_indexed(index: int) -> Tuple[int, Any]:
+        parsed = await _parse_in_executor(
+            parser, jobs_or_results[index], circuits[index], measurement_names, executor, kwargs)
+        return index, parsed
+
+    tasks = [asyncio.ensure_future(parse_indexed(index)) for index in range(len(circuits))]
+    try:
+        for task in asyncio.as_completed(tasks):
+            yield await task
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def _parse_in_executor(
+        parser: Callable[..., Any], job_or_result: JobOrResult, circuit: QuantumCircuit,
+        measurement_names: Set[str], executor: Optional[Executor], kwargs: Dict[str, Any]) -> Any:
+    """
+    :param parser: parsing function (parse_result or parse_counts)
+    :param job_or_result: job returned by backend.run(circuit) or its result
+    :param circuit: circuit for which the job was run
+    :param measurement_names: names of instructions which are treated as measurements
+    :param executor: executor where the job is awaited and the result is parsed
+    :param kwargs: other arguments of the parsing function
+    :return: value returned by the parsing function
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor, partial(_wait_and_parse, parser, job_or_result, circuit, measurement_names, kwargs))
+
+
+def _wait_and_parse(
+        parser: Callable[..., Any], job_or_result: JobOrResult, circuit: QuantumCircuit,
+        measurement_names: Set[str], kwargs: Dict[str, Any]) -> Any:
+    """
+    :param parser: parsing function (parse_result or parse_counts)
+    :param job_or_result: job returned by backend.run(circuit) or its result
+    :param circuit: circuit for which the job was run
+    :param measurement_names: names of instructions which are treated as measurements
+    :param kwargs: other arguments of the parsing function
+    :return: value returned by the parsing function
+    """
+    qiskit_result = job_or_result if isinstance(job_or_result, Result) else job_or_result.result()
+    return parser(qiskit_result, circuit, measurement_names, **kwargs)
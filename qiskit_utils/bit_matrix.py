@@ -0,0 +1,102 @@
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+from qiskit.result import Result
+
+from qiskit_utils.measurement_plan import MeasurementPlan
+from qiskit_utils.raw_counts import get_raw_counts
+
+# value of hexadecimal digit indexed by its ascii code
+_HEX_DIGIT_VALUES = np.zeros(256, dtype=np.uint8)
+for _digit in "0123456789abcdef":
+    _HEX_DIGIT_VALUES[ord(_digit)] = _HEX_DIGIT_VALUES[ord(_digit.upper())] = int(_digit, 16)
+
+
+def result_to_bit_matrix(
+        qiskit_result: Result, plan: MeasurementPlan, raw_counts: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    convert counts of the result into a matrix of bits and a vector of counts (see counts_to_bit_matrix),
+    every measurement index of the plan addresses a column of the matrix (even if the result has no counts)
+    :param qiskit_result: result returned by backend.run(circuit)
+    :param plan: measurement plan of the circuit for which the result was run
+    :param raw_counts: if true counts are read as stored by the backend instead of using results.get_counts()
+    :return: tuple of uint8 matrix of shape (number of states, number of bits) and int64 vector of counts
+    """
+    if raw_counts:
+        counts, memory_slots = get_raw_counts(qiskit_result, num_clbits=plan.num_clbits)
+        return integer_counts_to_bit_matrix(counts, memory_slots)
+
+    counts = qiskit_result.get_counts()
+    if not counts:
+        return np.zeros((0, plan.num_clbits), dtype=np.uint8), np.zeros(0, dtype=np.int64)
+    return counts_to_bit_matrix(counts)
+
+
+def counts_to_bit_matrix(counts: Dict[str, int]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    convert counts (as returned by results.get_counts()) into a matrix of bits and a vector of counts,
+    row i of the matrix is the state of i-th key of counts (with spaces removed, so column j of the matrix
+    addresses the same bit as index j of the state) and i-th element of the vector is its count
+    :param counts: dictionary mapping states to number of times they were measured
+    :return: tuple of uint8 matrix of shape (number of states, number of bits) and int64 vector of counts
+    """
+    bit_matrix = states_to_bit_matrix(list(counts.keys()))
+    weights = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+    return bit_matrix, weights
+
+
+def states_to_bit_matrix(states: Sequence[str]) -> np.ndarray:
+    """
+    convert bitstrings (as returned by results.get_counts() or results.get_memory()) into a matrix of bits,
+    row i of the matrix is i-th state with spaces removed
+    :param states: bitstrings of the same length
+    :return: uint8 matrix of shape (number of states, number of bits)
+    """
+    joined_states = "".join(states).replace(" ", "").encode("ascii")
+    return np.frombuffer(joined_states, dtype=np.uint8).reshape(len(states), -1) - ord('0')
+
+
+def integers_to_bit_matrix(states: Sequence[int], width: int) -> np.ndarray:
+    """
+    convert states given as integers into a matrix of bits, column j of the matrix is bit (width - j - 1)
+    of the state so columns address the same bits as indices of states returned by results.get_counts()
+    (with spaces removed)
+    :param states: states as integers
+    :param width: number of bits of each state (number of memory slots)
+    :return: uint8 matrix of shape (number of states, width)
+    """
+    num_bytes = (width + 7) // 8
+    joined_states = b"".join(state.to_bytes(num_bytes, "big") for state in states)
+    bytes_matrix = np.frombuffer(joined_states, dtype=np.uint8).reshape(len(states), num_bytes)
+    return np.unpackbits(bytes_matrix, axis=1)[:, num_bytes * 8 - width:]
+
+
+def stored_states_to_bit_matrix(states: Sequence[str], width: int) -> np.ndarray:
+    """
+    convert states as stored by the backend (see raw_counts.get_stored_memory) into a matrix of bits
+    (see integers_to_bit_matrix), hexadecimal states are decoded with numpy without converting them to integers
+    :param states: states as stored by the backend, either all hexadecimal ("0x5") or all bitstrings ("1 01")
+    :param width: number of bits of each state (number of memory slots)
+    :return: uint8 matrix of shape (number of states, width)
+    """
+    if not states or not states[0].startswith("0x"):
+        return states_to_bit_matrix(states) if states else np.zeros((0, width), dtype=np.uint8)
+
+    num_digits = (width + 3) // 4
+    joined_states = "".join(state[2:].zfill(num_digits) for state in states).encode("ascii")
+    digits = _HEX_DIGIT_VALUES[np.frombuffer(joined_states, dtype=np.uint8)].reshape(len(states), num_digits)
+    bit_matrix = np.unpackbits(digits[:, :, np.newaxis], axis=2)[:, :, 4:].reshape(len(states), num_digits * 4)
+    return bit_matrix[:, num_digits * 4 - width:]
+
+
+def integer_counts_to_bit_matrix(counts: Dict[int, int], width: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    convert counts with states given as integers (see raw_counts.get_raw_counts) into a matrix of bits
+    (see integers_to_bit_matrix) and a vector of counts
+    :param counts: dictionary mapping states to number of times they were measured
+    :param width: number of bits of each state (number of memory slots)
+    :return: tuple of uint8 matrix of shape (number of states, width) and int64 vector of counts
+    """
+    bit_matrix = integers_to_bit_matrix(list(counts.keys()), width)
+    weights = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+    return bit_matrix, weights
@@ -0,0 +1,208 @@
+"""
+command line interface, installed as qiskit-utils console script
+    qiskit-utils parse results/ --circuits circuits.qpy --output parsed.npz --workers 8
+"""
+import argparse
+import glob
+import os
+import pickle
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+import numpy as np
+from qiskit import QuantumCircuit, qpy
+from qiskit.circuit import Measure
+
+from qiskit_utils.measurement_plan import MeasurementPlan, get_plan
+from qiskit_utils.parse_counts import parse_integer_counts_dict
+from qiskit_utils.parse_result import parse_result_integer_counts
+from qiskit_utils.raw_counts import get_raw_counts_from_dict
+from qiskit_utils.stream_results import check_experiment_dict, iter_experiment_dicts
+
+_worker_state: Dict[str, Any] = {}
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="qiskit-utils", description="utility commands of qiskit_utils")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    parse_parser = subparsers.add_parser(
+        "parse", help="parse result json files (Result.to_dict()) into qubit marginals and qubit-ordered counts")
+    parse_parser.add_argument("inputs", nargs="+", help="result files, directories (all .json files) or glob patterns")
+    parse_parser.add_argument(
+        "--circuits", required=True,
+        help="qpy (.qpy) or pickle file with circuit or circuits, one circuit is used for all experiments, "
+             "otherwise i-th circuit is used for i-th experiment of every file")
+    parse_parser.add_argument("--output", required=True, help="path of the .npz file with parsed results")
+    parse_parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="number of worker processes")
+    parse_parser.add_argument(
+        "--measurement-name", action="append", dest="measurement_names",
+        help="name of instruction treated as measurement (can be repeated), default: measure")
+
+    args = parser.parse_args(argv)
+    paths = find_result_files(args.inputs)
+    if not paths:
+        parser.error("no result files found")
+    if args.workers < 1:
+        parser.error("number of workers must be at least 1")
+
+    measurement_names = set(args.measurement_names or [Measure().name])
+    start = time.perf_counter()
+    columns = parse_files(paths, args.circuits, measurement_names, args.workers)
+    np.savez_compressed(args.output, **columns)
+    duration = time.perf_counter() - start
+
+    print(format_throughput(columns, duration), file=sys.stderr)
+    return 0
+
+
+def find_result_files(inputs: Sequence[str]) -> List[str]:
+    """
+    :param inputs: paths of files, directories or glob patterns
+    :return: paths of result files (files of a directory and of a pattern are sorted)
+    """
+    paths = []
+    for path in inputs:
+        if os.path.isdir(path):
+            paths.extend(sorted(glob.glob(os.path.join(path, "*.json"))))
+        elif glob.has_magic(path):
+            paths.extend(sorted(glob.glob(path, recursive=True)))
+        else:
+            paths.append(path)
+    return paths
+
+
+def load_circuits(path: str) -> List[QuantumCircuit]:
+    """
+    :param path: path of qpy file (with .qpy extension) or pickle file with circuit or sequence of circuits
+    :return: list of circuits
+    """
+    with open(path, "rb") as circuits_file:
+        if path.endswith(".qpy"):
+            circuits = qpy.load(circuits_file)
+        else:
+            circuits = pickle.load(circuits_file)
+    if isinstance(circuits, QuantumCircuit):
+        return [circuits]
+    return list(circuits)
+
+
+def parse_files(
+        paths: Sequence[str], circuits_path: str, measurement_names: Set[str],
+        workers: int) -> Dict[str, np.ndarray]:
+    """
+    parse result files in a process pool (every worker loads the circuits once) and merge them into columns:
+    files, experiment_file (index into files), experiment_index (index of the experiment in its file), shots,
+    marginals (experiments x qubits x 2 counts of states 0 and 1), measured (experiments x qubits),
+    counts_offsets (counts of experiment i are at counts_offsets[i]:counts_offsets[i + 1]), counts_states
+    (qubit-ordered states as in parse_counts) and counts_values
+    :param paths: paths of result files
+    :param circuits_path: path of circuits (see load_circuits)
+    :param measurement_names: names of instructions which are treated as measurements
+    :param workers: number of worker processes, if 1 files are parsed in this process
+    :return: dictionary of columns
+    """
+    if workers == 1:
+        _init_worker(circuits_path, measurement_names)
+        file_columns = [_parse_file(path) for path in paths]
+    else:
+        with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                 initargs=(circuits_path, measurement_names)) as executor:
+            file_columns = list(executor.map(_parse_file, paths, chunksize=max(1, len(paths) // (4 * workers))))
+
+    experiment_files = [
+        np.full(len(columns["experiment_index"]), file_index, dtype=np.int32)
+        for file_index, columns in enumerate(file_columns)
+    ]
+    counts_lengths = np.concatenate([columns["counts_lengths"] for columns in file_columns])
+    return {
+        "files": np.array(paths),
+        "experiment_file": np.concatenate(experiment_files),
+        "experiment_index": np.concatenate([columns["experiment_index"] for columns in file_columns]),
+        "shots": np.concatenate([columns["shots"] for columns in file_columns]),
+        "marginals": np.concatenate([columns["marginals"] for columns in file_columns]),
+        "measured": np.concatenate([columns["measured"] for columns in file_columns]),
+        "counts_offsets": np.concatenate([[0], np.cumsum(counts_lengths)]).astype(np.int64),
+        "counts_states": np.concatenate([columns["counts_states"] for columns in file_columns]),
+        "counts_values": np.concatenate([columns["counts_values"] for columns in file_columns]),
+    }
+
+
+def format_throughput(columns: Dict[str, np.ndarray], duration: float) -> str:
+    """
+    :param columns: columns returned by parse_files
+    :param duration: time of parsing in seconds
+    :return: human readable throughput report
+    """
+    num_experiments = len(columns["experiment_index"])
+    shots = int(columns["shots"].sum())
+    num_files = len(columns["files"])
+    seconds = max(duration, 1e-9)
+    return (f"parsed {num_experiments} experiments ({shots} shots, {len(columns['counts_values'])} outcomes) "
+            f"from {num_files} files in {duration:.3f}s: {num_files / seconds:.1f} files/s, "
+            f"{num_experiments / seconds:.1f} experiments/s, {shots / seconds:.0f} shots/s")
+
+
+def _init_worker(circuits_path: str, measurement_names: Set[str]) -> None:
+    """
+    load circuits and compile their plans once per worker process
+    :param circuits_path: path of circuits (see load_circuits)
+    :param measurement_names: names of instructions which are treated as measurements
+    """
+    circuits = load_circuits(circuits_path)
+    plans = [get_plan(circuit, measurement_names) for circuit in circuits]
+    _worker_state["plans"] = plans
+    _worker_state["num_qubits"] = max(plan.num_qubits for plan in plans)
+
+
+def _parse_file(path: str) -> Dict[str, np.ndarray]:
+    """
+    :param path: path of result file
+    :return: columns of experiments of the file
+    """
+    plans: List[MeasurementPlan] = _worker_state["plans"]
+    num_qubits: int = _worker_state["num_qubits"]
+
+    experiment_indices, shots, marginals, measured = [], [], [], []
+    counts_lengths, counts_states, counts_values = [], [], []
+    with open(path) as result_file:
+        for index, experiment in enumerate(iter_experiment_dicts(result_file)):
+            if len(plans) == 1:
+                plan = plans[0]
+            elif index < len(plans):
+                plan = plans[index]
+            else:
+                raise ValueError(f"{path} contains more experiments than there are circuits")
+            check_experiment_dict(experiment, plan)
+            raw_counts, memory_slots = get_raw_counts_from_dict(experiment, plan.num_clbits)
+
+            experiment_marginals = np.zeros((num_qubits, 2), dtype=np.int64)
+            experiment_measured = np.zeros(num_qubits, dtype=bool)
+            for qubit_index, qubit_counts in parse_result_integer_counts(raw_counts, plan, memory_slots).items():
+                experiment_marginals[qubit_index] = (qubit_counts['0'], qubit_counts['1'])
+                experiment_measured[qubit_index] = True
+
+            parsed_counts = parse_integer_counts_dict(raw_counts, plan, memory_slots)
+            experiment_indices.append(index)
+            shots.append(sum(raw_counts.values()))
+            marginals.append(experiment_marginals)
+            measured.append(experiment_measured)
+            counts_lengths.append(len(parsed_counts))
+            counts_states.extend(parsed_counts.keys())
+            counts_values.extend(parsed_counts.values())
+
+    return {
+        "experiment_index": np.array(experiment_indices, dtype=np.int32),
+        "shots": np.array(shots, dtype=np.int64),
+        "marginals": np.array(marginals, dtype=np.int64).reshape(-1, num_qubits, 2),
+        "measured": np.array(measured, dtype=bool).reshape(-1, num_qubits),
+        "counts_lengths": np.array(counts_lengths, dtype=np.int64),
+        "counts_states": np.array(counts_states, dtype=f"S{max(num_qubits, 1)}"),
+        "counts_values": np.array(counts_values, dtype=np.int64),
+    }
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,119 @@
 from collections.abc import Sequence
-from typing import Union
+from contextlib import contextmanager
+from typing import Union, Tuple, Iterator, Optional, Callable, List
 
 from qiskit import QuantumCircuit
-from qiskit.circuit import Instruction, Qubit, Clbit
+from qiskit.circuit import Instruction, Qubit, Clbit, CircuitInstruction
 
-from qiskit_utils.insert import insert_instruction
+from qiskit_utils import instrumentation
+from qiskit_utils.gap_buffer import GapBuffer
+from qiskit_utils.insert import (
+    HAS_LIST_DATA, insert_instruction, insert_instructions, prepare_instruction, normalize_index,
+)
+from qiskit_utils.instruction_index import InstructionIndex
+from qiskit_utils.shared_sequence import SharedSequence
 
 
 class QuantumCircuitEnhanced(QuantumCircuit):
+    def __init__(self, *args, **kwargs):
+        self._data_storage = []
+        self._pending_data = None
+        self._editing = False
+        self._instruction_index = None
+        super().__init__(*args, **kwargs)
+
+    @property
+    def _data(self) -> list:
+        """
+        instructions of the circuit, instructions inserted in editing mode (or into a circuit sharing instructions
+        of another circuit) are materialized on first access (so whenever the circuit is read, copied or transpiled
+        it sees all inserted instructions)
+        """
+        if self._pending_data is not None:
+            self._materialize_data()
+        return self._data_storage
+
+    @_data.setter
+    def _data(self, data: list) -> None:
+        self._pending_data = None
+        self._instruction_index = None
+        self._data_storage = data
+
+    def __len__(self) -> int:
+        return self._num_instructions()
+
+    @classmethod
+    def from_shared(cls, circuit: QuantumCircuit) -> "QuantumCircuitEnhanced":
+        """
+        create a copy of the circuit which shares its instructions instead of copying them, the copy stores only
+        instructions inserted into it (as in editing mode) until it's read, modified, copied or transpiled.
+        parameterized operations are copied (as QuantumCircuit.copy does) so parameters of the copy can be assigned
+        independently, other operations are shared with the circuit as if they were appended to both circuits.
+        the copy keeps a snapshot (tuple) of instructions of the circuit, so later changes of the circuit don't
+        affect it
+        :param circuit: circuit whose instructions are shared
+        :return: copy of the circuit
+        """
+        instructions, parameterized_positions = _get_shared_instructions(circuit)
+        shared_circuit = circuit.copy_empty_like()
+        if not isinstance(shared_circuit, QuantumCircuitEnhanced):
+            # instructions of QuantumCircuit are stored in an attribute, they are replaced by the _data property
+            shared_circuit.__dict__.pop("_data", None)
+            shared_circuit.__class__ = cls
+            shared_circuit._editing = False
+            shared_circuit._data = []
+
+        operation_copies = {}
+        replaced = {}
+        for position in parameterized_positions:
+            operation = instructions[position].operation
+            if id(operation) not in operation_copies:
+                operation_copies[id(operation)] = operation.copy()
+            replaced[position] = instructions[position].replace(operation=operation_copies[id(operation)])
+            shared_circuit._update_parameter_table(replaced[position])
+        shared_circuit._pending_data = SharedSequence(instructions, replaced)
+        return shared_circuit
+
+    @property
+    def is_editing(self) -> bool:
+        """
+        :return: True if the circuit is in editing mode
+        """
+        return self._editing
+
+    def begin_editing(self) -> None:
+        """
+        switch into editing mode, in which instructions inserted with insert (in place) are stored in a gap buffer
+        so inserting many instructions at nearby positions is amortized O(1) per instruction, inserted instructions
+        are materialized into self.data lazily when the circuit is read, copied or transpiled
+        (with qiskit >= 1.0 instructions are inserted into self.data right away)
+        """
+        self._editing = True
+
+    def end_editing(self) -> None:
+        """
+        materialize all instructions inserted in editing mode and switch editing mode off
+        """
+        self._editing = False
+        if self._pending_data is not None:
+            self._materialize_data()
+
+    @contextmanager
+    def editing(self) -> Iterator["QuantumCircuitEnhanced"]:
+        """
+        context manager which switches the circuit into editing mode for the duration of the with block
+        :return: the circuit itself
+        """
+        self.begin_editing()
+        try:
+            yield self
+        finally:
+            self.end_editing()
+
     def insert(
             self, instruction: Instruction, qubits: Union[Sequence[Qubit, int]],
-            clbits: Union[Sequence[Clbit, int]], index: int, in_place: bool = True) -> QuantumCircuit:
+            clbits: Union[Sequence[Clbit, int]], index: int, in_place: bool = True,
+            share_data: bool = False) -> QuantumCircuit:
         """
         insert instruction at a specified place (in lists of instructions from circuit.data)
         :param instruction: instruction to be inserted
@@ -18,6 +121,202 @@ class QuantumCircuitEnhanced(QuantumCircuit):
         :param clbits: clbits used for the instruction (can be indexes or objects)
         :param index: index where the instruction will be placed in self.data
         :param in_place: creates new circuit if False and returns it, otherwise updates self and returns it
+        :param share_data: if True (and in_place is False) the new circuit shares instructions of self
+        (see from_shared)
         :return: circuit with instruction inserted
         """
-        return insert_instruction(self, instruction, qubits, clbits, index, in_place=in_place)
+        if not in_place:
+            return insert_instruction(
+                self, instruction, qubits, clbits, index, in_place=in_place, share_data=share_data)
+
+        with instrumentation.span("QuantumCircuitEnhanced.insert") as span:
+            position = normalize_index(index, self._num_instructions())
+            if not self._editing or not HAS_LIST_DATA:
+                insert_instruction(self, instruction, qubits, clbits, index)
+            else:
+                span.count("buffered_inserts")
+                with span.phase("validate"):
+                    instruction_tuple = prepare_instruction(
+                        self, instruction, qubits, clbits, index, self._num_instructions())
+                with span.phase("insert"):
+                    self._insert_pending(index, CircuitInstruction(*instruction_tuple))
+
+            with span.phase("index"):
+                self._update_instruction_index(position)
+        return self
+
+    def insert_many(
+            self,
+            instructions: Sequence[Tuple[Instruction, Sequence[Union[Qubit, int]], Sequence[Union[Clbit, int]], int]],
+            in_place: bool = True) -> QuantumCircuit:
+        """
+        insert many instructions in a single pass (indices refer to positions in self.data before any insertion)
+        :param instructions: sequence of tuples (instruction, qubits, clbits, index) with arguments as in insert
+        :param in_place: creates new circuit if False and returns it, otherwise updates self and returns it
+        :return: circuit with instructions inserted
+        """
+        return insert_instructions(self, instructions, in_place=in_place)
+
+    def find_positions(self, name: Optional[str] = None, qubit: Optional[Union[Qubit, int]] = None) -> List[int]:
+        """
+        return positions (indices in self.data) of instructions with the given name acting on the given qubit,
+        positions are looked up in an index which is updated incrementally by append and insert (it's built again
+        after insert_many, insert_before and insert_after, other direct modifications of self.data which don't change
+        its length are not detected)
+        :param name: name of the instruction, if None instructions with any name are returned
+        :param qubit: qubit (or its index) the instruction acts on, if None instructions on any qubits are returned
+        :return: sorted list of positions
+        """
+        if isinstance(qubit, int):
+            qubit = self.qubits[qubit]
+        return self._get_instruction_index().find(name, qubit)
+
+    def insert_before(
+            self, instruction: Instruction, qubits: Union[Sequence[Qubit, int]], clbits: Union[Sequence[Clbit, int]],
+            name: Optional[str] = None, qubit: Optional[Union[Qubit, int]] = None,
+            predicate: Optional[Callable[[CircuitInstruction], bool]] = None,
+            occurrence: str = "all") -> QuantumCircuit:
+        """
+        insert instruction before instructions with the given name acting on the given qubit
+        (e.g. insert_before(Barrier(1), (0,), (), name="measure") inserts barrier before every measurement)
+        :param instruction: instruction to be inserted
+        :param qubits: qubits used for the instruction (can be indexes or objects)
+        :param clbits: clbits used for the instruction (can be indexes or objects)
+        :param name: name of instructions to insert before, if None instructions with any name are matched
+        :param qubit: qubit (or its index) of instructions to insert before, if None any qubits are matched
+        :param predicate: additional condition instructions (already matched by name and qubit) must satisfy
+        :param occurrence: "all" to insert before every matched instruction, "first" or "last" to insert only before
+        the first or the last of them
+        :return: circuit with instructions inserted
+        """
+        return self._insert_relative(instruction, qubits, clbits, name, qubit, predicate, occurrence, 0)
+
+    def insert_after(
+            self, instruction: Instruction, qubits: Union[Sequence[Qubit, int]], clbits: Union[Sequence[Clbit, int]],
+            name: Optional[str] = None, qubit: Optional[Union[Qubit, int]] = None,
+            predicate: Optional[Callable[[CircuitInstruction], bool]] = None,
+            occurrence: str = "all") -> QuantumCircuit:
+        """
+        insert instruction after instructions with the given name acting on the given qubit
+        (e.g. insert_after(XGate(), (3,), (), name="cx", qubit=3, occurrence="last") inserts x after the last cx on
+        qubit 3)
+        :param instruction: instruction to be inserted
+        :param qubits: qubits used for the instruction (can be indexes or objects)
+        :param clbits: clbits used for the instruction (can be indexes or objects)
+        :param name: name of instructions to insert after, if None instructions with any name are matched
+        :param qubit: qubit (or its index) of instructions to insert after, if None any qubits are matched
+        :param predicate: additional condition instructions (already matched by name and qubit) must satisfy
+        :param occurrence: "all" to insert after every matched instruction, "first" or "last" to insert only after
+        the first or the last of them
+        :return: circuit with instructions inserted
+        """
+        return self._insert_relative(instruction, qubits, clbits, name, qubit, predicate, occurrence, 1)
+
+    def _append(self, *args, **kwargs):
+        appended = super()._append(*args, **kwargs)
+        self._update_instruction_index(self._num_instructions() - 1)
+        return appended
+
+    def _insert_relative(
+            self, instruction: Instruction, qubits: Union[Sequence[Qubit, int]], clbits: Union[Sequence[Clbit, int]],
+            name: Optional[str], qubit: Optional[Union[Qubit, int]],
+            predicate: Optional[Callable[[CircuitInstruction], bool]], occurrence: str, offset: int) -> QuantumCircuit:
+        """
+        insert instruction at offset from positions of matched instructions, all instructions are inserted
+        in a single pass (see insert_instructions)
+        :param offset: 0 to insert before matched instructions, 1 to insert after them
+        :return: circuit with instructions inserted
+        """
+        if occurrence not in ("all", "first", "last"):
+            raise ValueError("occurrence must be one of 'all', 'first' or 'last'")
+
+        positions = self.find_positions(name, qubit)
+        if predicate is not None:
+            positions = [position for position in positions if predicate(self._get_instruction(position))]
+        if positions and occurrence == "first":
+            positions = positions[:1]
+        elif positions and occurrence == "last":
+            positions = positions[-1:]
+
+        return insert_instructions(self, [(instruction, qubits, clbits, position + offset) for position in positions])
+
+    def _insert_pending(self, index: int, circuit_instruction: CircuitInstruction) -> None:
+        """
+        insert instruction without materializing instructions of the circuit, its parameters are registered right away
+        :param index: index where the instruction will be placed in self.data
+        :param circuit_instruction: validated instruction
+        """
+        self._update_parameter_table(circuit_instruction)
+        if self._pending_data is None:
+            self._pending_data = GapBuffer(self._data_storage)
+        self._pending_data.insert(index, circuit_instruction)
+
+    def _num_instructions(self) -> int:
+        """
+        :return: number of instructions in the circuit (including ones not materialized yet)
+        """
+        if self._pending_data is not None:
+            return len(self._pending_data)
+        return len(self._data_storage)
+
+    def _get_instruction(self, position: int) -> CircuitInstruction:
+        """
+        :param position: position of the instruction
+        :return: instruction at position (without materializing instructions inserted in editing mode)
+        """
+        if self._pending_data is not None:
+            return self._pending_data[position]
+        return self._data_storage[position]
+
+    def _get_instruction_index(self) -> InstructionIndex:
+        """
+        :return: index of instructions, built if it doesn't exist yet or its size doesn't match the circuit
+        """
+        if self._instruction_index is None or self._instruction_index.size != self._num_instructions():
+            data = self._pending_data.to_list() if self._pending_data is not None else self._data_storage
+            self._instruction_index = InstructionIndex(data)
+        return self._instruction_index
+
+    def _update_instruction_index(self, position: int) -> None:
+        """
+        register instruction inserted (or appended) at position in the index (if index was built), index is dropped
+        when it no longer matches the circuit, it's built again when needed
+        :param position: non-negative position where instruction was inserted
+        """
+        if self._instruction_index is None:
+            return
+        if self._instruction_index.size != self._num_instructions() - 1:
+            self._instruction_index = None
+            return
+        self._instruction_index.insert(position, self._get_instruction(position))
+
+    def _materialize_data(self) -> None:
+        """
+        replace the instructions of the circuit with the content of the gap buffer (or shared sequence), parameters
+        of inserted instructions were already registered when they were inserted
+        """
+        data = self._pending_data.to_list()
+        self._pending_data = None
+        self._data_storage = data
+
+
+
+def _get_shared_instructions(circuit: QuantumCircuit) -> Tuple[Tuple[CircuitInstruction, ...], Tuple[int, ...]]:
+    """
+    :param circuit: circuit whose instructions are shared
+    :return: snapshot of instructions of the circuit and positions of instructions with parameterized operations
+    (found through the parameter table of the circuit, so circuits without parameters aren't scanned)
+    """
+    instructions = tuple(circuit._data)
+    parameterized_operations = {
+        id(operation)
+        for parameter in circuit._parameter_table
+        for operation, _ in circuit._parameter_table[parameter]
+    }
+    if not parameterized_operations:
+        return instructions, ()
+    parameterized_positions = tuple(
+        position for position, circuit_instruction in enumerate(instructions)
+        if id(circuit_instruction.operation) in parameterized_operations
+    )
+    return instructions, parameterized_positions
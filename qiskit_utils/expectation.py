@@ -0,0 +1,69 @@
+from typing import Optional, Sequence, Set, Union
+
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit import Measure
+from qiskit.result import Result
+
+from qiskit_utils.bit_matrix import result_to_bit_matrix
+from qiskit_utils.measurement_plan import MeasurementPlan, get_plan
+
+
+def expectation_values(
+        qiskit_result: Result, circuit: QuantumCircuit, observables: Sequence[Union[str, Sequence[int]]],
+        measurement_names: Set[str]={Measure().name}, measurement_plan: Optional[MeasurementPlan] = None,
+        raw_counts: bool = False) -> np.ndarray:
+    """
+    compute expectation values of Z-type observables (tensor products of Z and I), all observables are evaluated at once
+    as a matrix product between parities of measured states and their counts
+    :param qiskit_result: result returned by backend.run(circuit)
+    :param circuit: circuit for which the qiskit_result was run
+    :param observables: sequence of observables, each observable is either a sequence of indices of qubits on which
+    it acts with Z, or a string of 'Z' and 'I' characters where i-th character corresponds to i-th qubit
+    (the same order as in parse_counts), e.g. "ZIZ" and (0, 2) are the same observable
+    :param measurement_plan: precompiled plan of the circuit, if not provided it's taken from
+    MeasurementPlan.from_circuit
+    :param raw_counts: if true counts are read as stored by the backend instead of using results.get_counts()
+    :return: array of expectation values, i-th value corresponds to i-th observable
+    :raises ValueError: if an observable acts on a qubit that was not measured or has invalid format
+    """
+    plan = get_plan(circuit, measurement_names, measurement_plan)
+    observable_matrix = _get_observable_matrix(observables, plan)
+    bit_matrix, weights = result_to_bit_matrix(qiskit_result, plan, raw_counts)
+
+    shots = weights.sum()
+    if shots == 0:
+        raise ValueError("result doesn't contain any measured shots")
+
+    parities = (bit_matrix.astype(np.int64) @ observable_matrix.T) & 1
+    signs = 1 - 2 * parities
+    return (weights @ signs) / shots
+
+
+def _get_observable_matrix(observables: Sequence[Union[str, Sequence[int]]], plan: MeasurementPlan) -> np.ndarray:
+    """
+    :param observables: observables as accepted by expectation_values
+    :param plan: measurement plan of the circuit
+    :return: matrix where i-th row has ones in columns (of the bit matrix) of qubits on which i-th observable acts
+    """
+    observable_matrix = np.zeros((len(observables), plan.num_clbits), dtype=np.int64)
+    for row, observable in enumerate(observables):
+        columns = plan.get_measurement_indices(_get_observable_qubits(observable, plan.num_qubits))
+        np.add.at(observable_matrix[row], columns, 1)
+    return observable_matrix
+
+
+def _get_observable_qubits(observable: Union[str, Sequence[int]], num_qubits: int) -> Sequence[int]:
+    """
+    :param observable: observable as accepted by expectation_values
+    :param num_qubits: number of qubits in the circuit
+    :return: indices of qubits on which the observable acts with Z
+    """
+    if not isinstance(observable, str):
+        return observable
+
+    if len(observable) != num_qubits:
+        raise ValueError(f"observable {observable} doesn't match number of qubits in the circuit ({num_qubits})")
+    if set(observable) - {'Z', 'I'}:
+        raise ValueError(f"observable {observable} contains characters other than 'Z' and 'I'")
+    return [qubit_index for qubit_index, pauli in enumerate(observable) if pauli == 'Z']
@@ -0,0 +1,74 @@
+from typing import Any, Iterable, List
+
+
+class GapBuffer:
+    """
+    list-like sequence supporting only insertion, keeps a gap of free slots at the position of the last insertion
+    so inserting at (or near) the same position repeatedly is amortized O(1) instead of shifting the whole list
+    """
+    _MIN_GAP_SIZE = 16
+
+    def __init__(self, items: Iterable[Any]):
+        """
+        :param items: initial items of the buffer
+        """
+        self._items = list(items)
+        self._gap_start = len(self._items)
+        self._gap_end = len(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items) - (self._gap_end - self._gap_start)
+
+    def __getitem__(self, index: int) -> Any:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("gap buffer index out of range")
+        if index < self._gap_start:
+            return self._items[index]
+        return self._items[index + self._gap_end - self._gap_start]
+
+    def insert(self, index: int, item: Any) -> None:
+        """
+        insert item before index (with the same semantics as list.insert)
+        :param index: index where the item will be placed
+        :param item: item to insert
+        """
+        length = len(self)
+        if index < 0:
+            index = max(index + length, 0)
+        index = min(index, length)
+
+        if self._gap_start == self._gap_end:
+            self._grow_gap(length)
+        self._move_gap(index)
+        self._items[self._gap_start] = item
+        self._gap_start += 1
+
+    def to_list(self) -> List[Any]:
+        """
+        :return: list of items of the buffer in order
+        """
+        return self._items[:self._gap_start] + self._items[self._gap_end:]
+
+    def _move_gap(self, index: int) -> None:
+        """
+        move gap so it starts at index, only the items between old and new position of the gap are moved
+        :param index: new start of the gap
+        """
+        gap_size = self._gap_end - self._gap_start
+        if index < self._gap_start:
+            self._items[index + gap_size:self._gap_end] = self._items[index:self._gap_start]
+        elif index > self._gap_start:
+            self._items[self._gap_start:index] = self._items[self._gap_end:index + gap_size]
+        self._gap_start = index
+        self._gap_end = index + gap_size
+
+    def _grow_gap(self, length: int) -> None:
+        """
+        grow the gap proportionally to the number of items so growing is amortized O(1) per insertion
+        :param length: number of items in the buffer
+        """
+        gap_size = max(length, self._MIN_GAP_SIZE)
+        self._items[self._gap_start:self._gap_start] = [None] * gap_size
+        self._gap_end = self._gap_start + gap_size
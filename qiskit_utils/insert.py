@@ -1,14 +1,21 @@
-from typing import Sequence, Union, Type, List
+from typing import Sequence, Union, Type, List, Tuple
 
 from qiskit import QuantumCircuit
-from qiskit.circuit import Instruction, Qubit, Clbit
+from qiskit.circuit import Instruction, Qubit, Clbit, CircuitInstruction
 from qiskit.circuit.bit import Bit
 from qiskit.circuit.exceptions import CircuitError
 
+from qiskit_utils import instrumentation
+
+# qiskit < 1.0 keeps instructions of a circuit in a list (circuit._data) which is edited directly to avoid validating
+# and copying instructions again, newer versions keep them in a structure which is modified through circuit.data
+HAS_LIST_DATA = isinstance(QuantumCircuit()._data, list)
+
 
 def insert_instruction(
         circuit: QuantumCircuit, instruction: Instruction, qubits: Sequence[Union[Qubit, int]],
-        clbits: Sequence[Union[Clbit, int]], index: int, in_place: bool = True) -> QuantumCircuit:
+        clbits: Sequence[Union[Clbit, int]], index: int, in_place: bool = True,
+        share_data: bool = False) -> QuantumCircuit:
     """
     insert instruction at a specified place (in lists of instructions from circuit.data)
     :param circuit: circuit where the instructions should be inserted
@@ -17,29 +24,229 @@ def insert_instruction(
     :param clbits: clbits used for the instruction (can be indexes or objects)
     :param index: index where the instruction will be placed in circuit.data
     :param in_place: creates new circuit if False and returns it, otherwise updates the provided circuit and returns it
+    :param share_data: if True (and in_place is False) the new circuit (QuantumCircuitEnhanced) shares instructions
+    of the provided circuit instead of copying them and stores only the inserted instruction until it's read,
+    modified, copied or transpiled (see QuantumCircuitEnhanced.from_shared), ignored with qiskit >= 1.0
     :return: circuit with instruction inserted
     """
+    share_data = share_data and not in_place and HAS_LIST_DATA
+    with instrumentation.span("insert_instruction") as span:
+        if in_place:
+            new_circuit = circuit
+        else:
+            with span.phase("copy"):
+                new_circuit = _share_instructions(circuit) if share_data else circuit.copy()
+        num_instructions = len(new_circuit)
+        span.count("instructions", num_instructions)
+        with span.phase("validate"):
+            instruction_tuple = prepare_instruction(new_circuit, instruction, qubits, clbits, index, num_instructions)
+        with span.phase("insert"):
+            # both modes insert at the same normalized position so sharing data never changes the resulting circuit
+            # (circuit.data.insert doesn't handle negative indices as list.insert does)
+            position = normalize_index(index, num_instructions)
+            if share_data:
+                new_circuit._insert_pending(position, CircuitInstruction(*instruction_tuple))
+            else:
+                new_circuit.data.insert(position, instruction_tuple)
+    return new_circuit
+
 
+def insert_instructions(
+        circuit: QuantumCircuit,
+        instructions: Sequence[Tuple[Instruction, Sequence[Union[Qubit, int]], Sequence[Union[Clbit, int]], int]],
+        in_place: bool = True) -> QuantumCircuit:
+    """
+    insert many instructions at specified places (in lists of instructions from circuit.data) in a single pass,
+    all instructions are validated before the circuit is modified
+    :param circuit: circuit where the instructions should be inserted
+    :param instructions: sequence of tuples (instruction, qubits, clbits, index) with arguments as in insert_instruction,
+    indices refer to positions in the original circuit.data (before any of the instructions is inserted),
+    instructions with the same index are inserted in the order they are given
+    :param in_place: creates new circuit if False and returns it, otherwise updates the provided circuit and returns it
+    :return: circuit with instructions inserted
+    """
     new_circuit = circuit if in_place else circuit.copy()
+    data = new_circuit._data if HAS_LIST_DATA else list(new_circuit.data)
+
+    insertions = []
+    for instruction, qubits, clbits, index in instructions:
+        instruction_tuple = prepare_instruction(new_circuit, instruction, qubits, clbits, index, len(data))
+        insertions.append((normalize_index(index, len(data)), CircuitInstruction(*instruction_tuple)))
+    if not insertions:
+        return new_circuit
+    insertions.sort(key=lambda insertion: insertion[0])
+
+    new_data = []
+    position = 0
+    for index, circuit_instruction in insertions:
+        new_data.extend(data[position:index])
+        new_data.append(circuit_instruction)
+        position = index
+    new_data.extend(data[position:])
+
+    if not HAS_LIST_DATA:
+        new_circuit.data = new_data
+        return new_circuit
+    # instructions already in the circuit are valid, so instead of re-appending all of them through the data setter
+    # only inserted instructions are registered in the parameter table
+    new_circuit._data = new_data
+    for _, circuit_instruction in insertions:
+        new_circuit._update_parameter_table(circuit_instruction)
+    return new_circuit
+
 
+def insert_into_many(
+        circuits: Sequence[QuantumCircuit], instruction: Instruction, qubits: Sequence[Union[Qubit, int]],
+        clbits: Sequence[Union[Clbit, int]], index: int, in_place: bool = True,
+        share_data: bool = False) -> List[QuantumCircuit]:
+    """
+    insert the same instruction into every circuit (as insert_instruction does), the instruction and its bits are
+    validated once for all circuits with the same bits (e.g. built from the same registers), only the index is checked
+    for every circuit, no circuit is modified if the instruction can't be inserted into any of them
+    :param circuits: circuits where the instruction should be inserted
+    :param instruction: instruction to be inserted
+    :param qubits: qubits used for the instruction (can be indexes or objects)
+    :param clbits: clbits used for the instruction (can be indexes or objects)
+    :param index: index where the instruction will be placed in data of every circuit
+    :param in_place: updates the provided circuits if True, otherwise creates new circuits
+    :param share_data: if True (and in_place is False) new circuits share instructions of the provided circuits
+    instead of copying them (see insert_instruction), copying dominates the time of inserting into many circuits,
+    ignored with qiskit >= 1.0
+    :return: list of circuits with the instruction inserted, i-th circuit corresponds to i-th provided circuit
+    """
+    with instrumentation.span("insert_into_many") as span:
+        span.count("circuits", len(circuits))
+        with span.phase("validate"):
+            circuits_bits = _get_bit_indices(circuits, instruction, qubits, clbits, index)
+        span.count("layouts", len(set(map(id, circuits_bits))))
+
+        with span.phase("insert"):
+            new_circuits = [
+                _insert_by_indices(circuit, instruction, circuit_bits, index, in_place, share_data)
+                for circuit, circuit_bits in zip(circuits, circuits_bits)
+            ]
+    return new_circuits
+
+
+def prepare_instruction(
+        circuit: QuantumCircuit, instruction: Instruction, qubits: Sequence[Union[Qubit, int]],
+        clbits: Sequence[Union[Clbit, int]], index: int,
+        num_instructions: int) -> Tuple[Instruction, List[Qubit], List[Clbit]]:
+    """
+    validate instruction to be inserted into the circuit and parse its bits
+    :param circuit: circuit where the instruction should be inserted
+    :param instruction: instruction to be inserted
+    :param qubits: qubits used for the instruction (can be indexes or objects)
+    :param clbits: clbits used for the instruction (can be indexes or objects)
+    :param index: index where the instruction will be placed in circuit.data
+    :param num_instructions: number of instructions in the circuit
+    :return: tuple of instruction, its qubits and its clbits
+    """
     if not isinstance(instruction, Instruction):
         raise ValueError("specified instruction is not of type Instruction")
 
-    if index > len(new_circuit.data):
-        raise IndexError("index provided is larger than current number of instructions")
+    check_index(index, num_instructions)
 
     if len(qubits) != instruction.num_qubits or len(clbits) != instruction.num_clbits:
         raise CircuitError(
             "number of qubits or clbits provided doesn't match instruction's qubits and clbits requirements")
 
-    parsed_qubits = _parse_bit(qubits, Qubit, new_circuit)
-    parsed_clbits = _parse_bit(clbits, Clbit, new_circuit)
-    instruction_tuple = (instruction, parsed_qubits, parsed_clbits)
+    parsed_qubits = _parse_bit(qubits, Qubit, circuit)
+    parsed_clbits = _parse_bit(clbits, Clbit, circuit)
+    if len(set(parsed_qubits)) != len(parsed_qubits):
+        raise CircuitError("duplicate qubit arguments")
+    return instruction, parsed_qubits, parsed_clbits
+
 
-    new_circuit.data.insert(index, instruction_tuple)
+def check_index(index: int, num_instructions: int) -> None:
+    """
+    raise exception if instruction can't be inserted at index
+    :param index: index where the instruction will be placed in circuit.data
+    :param num_instructions: number of instructions in the circuit
+    """
+    if index > num_instructions:
+        raise IndexError("index provided is larger than current number of instructions")
+
+
+def normalize_index(index: int, num_instructions: int) -> int:
+    """
+    convert index into non-negative position the same way list.insert does
+    :param index: index where the instruction will be placed in circuit.data (can be negative)
+    :param num_instructions: number of instructions in the circuit
+    :return: non-negative position
+    """
+    if index < 0:
+        return max(index + num_instructions, 0)
+    return index
+
+
+def _get_bit_indices(
+        circuits: Sequence[QuantumCircuit], instruction: Instruction, qubits: Sequence[Union[Qubit, int]],
+        clbits: Sequence[Union[Clbit, int]], index: int) -> List[Tuple[List[int], List[int]]]:
+    """
+    validate instruction to be inserted into every circuit, circuits with the same bits share the validation
+    :return: list of tuples (indices of qubits, indices of clbits) of the instruction in i-th circuit, the tuple
+    is the same object for circuits with the same bits
+    """
+    bit_indices = {}
+    circuits_bits = []
+    for circuit in circuits:
+        num_instructions = len(circuit)
+        layout = (tuple(circuit.qubits), tuple(circuit.clbits))
+        circuit_bits = bit_indices.get(layout)
+        if circuit_bits is None:
+            _, parsed_qubits, parsed_clbits = prepare_instruction(
+                circuit, instruction, qubits, clbits, index, num_instructions)
+            circuit_bits = bit_indices[layout] = (
+                [circuit.find_bit(qubit).index for qubit in parsed_qubits],
+                [circuit.find_bit(clbit).index for clbit in parsed_clbits],
+            )
+        else:
+            check_index(index, num_instructions)
+        circuits_bits.append(circuit_bits)
+    return circuits_bits
+
+
+def _insert_by_indices(
+        circuit: QuantumCircuit, instruction: Instruction, circuit_bits: Tuple[List[int], List[int]], index: int,
+        in_place: bool, share_data: bool) -> QuantumCircuit:
+    """
+    insert already validated instruction, parameterized instruction is copied so parameters of the circuits can be
+    assigned independently
+    :param circuit_bits: tuple (indices of qubits, indices of clbits) of the instruction
+    :return: circuit with instruction inserted
+    """
+    if instruction.is_parameterized():
+        instruction = instruction.copy()
+    qubit_indices, clbit_indices = circuit_bits
+    circuit_instruction = CircuitInstruction(
+        instruction, [circuit.qubits[qubit_index] for qubit_index in qubit_indices],
+        [circuit.clbits[clbit_index] for clbit_index in clbit_indices])
+
+    if share_data and not in_place and HAS_LIST_DATA:
+        new_circuit = _share_instructions(circuit)
+        new_circuit._insert_pending(index, circuit_instruction)
+        return new_circuit
+
+    new_circuit = circuit if in_place else circuit.copy()
+    if HAS_LIST_DATA:
+        new_circuit._data.insert(index, circuit_instruction)
+        new_circuit._update_parameter_table(circuit_instruction)
+    else:
+        new_circuit.data.insert(normalize_index(index, len(new_circuit.data)), circuit_instruction)
     return new_circuit
 
 
+def _share_instructions(circuit: QuantumCircuit) -> QuantumCircuit:
+    """
+    :param circuit: circuit whose instructions are shared
+    :return: QuantumCircuitEnhanced sharing instructions of the circuit
+    """
+    # imported here because enhanced_circuit depends on this module
+    from qiskit_utils.enhanced_circuit import QuantumCircuitEnhanced
+    return QuantumCircuitEnhanced.from_shared(circuit)
+
+
 def _parse_bit(bits: Sequence[Union[Bit, int]], bit_type: Type[Bit], circuit: QuantumCircuit) -> List[Bit]:
     """
     parse bits into list of bits (not just its indices) or throws exception if incorrect arguments
@@ -48,25 +255,39 @@ def _parse_bit(bits: Sequence[Union[Bit, int]], bit_type: Type[Bit], circuit: Qu
     :param circuit: circuit for which the bits are to be parsed
     :return: list of Clbits/Qubits
     """
+    if bit_type == Qubit:
+        circuit_bits = circuit.qubits
+    elif bit_type == Clbit:
+        circuit_bits = circuit.clbits
+    else:
+        raise ValueError("bit type must be either qiskit.circuit.Clbit or qiskit.circuit.Qubit")
+
     parsed_bits = []
-    type_name = {bit_type.__name__}
+    type_name = bit_type.__name__
 
     for bit in bits:
         if isinstance(bit, bit_type):
-            if bit_type == Qubit:
-                if bit in circuit.qubits:
-                    parsed_bits.append(bit)
-                else:
-                    raise CircuitError(f"One of the specified {type_name}s is not a part of a circuit, try adding it first")
-            elif bit_type == Clbit:
-                if bit in circuit.clbits:
-                    parsed_bits.append(bit)
-                else:
-                    raise CircuitError(f"One of the specified {type_name}s is not a part of a circuit, try adding it first")
+            if _is_in_circuit(bit, circuit):
+                parsed_bits.append(bit)
             else:
-                raise ValueError("bit type must be either qiskit.circuit.Clbit or qiskit.circuit.Qubit")
+                raise CircuitError(f"One of the specified {type_name}s is not a part of a circuit, try adding it first")
         elif isinstance(bit, int):
-            parsed_bits.append(circuit.qubits[bit])
+            parsed_bits.append(circuit_bits[bit])
         else:
             raise ValueError(f"Sequence of {type_name}s contains elements that are neither a {type_name} or a int")
     return parsed_bits
+
+
+def _is_in_circuit(bit: Bit, circuit: QuantumCircuit) -> bool:
+    """
+    check if bit is part of the circuit using circuit's bit index tables (constant time, the tables are kept
+    up to date by the circuit when bits and registers are added)
+    :param bit: qubit or clbit to check
+    :param circuit: circuit to check
+    :return: True if bit is part of the circuit
+    """
+    try:
+        circuit.find_bit(bit)
+    except CircuitError:
+        return False
+    return True
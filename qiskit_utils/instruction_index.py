@@ -0,0 +1,174 @@
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from qiskit.circuit import CircuitInstruction, Qubit
+
+
+class _Entry:
+    """
+    entry of one instruction in the index, entries are kept in the order of instructions in circuit.data
+    """
+    __slots__ = ("block",)
+
+    def __init__(self, block: "_Block"):
+        self.block = block
+
+
+class _Block:
+    """
+    consecutive entries of the index with the position of the first of them in circuit.data and offsets
+    of the entries within the block (computed when needed, dropped when the block changes)
+    """
+    __slots__ = ("entries", "start", "offsets")
+
+    def __init__(self, entries: List[_Entry]):
+        self.entries = entries
+        self.start = 0
+        self.offsets: Optional[Dict[_Entry, int]] = None
+        for entry in entries:
+            entry.block = self
+
+
+class InstructionIndex:
+    """
+    index from qubits and from instruction names to positions of instructions in circuit.data, kept up to date
+    incrementally when instructions are appended or inserted. every instruction has an entry, entries are kept in
+    the order of instructions in blocks of bounded size (so inserting shifts only entries of one block and starts
+    of blocks) and every qubit, name and pair of them keeps its entries in the same order, so positions never have
+    to be shifted and the position of an entry is the start of its block plus its offset within the block
+    """
+    _MAX_BLOCK_SIZE = 512
+
+    def __init__(self, data: Iterable[CircuitInstruction]):
+        """
+        :param data: instructions of the circuit (circuit.data)
+        """
+        self._qubit_entries: Dict[Qubit, List[_Entry]] = {}
+        self._name_entries: Dict[str, List[_Entry]] = {}
+        self._name_qubit_entries: Dict[Tuple[str, Qubit], List[_Entry]] = {}
+        self._blocks = [_Block([])]
+        self._block_starts = [0]
+        # blocks starting from this one may have outdated starts
+        self._outdated_block = 0
+        self.size = 0
+        for circuit_instruction in data:
+            self.append(circuit_instruction)
+
+    def append(self, circuit_instruction: CircuitInstruction) -> None:
+        """
+        register instruction appended at the end of the circuit
+        :param circuit_instruction: appended instruction
+        """
+        block = self._blocks[-1]
+        entry = _Entry(block)
+        block.entries.append(entry)
+        block.offsets = None
+        for entries in self._get_key_entries(circuit_instruction):
+            entries.append(entry)
+        self.size += 1
+        if len(block.entries) > self._MAX_BLOCK_SIZE:
+            self._split_block(len(self._blocks) - 1)
+
+    def insert(self, position: int, circuit_instruction: CircuitInstruction) -> None:
+        """
+        register instruction inserted at position, positions of all later instructions move by one
+        :param position: non-negative position of the inserted instruction in circuit.data
+        """
+        if position >= self.size:
+            self.append(circuit_instruction)
+            return
+
+        self._update_blocks()
+        block_number = bisect_right(self._block_starts, position) - 1
+        block = self._blocks[block_number]
+        entry = _Entry(block)
+        block.entries.insert(position - block.start, entry)
+        block.offsets = None
+        for entries in self._get_key_entries(circuit_instruction):
+            self._insert_entry(entries, entry, position)
+        self.size += 1
+        self._outdated_block = min(self._outdated_block, block_number + 1)
+        if len(block.entries) > self._MAX_BLOCK_SIZE:
+            self._split_block(block_number)
+
+    def find(self, name: Optional[str] = None, qubit: Optional[Qubit] = None) -> List[int]:
+        """
+        return sorted positions of instructions with the given name acting on the given qubit
+        :param name: name of the instruction, if None instructions with any name are returned
+        :param qubit: qubit the instruction acts on, if None instructions acting on any qubits are returned
+        :return: sorted list of positions
+        """
+        if name is None and qubit is None:
+            return list(range(self.size))
+        if name is None:
+            entries = self._qubit_entries.get(qubit, [])
+        elif qubit is None:
+            entries = self._name_entries.get(name, [])
+        else:
+            entries = self._name_qubit_entries.get((name, qubit), [])
+
+        self._update_blocks()
+        return [self._get_position(entry) for entry in entries]
+
+    def _get_key_entries(self, circuit_instruction: CircuitInstruction) -> List[List[_Entry]]:
+        """
+        :param circuit_instruction: instruction of the circuit
+        :return: lists of entries of its name, its qubits and pairs of them (created if they don't exist yet)
+        """
+        name = circuit_instruction.operation.name
+        key_entries = [self._name_entries.setdefault(name, [])]
+        for qubit in circuit_instruction.qubits:
+            key_entries.append(self._qubit_entries.setdefault(qubit, []))
+            key_entries.append(self._name_qubit_entries.setdefault((name, qubit), []))
+        return key_entries
+
+    def _insert_entry(self, entries: List[_Entry], entry: _Entry, position: int) -> None:
+        """
+        insert entry into entries of a qubit or a name keeping them in the order of instructions
+        :param entries: entries of a qubit or a name (in the order of instructions)
+        :param entry: entry of instruction inserted at position (already placed in its block)
+        :param position: position of the inserted instruction
+        """
+        low, high = 0, len(entries)
+        while low < high:
+            middle = (low + high) // 2
+            if self._get_position(entries[middle]) < position:
+                low = middle + 1
+            else:
+                high = middle
+        entries.insert(low, entry)
+
+    def _get_position(self, entry: _Entry) -> int:
+        """
+        :param entry: entry of an instruction (blocks must be up to date, apart from the block of the entry itself)
+        :return: position of the instruction in circuit.data
+        """
+        block = entry.block
+        if block.offsets is None:
+            block.offsets = {block_entry: offset for offset, block_entry in enumerate(block.entries)}
+        return block.start + block.offsets[entry]
+
+    def _split_block(self, block_number: int) -> None:
+        """
+        split block which grew over the maximum size into two halves
+        :param block_number: number of the block
+        """
+        block = self._blocks[block_number]
+        half = len(block.entries) // 2
+        new_block = _Block(block.entries[half:])
+        del block.entries[half:]
+        block.offsets = None
+        self._blocks.insert(block_number + 1, new_block)
+        self._outdated_block = min(self._outdated_block, block_number + 1)
+
+    def _update_blocks(self) -> None:
+        """
+        recompute starts of blocks which may be outdated
+        """
+        if self._outdated_block >= len(self._blocks):
+            return
+        self._block_starts = [0] + list(accumulate(len(block.entries) for block in self._blocks[:-1]))
+        for number in range(self._outdated_block, len(self._blocks)):
+            self._blocks[number].start = self._block_starts[number]
+        self._outdated_block = len(self._blocks)
@@ -0,0 +1,296 @@
+"""
+opt-in instrumentation of parsing and insertion functions, when disabled (default) instrumented functions only
+check a module flag and use a shared no-op span
+"""
+import sys
+from contextvars import ContextVar
+from threading import Lock
+from time import perf_counter
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+
+class Event(NamedTuple):
+    """
+    record of one call of an instrumented function passed to hooks
+    """
+    name: str
+    duration: float
+    phases: Dict[str, float]
+    counters: Dict[str, int]
+
+
+class FunctionStats:
+    """
+    aggregated records of all calls of one instrumented function
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.total_time = 0.0
+        self.phases: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.calls if self.calls else 0.0
+
+    def add(self, event: Event) -> None:
+        """
+        :param event: record of a call to add to the statistics
+        """
+        self.calls += 1
+        self.total_time += event.duration
+        for phase, duration in event.phases.items():
+            self.phases[phase] = self.phases.get(phase, 0.0) + duration
+        for counter, value in event.counters.items():
+            self.counters[counter] = self.counters.get(counter, 0) + value
+
+    def copy(self) -> "FunctionStats":
+        stats = FunctionStats()
+        stats.calls = self.calls
+        stats.total_time = self.total_time
+        stats.phases = dict(self.phases)
+        stats.counters = dict(self.counters)
+        return stats
+
+
+class InstrumentationStats:
+    """
+    snapshot of statistics of all instrumented functions and of the measurement plan cache
+    """
+
+    def __init__(self, functions: Dict[str, FunctionStats], plan_cache):
+        """
+        :param functions: statistics of instrumented functions keyed by their names
+        :param plan_cache: statistics of the plan cache (see MeasurementPlan.cache_info) with hits and misses counted
+        while instrumentation was enabled
+        """
+        self.functions = functions
+        self.plan_cache = plan_cache
+
+    @property
+    def plan_cache_hit_rate(self) -> float:
+        lookups = self.plan_cache.hits + self.plan_cache.misses
+        return self.plan_cache.hits / lookups if lookups else 0.0
+
+
+class _Phase:
+    def __init__(self, span: "_Span", name: str):
+        self._span = span
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self) -> "_Phase":
+        self._start = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        phases = self._span.phases
+        phases[self._name] = phases.get(self._name, 0.0) + perf_counter() - self._start
+
+
+class _Span:
+    """
+    records duration, phases and counters of one call of an instrumented function
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.phases: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+        self._start = 0.0
+        self._token = None
+
+    def __enter__(self) -> "_Span":
+        self._token = _current_span.set(self)
+        self._start = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        duration = perf_counter() - self._start
+        _current_span.reset(self._token)
+        _record(Event(self.name, duration, self.phases, self.counters))
+
+    def phase(self, name: str) -> _Phase:
+        """
+        :param name: name of the phase
+        :return: context manager measuring time spent in the phase
+        """
+        return _Phase(self, name)
+
+    def count(self, counter: str, value: int = 1) -> None:
+        """
+        :param counter: name of the counter
+        :param value: value added to the counter
+        """
+        self.counters[counter] = self.counters.get(counter, 0) + value
+
+
+class _NullPhase:
+    def __enter__(self) -> "_NullPhase":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+class _NullSpan:
+    """
+    span used when instrumentation is disabled, does nothing
+    """
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+    def phase(self, name: str) -> _NullPhase:
+        return _NULL_PHASE
+
+    def count(self, counter: str, value: int = 1) -> None:
+        pass
+
+
+_NULL_PHASE = _NullPhase()
+_NULL_SPAN = _NullSpan()
+
+_enabled = False
+_lock = Lock()
+_hooks: List[Callable[[Event], None]] = []
+_stats: Dict[str, FunctionStats] = {}
+_current_span: ContextVar[Optional[_Span]] = ContextVar("qiskit_utils_current_span", default=None)
+# hits and misses of the plan cache counted while enabled (before the last enable) and their values at the last
+# enable (or reset), the plan cache counts lookups since the process started
+_plan_cache_counts = (0, 0)
+_plan_cache_start = (0, 0)
+
+
+def enable() -> None:
+    """
+    start recording calls of instrumented functions
+    """
+    global _enabled, _plan_cache_start
+    with _lock:
+        if not _enabled:
+            _plan_cache_start = _get_plan_cache_counts()
+        _enabled = True
+
+
+def disable() -> None:
+    """
+    stop recording calls of instrumented functions (statistics recorded so far are kept)
+    """
+    global _enabled, _plan_cache_counts
+    with _lock:
+        if _enabled:
+            _plan_cache_counts = _add_counts(_plan_cache_counts, _get_counts_since_start())
+        _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def add_hook(hook: Callable[[Event], None]) -> None:
+    """
+    register function called with the record of every call of an instrumented function (while enabled)
+    :param hook: function taking an Event
+    """
+    with _lock:
+        _hooks.append(hook)
+
+
+def remove_hook(hook: Callable[[Event], None]) -> None:
+    """
+    :param hook: previously registered hook
+    """
+    with _lock:
+        _hooks.remove(hook)
+
+
+def get_stats() -> InstrumentationStats:
+    """
+    :return: snapshot of statistics aggregated while instrumentation was enabled (since statistics were reset)
+    """
+    from qiskit_utils.measurement_plan import MeasurementPlan
+
+    with _lock:
+        functions = {name: stats.copy() for name, stats in _stats.items()}
+        hits, misses = _plan_cache_counts
+        if _enabled:
+            hits, misses = _add_counts((hits, misses), _get_counts_since_start())
+    plan_cache = MeasurementPlan.cache_info()._replace(hits=hits, misses=misses)
+    return InstrumentationStats(functions, plan_cache)
+
+
+def reset_stats() -> None:
+    """
+    remove all aggregated statistics
+    """
+    global _plan_cache_counts, _plan_cache_start
+    with _lock:
+        _stats.clear()
+        _plan_cache_counts = (0, 0)
+        _plan_cache_start = _get_plan_cache_counts()
+
+
+def span(name: str) -> Union[_Span, _NullSpan]:
+    """
+    :param name: name of the instrumented function
+    :return: context manager recording the call if instrumentation is enabled, otherwise a shared no-op span
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name)
+
+
+def count(counter: str, value: int = 1) -> None:
+    """
+    add value to the counter of the innermost active span (does nothing if there is none)
+    :param counter: name of the counter
+    :param value: value added to the counter
+    """
+    if not _enabled:
+        return
+    current_span = _current_span.get()
+    if current_span is not None:
+        current_span.count(counter, value)
+
+
+def _get_plan_cache_counts() -> Tuple[int, int]:
+    """
+    :return: hits and misses of the plan cache (zeros if measurement_plan wasn't imported yet, so qiskit isn't imported)
+    """
+    measurement_plan = sys.modules.get("qiskit_utils.measurement_plan")
+    if measurement_plan is None:
+        return 0, 0
+    cache_info = measurement_plan.MeasurementPlan.cache_info()
+    return cache_info.hits, cache_info.misses
+
+
+def _get_counts_since_start() -> Tuple[int, int]:
+    """
+    :return: hits and misses of the plan cache since the last enable (or reset)
+    """
+    hits, misses = _get_plan_cache_counts()
+    start_hits, start_misses = _plan_cache_start
+    if hits < start_hits or misses < start_misses:
+        # statistics of the plan cache were cleared (MeasurementPlan.cache_clear) since the last enable
+        return hits, misses
+    return hits - start_hits, misses - start_misses
+
+
+def _add_counts(counts: Tuple[int, int], other_counts: Tuple[int, int]) -> Tuple[int, int]:
+    return counts[0] + other_counts[0], counts[1] + other_counts[1]
+
+
+def _record(event: Event) -> None:
+    """
+    :param event: record of a finished call
+    """
+    with _lock:
+        _stats.setdefault(event.name, FunctionStats()).add(event)
+        hooks = list(_hooks)
+    for hook in hooks:
+        hook(event)
@@ -0,0 +1,219 @@
+from collections import OrderedDict, namedtuple
+from threading import Lock
+from typing import Hashable, List, Optional, Sequence, Set, Tuple, Union
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Clbit, Measure
+
+from qiskit_utils import instrumentation
+
+PlanCacheInfo = namedtuple("PlanCacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class MeasurementPlan:
+    """
+    precompiled mapping between qubits of a circuit and indices of their measurements in the states returned by
+    results.get_counts() (indices don't consider spaces - they must be removed for the indices to address correctly).
+    plans depend only on the structure of the circuit (number of qubits, classical registers and measurements)
+    so one plan can be reused for every result of every circuit with the same structure
+    """
+    _cache = OrderedDict()
+    _cache_lock = Lock()
+    _cache_maxsize = 128
+    _cache_hits = 0
+    _cache_misses = 0
+
+    def __init__(self, fingerprint: Hashable, num_qubits: int, creg_sizes: Tuple[int, ...],
+                 qubit_clbit_mapping: List[Union[None, int]]):
+        """
+        :param fingerprint: structural fingerprint of circuits this plan was compiled for
+        :param num_qubits: number of qubits in the circuit
+        :param creg_sizes: sizes of classical registers of the circuit (in order of circuit.cregs)
+        :param qubit_clbit_mapping: mapping between qubit indices and its measurement indices
+        """
+        self.fingerprint = fingerprint
+        self.num_qubits = num_qubits
+        self.creg_sizes = creg_sizes
+        self.num_clbits = sum(creg_sizes)
+        self.qubit_clbit_mapping = qubit_clbit_mapping
+        self.measurements = [
+            (qubit_index, clbit_index) for qubit_index, clbit_index in enumerate(qubit_clbit_mapping)
+            if clbit_index is not None
+        ]
+
+    @classmethod
+    def from_circuit(cls, circuit: QuantumCircuit, measurement_names: Set[str]={Measure().name}) -> "MeasurementPlan":
+        """
+        return plan for the circuit, plans are kept in a bounded LRU cache keyed by the structural fingerprint
+        of the circuit so circuits with the same structure compile their plan only once
+        :param circuit: circuit for which to create the plan
+        :param measurement_names: names of instructions which are treated as measurements
+        :return: measurement plan of the circuit
+        """
+        fingerprint = _get_fingerprint(circuit, measurement_names)
+        with cls._cache_lock:
+            plan = cls._cache.get(fingerprint)
+            if plan is not None:
+                cls._cache.move_to_end(fingerprint)
+                cls._cache_hits += 1
+                instrumentation.count("plan_cache_hits")
+                return plan
+            cls._cache_misses += 1
+        instrumentation.count("plan_cache_misses")
+
+        plan = cls._compile(fingerprint)
+        with cls._cache_lock:
+            cls._cache[fingerprint] = plan
+            while len(cls._cache) > cls._cache_maxsize:
+                cls._cache.popitem(last=False)
+        return plan
+
+    @classmethod
+    def cache_info(cls) -> PlanCacheInfo:
+        """
+        return statistics of the plan cache
+        :return: named tuple with number of hits, misses, maximum size and current size of the cache
+        """
+        with cls._cache_lock:
+            return PlanCacheInfo(cls._cache_hits, cls._cache_misses, cls._cache_maxsize, len(cls._cache))
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """
+        remove all plans from the cache and reset its statistics
+        """
+        with cls._cache_lock:
+            cls._cache.clear()
+            cls._cache_hits = 0
+            cls._cache_misses = 0
+
+    @classmethod
+    def set_cache_size(cls, maxsize: int) -> None:
+        """
+        set the maximum number of plans kept in the cache, least recently used plans are evicted first
+        :param maxsize: maximum number of plans kept in the cache
+        """
+        if maxsize < 0:
+            raise ValueError("cache size must not be negative")
+
+        with cls._cache_lock:
+            cls._cache_maxsize = maxsize
+            while len(cls._cache) > maxsize:
+                cls._cache.popitem(last=False)
+
+    def check_circuit(self, circuit: QuantumCircuit) -> None:
+        """
+        raise exception if the plan can't be used for the circuit
+        :param circuit: circuit to check
+        """
+        if circuit.num_qubits != self.num_qubits:
+            raise ValueError("measurement plan was compiled for circuit with different number of qubits")
+
+    def get_measurement_indices(self, qubit_indices: Sequence[int]) -> List[int]:
+        """
+        :param qubit_indices: indices of qubits
+        :return: indices of measurements of the qubits in the states returned by results.get_counts()
+        """
+        measurement_indices = []
+        for qubit_index in qubit_indices:
+            measurement_index = self.qubit_clbit_mapping[qubit_index]
+            if measurement_index is None:
+                raise ValueError(f"qubit {qubit_index} was not measured")
+            measurement_indices.append(measurement_index)
+        return measurement_indices
+
+    def get_bit_shifts(self, memory_slots: int) -> List[Tuple[int, int]]:
+        """
+        return position of the measured bit in the integer state (as stored by the backend) for every measured qubit
+        :param memory_slots: number of memory slots of the experiment
+        :return: list of tuples of qubit index and shift of its measured bit (state >> shift & 1 is the measurement)
+        """
+        return [
+            (qubit_index, memory_slots - measurement_index - 1) for qubit_index, measurement_index in self.measurements
+        ]
+
+    @classmethod
+    def _compile(cls, fingerprint: Hashable) -> "MeasurementPlan":
+        """
+        compile plan from the structural fingerprint of the circuit
+        :param fingerprint: fingerprint returned by _get_fingerprint
+        :return: compiled plan
+        """
+        num_qubits, creg_sizes, measurements = fingerprint
+        qubit_mapping = [None] * num_qubits
+        for qubit_index, creg_index, clbit_index in measurements:
+            qubit_mapping[qubit_index] = _get_real_clbit_index(creg_sizes, creg_index, clbit_index)
+        return cls(fingerprint, num_qubits, creg_sizes, qubit_mapping)
+
+
+def get_plan(
+        circuit: QuantumCircuit, measurement_names: Set[str],
+        measurement_plan: Optional[MeasurementPlan] = None) -> MeasurementPlan:
+    """
+    return provided measurement plan (checking that it fits the circuit) or plan of the circuit if none was provided
+    :param circuit: circuit for which the plan is needed
+    :param measurement_names: names of instructions which are treated as measurements
+    :param measurement_plan: plan provided by the user or None
+    :return: measurement plan of the circuit
+    """
+    if measurement_plan is None:
+        return MeasurementPlan.from_circuit(circuit, measurement_names)
+    measurement_plan.check_circuit(circuit)
+    return measurement_plan
+
+
+def _get_fingerprint(circuit: QuantumCircuit, measurement_names: Set[str]) -> Hashable:
+    """
+    return structural fingerprint of the circuit, that is everything that the measurement plan depends on: number of
+    qubits, sizes of classical registers and for each measured qubit its index and the position of measured clbit
+    (index of its register and index of the clbit within that register)
+    :param circuit: circuit for which to create the fingerprint
+    :param measurement_names: names of instructions which are treated as measurements
+    :return: hashable fingerprint
+    """
+    creg_positions = {creg: position for position, creg in enumerate(circuit.cregs)}
+    measurements = {}
+    for instruction, qubits, bits in circuit.data:
+        if instruction.name in measurement_names:
+            qubit_index = circuit.find_bit(qubits[0]).index
+            measurements[qubit_index] = _get_clbit_location(circuit, creg_positions, bits[0])
+
+    return (
+        circuit.num_qubits,
+        tuple(creg.size for creg in circuit.cregs),
+        tuple(
+            (qubit_index, creg_index, clbit_index)
+            for qubit_index, (creg_index, clbit_index) in sorted(measurements.items())
+            if creg_index is not None
+        )
+    )
+
+
+def _get_clbit_location(
+        circuit: QuantumCircuit, creg_positions: dict, clbit: Clbit) -> Tuple[Optional[int], Optional[int]]:
+    """
+    return index of the register containing clbit and index of clbit within that register,
+    if clbit is part of many registers the one that is last in circuit.cregs is used
+    :param circuit: circuit that clbit is part of
+    :param creg_positions: mapping between registers of the circuit and their indices in circuit.cregs
+    :param clbit: clbit to find
+    :return: index of register and index of clbit within it or (None, None) if clbit is not part of any register
+    """
+    location = (None, None)
+    for creg, clbit_index in circuit.find_bit(clbit).registers:
+        creg_index = creg_positions.get(creg)
+        if creg_index is not None and (location[0] is None or creg_index > location[0]):
+            location = (creg_index, clbit_index)
+    return location
+
+
+def _get_real_clbit_index(creg_sizes: Tuple[int, ...], creg_index: int, clbit_index: int) -> int:
+    """
+    return the index of classical bit in the state returned by counts (indices don't consider spaces
+    - they must be removed for the indices to address correctly)
+    :param creg_sizes: sizes of classical registers (in order of circuit.cregs)
+    :param creg_index: index of the register containing the clbit
+    :param clbit_index: index of the clbit within its register
+    :return: index of the clbit in the state
+    """
+    return sum(creg_sizes[creg_index + 1:]) + (creg_sizes[creg_index] - clbit_index - 1)
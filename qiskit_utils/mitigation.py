@@ -0,0 +1,127 @@
+from typing import Dict, List, Mapping, Sequence, Tuple, Union
+
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit import Qubit
+
+from qiskit_utils.measurement_plan import MeasurementPlan
+
+QubitKey = Union[Qubit, int, Sequence[Union[Qubit, int]]]
+AssignmentMatrices = Mapping[QubitKey, np.ndarray]
+
+
+def normalize_assignment_matrices(
+        assignment_matrices: AssignmentMatrices, circuit: QuantumCircuit,
+        plan: MeasurementPlan) -> Dict[Tuple[int, ...], np.ndarray]:
+    """
+    validate assignment matrices and key them by tuples of qubit indices.
+    assignment matrix of a qubit is 2x2 matrix A where A[i, j] is the probability of measuring i when j was prepared,
+    assignment matrix of a block of k qubits is 2^k x 2^k matrix where states of the block are read as binary numbers
+    with the first qubit of the block being the most significant bit (the same order as keys of parse_counts)
+    :param assignment_matrices: dictionary where keys are qubits (or its indices) the same as keys of parse_result,
+    or tuples of qubits for blocks, and values are assignment matrices
+    :param circuit: circuit for which the matrices are used
+    :param plan: measurement plan of the circuit
+    :return: dictionary mapping tuples of qubit indices to assignment matrices (as float arrays)
+    """
+    normalized_matrices = {}
+    mitigated_qubits = set()
+    for key, matrix in assignment_matrices.items():
+        qubits = key if isinstance(key, (tuple, list)) else (key,)
+        qubit_indices = tuple(
+            qubit if isinstance(qubit, int) else circuit.find_bit(qubit).index for qubit in qubits
+        )
+        plan.get_measurement_indices(qubit_indices)
+        if mitigated_qubits.intersection(qubit_indices) or len(set(qubit_indices)) != len(qubit_indices):
+            raise ValueError(f"qubits {qubit_indices} have more than one assignment matrix")
+        mitigated_qubits.update(qubit_indices)
+
+        matrix = np.asarray(matrix, dtype=np.float64)
+        size = 1 << len(qubit_indices)
+        if matrix.shape != (size, size):
+            raise ValueError(f"assignment matrix of qubits {qubit_indices} must have shape {(size, size)}")
+        normalized_matrices[qubit_indices] = matrix
+    return normalized_matrices
+
+
+def mitigate_marginals(
+        bit_matrix: np.ndarray, weights: np.ndarray, plan: MeasurementPlan,
+        assignment_matrices: Dict[Tuple[int, ...], np.ndarray]) -> Dict[int, Dict[str, float]]:
+    """
+    compute per-qubit results (as parse_result does) corrected for readout errors, results of qubits in a block are
+    corrected jointly and then marginalized, qubits without assignment matrix are not corrected
+    :param bit_matrix: matrix of measured states (see bit_matrix module)
+    :param weights: number of times each state was measured
+    :param plan: measurement plan of the circuit
+    :param assignment_matrices: matrices returned by normalize_assignment_matrices
+    :return: dictionary mapping qubit indices to (quasi) counts of their states
+    """
+    if len(weights) == 0:
+        return {}
+
+    shots = float(weights.sum())
+    ones = {
+        qubit_index: float(weights @ bit_matrix[:, measurement_index])
+        for qubit_index, measurement_index in plan.measurements
+    }
+    for qubit_indices, matrix in assignment_matrices.items():
+        block_size = len(qubit_indices)
+        columns = plan.get_measurement_indices(qubit_indices)
+        powers = np.left_shift(1, np.arange(block_size - 1, -1, -1, dtype=np.int64))
+        block_states = bit_matrix[:, columns].astype(np.int64) @ powers
+        histogram = np.bincount(block_states, weights=weights, minlength=1 << block_size)
+
+        corrected = np.linalg.solve(matrix, histogram).reshape((2,) * block_size)
+        for axis, qubit_index in enumerate(qubit_indices):
+            other_axes = tuple(other_axis for other_axis in range(block_size) if other_axis != axis)
+            ones[qubit_index] = float(corrected.sum(axis=other_axes)[1])
+
+    return {
+        qubit_index: {'0': shots - ones[qubit_index], '1': ones[qubit_index]}
+        for qubit_index, _ in plan.measurements
+    }
+
+
+def mitigate_counts_array(
+        histogram: np.ndarray, plan: MeasurementPlan,
+        assignment_matrices: Dict[Tuple[int, ...], np.ndarray]) -> np.ndarray:
+    """
+    apply tensored inverse of the assignment matrices to a dense histogram (see parse_counts_array), inverse of every
+    matrix is applied only along axes of its qubits so the full 2^n x 2^n matrix is never built
+    :param histogram: dense histogram of measured states
+    :param plan: measurement plan of the circuit
+    :param assignment_matrices: matrices returned by normalize_assignment_matrices
+    :return: corrected histogram of (quasi) counts
+    """
+    num_measured = len(plan.measurements)
+    qubit_axes = {qubit_index: axis for axis, (qubit_index, _) in enumerate(plan.measurements)}
+    distribution = histogram.astype(np.float64).reshape((2,) * num_measured)
+
+    for qubit_indices, matrix in assignment_matrices.items():
+        block_size = len(qubit_indices)
+        axes = [qubit_axes[qubit_index] for qubit_index in qubit_indices]
+        inverse = np.linalg.inv(matrix).reshape((2,) * (2 * block_size))
+        distribution = np.tensordot(inverse, distribution, axes=(list(range(block_size, 2 * block_size)), axes))
+        distribution = np.moveaxis(distribution, list(range(block_size)), axes)
+
+    return distribution.reshape(-1)
+
+
+def counts_array_to_dict(histogram: np.ndarray, plan: MeasurementPlan) -> Dict[str, float]:
+    """
+    convert dense histogram (see parse_counts_array) into the same dictionary as parse_counts returns,
+    only non-zero states are included
+    :param histogram: dense histogram of measured states
+    :param plan: measurement plan of the circuit
+    :return: dictionary mapping states to its (quasi) counts
+    """
+    num_measured = len(plan.measurements)
+    qubit_indices = [qubit_index for qubit_index, _ in plan.measurements]
+    parsed_counts = {}
+    for state in np.flatnonzero(histogram):
+        new_state: List[str] = ['-'] * plan.num_qubits
+        measured_bits = format(state, f"0{num_measured}b") if num_measured else ""
+        for qubit_index, bit in zip(qubit_indices, measured_bits):
+            new_state[qubit_index] = bit
+        parsed_counts[''.join(new_state)] = float(histogram[state])
+    return parsed_counts
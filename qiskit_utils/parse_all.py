@@ -0,0 +1,71 @@
+from typing import Any, Dict, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit import Measure
+from qiskit.result import Result
+
+from qiskit_utils.bit_matrix import result_to_bit_matrix
+from qiskit_utils.measurement_plan import MeasurementPlan, get_plan
+from qiskit_utils.parse_counts import parse_counts_bit_matrix
+from qiskit_utils.parse_result import parse_result_bit_matrix
+
+
+def parse_all(
+        qiskit_result: Result, circuit: QuantumCircuit, measurement_names: Set[str]={Measure().name},
+        marginals: bool = True, counts: bool = True, parity_subsets: Optional[Sequence[Sequence[int]]] = None,
+        indexed_results: bool = True, measurement_plan: Optional[MeasurementPlan] = None,
+        raw_counts: bool = False) -> Dict[str, Any]:
+    """
+    parse results into many views at once, counts of the result are read and converted into a matrix of bits only once
+    and every requested view is computed from that matrix
+    :param qiskit_result: result returned by backend.run(circuit)
+    :param circuit: circuit for which the qiskit_result was run
+    :param marginals: if true the result contains "marginals" - the same dictionary as parse_result returns
+    :param counts: if true the result contains "counts" - the same dictionary as parse_counts returns
+    :param parity_subsets: if provided the result contains "parities" - dictionary where keys are the subsets
+    (tuples of qubit indices) and values are dictionaries with number of shots in which measured states of the qubits
+    of the subset had even ('0') and odd ('1') parity
+    :param indexed_results: if true keys of marginals are indices of qubits if false it's Qubit objects
+    :param measurement_plan: precompiled plan of the circuit, if not provided it's taken from
+    MeasurementPlan.from_circuit
+    :param raw_counts: if true counts are read as stored by the backend instead of using results.get_counts()
+    :return: dictionary with the requested views
+    """
+    plan = get_plan(circuit, measurement_names, measurement_plan)
+    bit_matrix, weights = result_to_bit_matrix(qiskit_result, plan, raw_counts)
+
+    parsed_views = {}
+    if marginals:
+        parsed_marginals = parse_result_bit_matrix(bit_matrix, weights, plan)
+        if not indexed_results:
+            parsed_marginals = {
+                circuit.qubits[qubit_index]: qubit_counts for qubit_index, qubit_counts in parsed_marginals.items()
+            }
+        parsed_views["marginals"] = parsed_marginals
+    if counts:
+        parsed_views["counts"] = parse_counts_bit_matrix(bit_matrix, weights, plan)
+    if parity_subsets is not None:
+        parsed_views["parities"] = _parse_parities(bit_matrix, weights, plan, parity_subsets)
+    return parsed_views
+
+
+def _parse_parities(
+        bit_matrix: np.ndarray, weights: np.ndarray, plan: MeasurementPlan,
+        parity_subsets: Sequence[Sequence[int]]) -> Dict[Tuple[int, ...], Dict[str, int]]:
+    """
+    :param bit_matrix: matrix of measured states (see bit_matrix module)
+    :param weights: number of times each state was measured
+    :param plan: measurement plan of the circuit
+    :param parity_subsets: subsets of qubit indices
+    :return: dictionary mapping subsets to number of shots with even ('0') and odd ('1') parity
+    """
+    shots = int(weights.sum())
+    parities = {}
+    for subset in parity_subsets:
+        columns = plan.get_measurement_indices(subset)
+        odd_states = np.bitwise_xor.reduce(bit_matrix[:, columns], axis=1)
+        odd = int(weights @ odd_states)
+        parities[tuple(subset)] = {'0': shots - odd, '1': odd}
+    return parities
+
@@ -0,0 +1,153 @@
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, List, Sequence, Set, Tuple, Union
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Qubit, Measure
+from qiskit.result import Result
+
+from qiskit_utils.measurement_plan import MeasurementPlan
+from qiskit_utils.parse_counts import parse_integer_counts_dict
+from qiskit_utils.parse_result import parse_result_integer_counts
+from qiskit_utils.raw_counts import get_stored_counts, to_integer_counts
+
+StoredCounts = Tuple[Dict[str, int], int]
+
+
+def parse_results_batch(
+        qiskit_result: Result, circuits: Sequence[QuantumCircuit], measurement_names: Set[str]={Measure().name},
+        indexed_results: bool = True, vectorized: bool = False, workers: int = 1,
+        use_processes: bool = True) -> List[Dict[Union[Qubit, int], Dict[str, int]]]:
+    """
+    parse every experiment of the result the same way parse_result does
+    :param qiskit_result: result returned by backend.run(circuits)
+    :param circuits: circuits for which the qiskit_result was run (in the same order as experiments in the result)
+    :param indexed_results: if true keys for dictionaries are indices if false it's Qubit objects
+    :param vectorized: if true counts of all qubits are computed at once with numpy
+    :param workers: number of processes (or threads) parsing the experiments, 1 parses them in the calling thread
+    :param use_processes: if true experiments are parsed in a process pool, otherwise in a thread pool (parsing is
+    pure Python, so threads don't make it faster)
+    :return: list of dictionaries containing parsed results, i-th dictionary is for i-th experiment
+    """
+    parsed_results = _parse_batch(
+        qiskit_result, circuits, measurement_names, workers, use_processes, _parse_result_chunk, vectorized)
+    if indexed_results:
+        return parsed_results
+    return [
+        {circuit.qubits[qubit_index]: qubit_counts for qubit_index, qubit_counts in experiment_results.items()}
+        for circuit, experiment_results in zip(circuits, parsed_results)
+    ]
+
+
+def parse_counts_batch(
+        qiskit_result: Result, circuits: Sequence[QuantumCircuit], measurement_names: Set[str]={Measure().name},
+        workers: int = 1, use_processes: bool = True) -> List[Dict[str, int]]:
+    """
+    parse every experiment of the result the same way parse_counts does
+    :param qiskit_result: result returned by backend.run(circuits)
+    :param circuits: circuits for which the qiskit_result was run (in the same order as experiments in the result)
+    :param workers: number of processes (or threads) parsing the experiments, 1 parses them in the calling thread
+    :param use_processes: if true experiments are parsed in a process pool, otherwise in a thread pool (parsing is
+    pure Python, so threads don't make it faster)
+    :return: list of dictionaries containing parsed counts, i-th dictionary is for i-th experiment
+    """
+    return _parse_batch(qiskit_result, circuits, measurement_names, workers, use_processes, _parse_counts_chunk)
+
+
+def _parse_batch(
+        qiskit_result: Result, circuits: Sequence[QuantumCircuit], measurement_names: Set[str], workers: int,
+        use_processes: bool, parse_chunk: Callable, *args) -> List[dict]:
+    """
+    group experiments by measurement plan of their circuits, split the groups into chunks and parse them,
+    chunks contain counts as stored by the backend (see get_stored_counts) so they are converted and parsed
+    only in the workers
+    :param qiskit_result: result returned by backend.run(circuits)
+    :param circuits: circuits for which the qiskit_result was run
+    :param measurement_names: names of instructions which are treated as measurements
+    :param workers: number of threads or processes
+    :param use_processes: if true process pool is used instead of a thread pool
+    :param parse_chunk: function parsing list of stored counts with one plan
+    :param args: additional arguments passed to parse_chunk
+    :return: list of parsed experiments in the order of experiments in the result
+    """
+    if len(circuits) != len(qiskit_result.results):
+        raise ValueError("number of circuits doesn't match number of experiments in the result")
+    if workers < 1:
+        raise ValueError("number of workers must be at least 1")
+
+    groups = {}
+    for experiment_index, circuit in enumerate(circuits):
+        plan = MeasurementPlan.from_circuit(circuit, measurement_names)
+        groups.setdefault(plan.fingerprint, (plan, []))[1].append(experiment_index)
+
+    chunks = []
+    for plan, experiment_indices in groups.values():
+        chunk_size = -(-len(experiment_indices) // workers)
+        for start in range(0, len(experiment_indices), chunk_size):
+            chunk_indices = experiment_indices[start:start + chunk_size]
+            chunk_counts = [
+                get_stored_counts(qiskit_result, experiment_index, plan.num_clbits)
+                for experiment_index in chunk_indices
+            ]
+            chunks.append((chunk_indices, plan, chunk_counts))
+
+    parsed_results = [None] * len(circuits)
+    if workers == 1:
+        for chunk_indices, plan, chunk_counts in chunks:
+            _store_chunk(parsed_results, chunk_indices, parse_chunk(plan, chunk_counts, *args))
+        return parsed_results
+
+    with _get_executor(workers, use_processes) as executor:
+        futures = [
+            (chunk_indices, executor.submit(parse_chunk, plan, chunk_counts, *args))
+            for chunk_indices, plan, chunk_counts in chunks
+        ]
+        for chunk_indices, future in futures:
+            _store_chunk(parsed_results, chunk_indices, future.result())
+    return parsed_results
+
+
+def _get_executor(workers: int, use_processes: bool) -> Executor:
+    """
+    :param workers: number of threads or processes
+    :param use_processes: if true process pool is returned instead of a thread pool
+    :return: executor with the given number of workers
+    """
+    if use_processes:
+        return ProcessPoolExecutor(max_workers=workers)
+    return ThreadPoolExecutor(max_workers=workers)
+
+
+def _store_chunk(parsed_results: list, chunk_indices: List[int], parsed_chunk: List[dict]) -> None:
+    """
+    put parsed experiments of the chunk into their places in the list of all parsed experiments
+    :param parsed_results: list of all parsed experiments
+    :param chunk_indices: indices of experiments in the chunk
+    :param parsed_chunk: parsed experiments of the chunk
+    """
+    for experiment_index, parsed_experiment in zip(chunk_indices, parsed_chunk):
+        parsed_results[experiment_index] = parsed_experiment
+
+
+def _parse_result_chunk(
+        plan: MeasurementPlan, chunk_counts: List[StoredCounts], vectorized: bool) -> List[Dict[int, Dict[str, int]]]:
+    """
+    :param plan: measurement plan shared by all experiments of the chunk
+    :param chunk_counts: stored counts and number of memory slots of experiments of the chunk
+    :param vectorized: if true counts of all qubits are computed at once with numpy
+    :return: parsed results of the experiments
+    """
+    return [
+        parse_result_integer_counts(to_integer_counts(counts), plan, memory_slots, vectorized)
+        for counts, memory_slots in chunk_counts
+    ]
+
+
+def _parse_counts_chunk(plan: MeasurementPlan, chunk_counts: List[StoredCounts]) -> List[Dict[str, int]]:
+    """
+    :param plan: measurement plan shared by all experiments of the chunk
+    :param chunk_counts: stored counts and number of memory slots of experiments of the chunk
+    :return: parsed counts of the experiments
+    """
+    return [
+        parse_integer_counts_dict(to_integer_counts(counts), plan, memory_slots) for counts, memory_slots in chunk_counts
+    ]
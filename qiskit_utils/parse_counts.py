@@ -1,29 +1,87 @@
-from typing import Dict, Union, List, Set
+from typing import Dict, Set, Optional, Tuple, Union
 
+import numpy as np
 from qiskit import QuantumCircuit
-from qiskit.circuit import Clbit, Measure
+from qiskit.circuit import Measure
 from qiskit.result import Result
 
+from qiskit_utils import instrumentation
+from qiskit_utils.bit_matrix import result_to_bit_matrix
+from qiskit_utils.measurement_plan import MeasurementPlan, get_plan
+from qiskit_utils.mitigation import (
+    AssignmentMatrices, counts_array_to_dict, mitigate_counts_array, normalize_assignment_matrices)
+from qiskit_utils.raw_counts import get_raw_counts
 
-def parse_counts(qiskit_result: Result, circuit: QuantumCircuit, measurement_names: Set[str]={Measure().name},) -> Dict[str, int]:
+MAX_DENSE_QUBITS = 28
+MAX_SPARSE_QUBITS = 63
+
+
+def parse_counts(
+        qiskit_result: Result, circuit: QuantumCircuit, measurement_names: Set[str]={Measure().name},
+        measurement_plan: Optional[MeasurementPlan] = None, raw_counts: bool = False,
+        as_array: bool = False, assignment_matrices: Optional[AssignmentMatrices] = None
+) -> Union[Dict[str, int], np.ndarray, Tuple[np.ndarray, np.ndarray]]:
     """
     parse results into a dictionary similar to what results.get_counts() returns but accessing measurement of qubit with index i is done via key[i]
     where key is key of results.get_counts() (that is a bitstring showing state)
     :param qiskit_result: result returned by backend.run(circuit)
     :param circuit: circuit for which the qiskit_result was run
+    :param measurement_plan: precompiled plan of the circuit, if not provided it's taken from
+    MeasurementPlan.from_circuit
+    :param raw_counts: if true counts are read as stored by the backend (integers) and qubit states are extracted with
+    bit shifts instead of formatting the counts into bitstrings with results.get_counts()
+    :param as_array: if true counts are returned as numpy arrays instead of a dictionary (see parse_counts_array)
+    :param assignment_matrices: if provided counts are corrected for readout errors with tensored inverse of
+    assignment matrices of qubits (or blocks of qubits, see parse_result), counts are then (quasi) counts as floats
+    and at most MAX_DENSE_QUBITS qubits can be measured
     :return: dictionary containing parsed counts
     """
-    qubit_clbit_mapping = _get_qubit_mapping(circuit, measurement_names)
-    parsed_results = {}
-    for state, count in qiskit_result.get_counts().items():
-        parsed_state = _parse_state(state)
-        new_state = ['-']*len(circuit.qubits)
-        for qubit_index in range(len(circuit.qubits)):
-            measurement_index = qubit_clbit_mapping[qubit_index]
+    with instrumentation.span("parse_counts") as span:
+        with span.phase("plan"):
+            plan = get_plan(circuit, measurement_names, measurement_plan)
+        span.count("qubits", plan.num_qubits)
+        if assignment_matrices is not None:
+            if len(plan.measurements) > MAX_DENSE_QUBITS:
+                raise ValueError(f"readout errors can be mitigated for at most {MAX_DENSE_QUBITS} measured qubits")
+            with span.phase("counts"):
+                bit_matrix, weights = result_to_bit_matrix(qiskit_result, plan, raw_counts)
+            span.count("outcomes", len(weights))
+            with span.phase("mitigate"):
+                matrices = normalize_assignment_matrices(assignment_matrices, circuit, plan)
+                histogram = mitigate_counts_array(parse_counts_array(bit_matrix, weights, plan), plan, matrices)
+            return histogram if as_array else counts_array_to_dict(histogram, plan)
 
-            if measurement_index is None:
-                continue
+        if as_array:
+            with span.phase("counts"):
+                bit_matrix, weights = result_to_bit_matrix(qiskit_result, plan, raw_counts)
+            span.count("outcomes", len(weights))
+            with span.phase("parse"):
+                return parse_counts_array(bit_matrix, weights, plan)
 
+        with span.phase("counts"):
+            if raw_counts:
+                counts, memory_slots = get_raw_counts(qiskit_result, num_clbits=plan.num_clbits)
+            else:
+                counts = qiskit_result.get_counts()
+        span.count("outcomes", len(counts))
+        with span.phase("parse"):
+            if raw_counts:
+                return parse_integer_counts_dict(counts, plan, memory_slots)
+            return parse_counts_dict(counts, plan)
+
+
+def parse_counts_dict(counts: Dict[str, int], plan: MeasurementPlan) -> Dict[str, int]:
+    """
+    parse counts of one experiment into a dictionary where measurement of qubit with index i is accessed via key[i]
+    :param counts: counts returned by results.get_counts()
+    :param plan: measurement plan of the circuit for which the counts were measured
+    :return: dictionary containing parsed counts
+    """
+    parsed_results = {}
+    for state, count in counts.items():
+        parsed_state = _parse_state(state)
+        new_state = ['-']*plan.num_qubits
+        for qubit_index, measurement_index in plan.measurements:
             new_state[qubit_index] = parsed_state[measurement_index]
         parsed_count = ''.join(new_state)
         if parsed_count in parsed_results:
@@ -31,41 +89,94 @@ def parse_counts(qiskit_result: Result, circuit: QuantumCircuit, measurement_nam
         else:
             parsed_results[parsed_count] = count
 
+    return parsed_results
+
+
+def parse_integer_counts_dict(counts: Dict[int, int], plan: MeasurementPlan, memory_slots: int) -> Dict[str, int]:
+    """
+    parse counts of one experiment with states given as integers (as returned by raw_counts.get_raw_counts)
+    into the same dictionary as parse_counts_dict does, bitstrings are built only once for every distinct parsed state
+    :param counts: dictionary mapping integer states to number of times they were measured
+    :param plan: measurement plan of the circuit for which the counts were measured
+    :param memory_slots: number of memory slots of the experiment
+    :return: dictionary containing parsed counts
+    """
+    shifts = plan.get_bit_shifts(memory_slots)
+    measured_states = {}
+    for state, count in counts.items():
+        measured_state = 0
+        for _, shift in shifts:
+            measured_state = measured_state << 1 | state >> shift & 1
+        measured_states[measured_state] = measured_states.get(measured_state, 0) + count
+
+    parsed_results = {}
+    for measured_state, count in measured_states.items():
+        measured_bits = format(measured_state, f"0{len(shifts)}b") if shifts else ""
+        new_state = ['-']*plan.num_qubits
+        for (qubit_index, _), bit in zip(shifts, measured_bits):
+            new_state[qubit_index] = bit
+        parsed_results[''.join(new_state)] = count
 
     return parsed_results
 
 
-def _get_qubit_mapping(circuit: QuantumCircuit, measurement_names: Set[str]) -> List[Union[None, int]]:
+def parse_counts_bit_matrix(bit_matrix: np.ndarray, weights: np.ndarray, plan: MeasurementPlan) -> Dict[str, int]:
     """
-    return mapping between index of a qubit and a real index of its
-    measurement result in the state returned by get_counts(). indices do not consider spaces so state must have spaces
-    removed before indices address correctly
-    :param circuit: circuit for which to create the mapping
-    :return: mapping between qubit indices and its measurement indices
+    parse states given as a matrix of bits (see bit_matrix module) into the same dictionary as parse_counts_dict does,
+    states are reordered and merged with numpy so bitstrings are built only once for every distinct parsed state
+    :param bit_matrix: matrix of measured states
+    :param weights: number of times each state was measured
+    :param plan: measurement plan of the circuit
+    :return: dictionary containing parsed counts
     """
-    qubit_mapping = [None] * circuit.num_qubits
-    for instruction, qubits, bits in circuit.data:
-        if instruction.name in measurement_names:
-            qubit_index = circuit.qubits.index(qubits[0])
-            qubit_mapping[qubit_index] = _get_real_clbit_index(circuit, bits[0])
-    return qubit_mapping
+    qubit_indices = [qubit_index for qubit_index, _ in plan.measurements]
+    measurement_indices = [measurement_index for _, measurement_index in plan.measurements]
 
+    states = np.full((len(weights), plan.num_qubits), ord('-'), dtype=np.uint8)
+    states[:, qubit_indices] = bit_matrix[:, measurement_indices] + ord('0')
+    unique_states, inverse = np.unique(states, axis=0, return_inverse=True)
+    unique_counts = np.zeros(len(unique_states), dtype=np.int64)
+    np.add.at(unique_counts, inverse.ravel(), weights)
 
-def _get_real_clbit_index(circuit: QuantumCircuit, clbit: Clbit) -> int:
+    return {
+        state.tobytes().decode("ascii"): int(count) for state, count in zip(unique_states, unique_counts)
+    }
+
+
+def parse_counts_array(
+        bit_matrix: np.ndarray, weights: np.ndarray,
+        plan: MeasurementPlan) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
     """
-    return the index of classical bit in the state returned by counts (indices don't consider spaces
-    - they must be removed for the indices to address correctly)
-    :param circuit: circuit that clbit is part of
-    :param clbit: clbit to get index of
-    :return:
+    parse states given as a matrix of bits (see bit_matrix module) into a histogram indexed by integer value
+    of the measured state - keys of parse_counts_dict without '-' read as binary numbers (the measured qubit with
+    the lowest index is the most significant bit).
+    if at most MAX_DENSE_QUBITS qubits are measured the histogram is dense - int64 vector of length
+    2 ** (number of measured qubits) where element i is number of times state i was measured, otherwise it's sparse -
+    tuple of sorted int64 vector of measured states and int64 vector of their counts
+    :param bit_matrix: matrix of measured states
+    :param weights: number of times each state was measured
+    :param plan: measurement plan of the circuit
+    :return: dense or sparse histogram of measured states
+    :raises ValueError: if more than MAX_SPARSE_QUBITS qubits are measured
     """
-    creg_index = 0
-    for creg in reversed(circuit.cregs):
-        if clbit in creg:
-            clbit_index = creg.index(clbit)
-            return creg_index + (len(creg) - clbit_index - 1)
-        else:
-            creg_index += len(creg)
+    num_measured = len(plan.measurements)
+    if num_measured > MAX_SPARSE_QUBITS:
+        raise ValueError(f"at most {MAX_SPARSE_QUBITS} measured qubits can be counted as integers, "
+                         f"circuit has {num_measured}")
+
+    measurement_indices = [measurement_index for _, measurement_index in plan.measurements]
+    powers = np.left_shift(1, np.arange(num_measured - 1, -1, -1, dtype=np.int64))
+    states = bit_matrix[:, measurement_indices].astype(np.int64) @ powers
+
+    if num_measured <= MAX_DENSE_QUBITS:
+        histogram = np.zeros(1 << num_measured, dtype=np.int64)
+        np.add.at(histogram, states, weights)
+        return histogram
+
+    unique_states, inverse = np.unique(states, return_inverse=True)
+    unique_counts = np.zeros(len(unique_states), dtype=np.int64)
+    np.add.at(unique_counts, inverse, weights)
+    return unique_states, unique_counts
 
 
 def _parse_state(state: str) -> str:
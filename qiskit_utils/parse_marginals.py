@@ -0,0 +1,64 @@
+from typing import Dict, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit import Measure
+from qiskit.result import Result
+
+from qiskit_utils.bit_matrix import result_to_bit_matrix
+from qiskit_utils.measurement_plan import MeasurementPlan, get_plan
+
+_MAX_DENSE_SUBSET_SIZE = 20
+
+
+def parse_marginals(
+        qiskit_result: Result, circuit: QuantumCircuit, subsets: Sequence[Sequence[int]],
+        measurement_names: Set[str]={Measure().name}, measurement_plan: Optional[MeasurementPlan] = None,
+        raw_counts: bool = False) -> Dict[Tuple[int, ...], Dict[str, int]]:
+    """
+    parse results into joint distributions of subsets of qubits, keys of the returned dictionary are the subsets
+    (tuples of qubit indices) and values are dictionaries similar to what parse_counts returns but restricted to qubits
+    of the subset - measurement of i-th qubit of the subset is accessed via key[i], only measured states are included.
+    counts are converted into a matrix of bits once and shared by all subsets
+    :param qiskit_result: result returned by backend.run(circuit)
+    :param circuit: circuit for which the qiskit_result was run
+    :param subsets: subsets of qubit indices, e.g. [(0, 1), (1, 2)]
+    :param measurement_plan: precompiled plan of the circuit, if not provided it's taken from
+    MeasurementPlan.from_circuit
+    :param raw_counts: if true counts are read as stored by the backend instead of using results.get_counts()
+    :return: dictionary mapping subsets to their joint distributions
+    :raises ValueError: if any qubit of a subset was not measured
+    """
+    plan = get_plan(circuit, measurement_names, measurement_plan)
+    bit_matrix, weights = result_to_bit_matrix(qiskit_result, plan, raw_counts)
+    return {
+        tuple(subset): _parse_subset(bit_matrix, weights, plan.get_measurement_indices(subset))
+        for subset in subsets
+    }
+
+
+def _parse_subset(bit_matrix: np.ndarray, weights: np.ndarray, columns: Sequence[int]) -> Dict[str, int]:
+    """
+    compute joint distribution of the bits in columns, states of the subset are encoded as integers
+    (first column is the most significant bit) and summed up with bincount (or unique for large subsets)
+    :param bit_matrix: matrix of measured states (see bit_matrix module)
+    :param weights: number of times each state was measured
+    :param columns: columns of the bits of the subset
+    :return: dictionary mapping states of the subset to number of times they were measured
+    """
+    subset_size = len(columns)
+    if subset_size > _MAX_DENSE_SUBSET_SIZE:
+        states, inverse = np.unique(bit_matrix[:, columns], axis=0, return_inverse=True)
+        state_counts = np.zeros(len(states), dtype=np.int64)
+        np.add.at(state_counts, inverse.ravel(), weights)
+        return {
+            ''.join(map(str, state)): int(count) for state, count in zip(states, state_counts) if count
+        }
+
+    powers = 1 << np.arange(subset_size - 1, -1, -1, dtype=np.int64)
+    subset_states = bit_matrix[:, columns].astype(np.int64) @ powers
+    state_counts = np.bincount(subset_states, weights=weights, minlength=1 << subset_size).astype(np.int64)
+    return {
+        format(state, f"0{subset_size}b") if subset_size else "": int(state_counts[state])
+        for state in np.flatnonzero(state_counts)
+    }
@@ -0,0 +1,75 @@
+from typing import Optional, Sequence, Set
+
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit import Measure
+from qiskit.result import Result
+
+from qiskit_utils.bit_matrix import states_to_bit_matrix, stored_states_to_bit_matrix
+from qiskit_utils.measurement_plan import MeasurementPlan, get_plan
+from qiskit_utils.raw_counts import get_stored_memory
+
+
+def parse_memory(
+        qiskit_result: Result, circuit: QuantumCircuit, measurement_names: Set[str]={Measure().name},
+        measurement_plan: Optional[MeasurementPlan] = None, raw_memory: bool = True,
+        memmap_path: Optional[str] = None, chunk_size: int = 65536) -> np.ndarray:
+    """
+    parse per-shot memory (results.get_memory()) into a bit-packed array where bit j of row i is the state of qubit
+    with index j (as in circuit.qubits) measured in i-th shot, bits of qubits which were not measured are 0.
+    use unpack_memory to get the (shots x qubits) array of bits
+    :param qiskit_result: result returned by backend.run(circuit, memory=True)
+    :param circuit: circuit for which the qiskit_result was run
+    :param measurement_plan: precompiled plan of the circuit, if not provided it's taken from
+    MeasurementPlan.from_circuit
+    :param raw_memory: if true memory is read as stored by the backend (hexadecimal states, decoded chunk by chunk),
+    otherwise it's formatted into bitstrings with results.get_memory() first (one string per shot)
+    :param memmap_path: if provided the array is memory-mapped to a .npy file at that path instead of kept in memory
+    :param chunk_size: number of shots converted at once, bounds the size of intermediate arrays
+    :return: uint8 array of shape (shots, ceil(qubits / 8))
+    """
+    plan = get_plan(circuit, measurement_names, measurement_plan)
+    if raw_memory:
+        memory, memory_slots = get_stored_memory(qiskit_result, num_clbits=plan.num_clbits)
+    else:
+        memory, memory_slots = qiskit_result.get_memory(), None
+
+    shape = (len(memory), (plan.num_qubits + 7) // 8)
+    if memmap_path is None:
+        packed_memory = np.zeros(shape, dtype=np.uint8)
+    else:
+        packed_memory = np.lib.format.open_memmap(memmap_path, mode="w+", dtype=np.uint8, shape=shape)
+
+    qubit_indices = [qubit_index for qubit_index, _ in plan.measurements]
+    measurement_indices = [measurement_index for _, measurement_index in plan.measurements]
+    for start in range(0, len(memory), chunk_size):
+        chunk = memory[start:start + chunk_size]
+        bit_matrix = _memory_to_bit_matrix(chunk, memory_slots)
+        qubit_matrix = np.zeros((len(chunk), plan.num_qubits), dtype=np.uint8)
+        qubit_matrix[:, qubit_indices] = bit_matrix[:, measurement_indices]
+        packed_memory[start:start + len(chunk)] = np.packbits(qubit_matrix, axis=1)
+
+    if memmap_path is not None:
+        packed_memory.flush()
+    return packed_memory
+
+
+def unpack_memory(packed_memory: np.ndarray, num_qubits: int) -> np.ndarray:
+    """
+    unpack array returned by parse_memory
+    :param packed_memory: array returned by parse_memory
+    :param num_qubits: number of qubits of the circuit
+    :return: uint8 array of shape (shots, qubits) where element [i, j] is state of qubit j measured in i-th shot
+    """
+    return np.unpackbits(packed_memory, axis=1, count=num_qubits)
+
+
+def _memory_to_bit_matrix(memory: Sequence[str], memory_slots: Optional[int]) -> np.ndarray:
+    """
+    :param memory: measured states, either bitstrings or states as stored by the backend
+    :param memory_slots: number of memory slots if memory contains states as stored by the backend, None otherwise
+    :return: matrix of bits (see bit_matrix module)
+    """
+    if memory_slots is None:
+        return states_to_bit_matrix(memory)
+    return stored_states_to_bit_matrix(memory, memory_slots)
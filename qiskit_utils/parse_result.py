@@ -1,72 +1,171 @@
-from typing import Dict, Union, List, Set
+from typing import Dict, Union, Set, Optional
 
+import numpy as np
 from qiskit import QuantumCircuit
-from qiskit.circuit import Qubit, Clbit, Measure
+from qiskit.circuit import Qubit, Measure
 from qiskit.result import Result
 
+from qiskit_utils import instrumentation
+from qiskit_utils.bit_matrix import counts_to_bit_matrix, integer_counts_to_bit_matrix, result_to_bit_matrix
+from qiskit_utils.measurement_plan import MeasurementPlan, get_plan
+from qiskit_utils.mitigation import AssignmentMatrices, mitigate_marginals, normalize_assignment_matrices
+from qiskit_utils.raw_counts import get_raw_counts
+
 
 def parse_result(
         qiskit_result: Result, circuit: QuantumCircuit, measurement_names: Set[str]={Measure().name},
-        indexed_results: bool = True) -> Dict[Union[Qubit, int], Dict[str, int]]:
+        indexed_results: bool = True, vectorized: bool = False, measurement_plan: Optional[MeasurementPlan] = None,
+        raw_counts: bool = False,
+        assignment_matrices: Optional[AssignmentMatrices] = None) -> Dict[Union[Qubit, int], Dict[str, int]]:
     """
     parse results into a dictionary where keys are the qubits (or its indices) and values are dictionaries containing
     results of states for that qubit (ignoring all other qubits)
     :param qiskit_result: result returned by backend.run(circuit)
     :param circuit: circuit for which the qiskit_result was run
     :param indexed_results: if true keys for dictionary are indices if false it's Qubit objects
+    :param vectorized: if true counts of all qubits are computed at once with numpy (faster for wide circuits
+    with many distinct states), the returned dictionary is the same as without this flag
+    :param measurement_plan: precompiled plan of the circuit, if not provided it's taken from
+    MeasurementPlan.from_circuit
+    :param raw_counts: if true counts are read as stored by the backend (integers) and qubit states are extracted with
+    bit shifts instead of formatting the counts into bitstrings with results.get_counts()
+    :param assignment_matrices: if provided results are corrected for readout errors, dictionary where keys are qubits
+    (or its indices, as in the returned dictionary) or tuples of qubits and values are their assignment matrices
+    (see mitigation.normalize_assignment_matrices), the returned results are then (quasi) counts as floats
     :return: dictionary containing parsed results
     """
-    qubit_clbit_mapping = _get_qubit_mapping(circuit, measurement_names)
-    parsed_results = {}
-    for state, count in qiskit_result.get_counts().items():
-        parsed_state = _parse_state(state)
-        for qubit_index in range(len(circuit.qubits)):
-            key = qubit_index if indexed_results else circuit.qubits[qubit_index]
-            measurement_index = qubit_clbit_mapping[qubit_index]
+    with instrumentation.span("parse_result") as span:
+        with span.phase("plan"):
+            plan = get_plan(circuit, measurement_names, measurement_plan)
+        if assignment_matrices is not None:
+            with span.phase("counts"):
+                bit_matrix, weights = result_to_bit_matrix(qiskit_result, plan, raw_counts)
+            with span.phase("mitigate"):
+                matrices = normalize_assignment_matrices(assignment_matrices, circuit, plan)
+                parsed_results = mitigate_marginals(bit_matrix, weights, plan, matrices)
+            return _index_results(parsed_results, circuit, indexed_results)
+
+        with span.phase("counts"):
+            if raw_counts:
+                counts, memory_slots = get_raw_counts(qiskit_result, num_clbits=plan.num_clbits)
+            else:
+                counts = qiskit_result.get_counts()
+        with span.phase("parse"):
+            if raw_counts:
+                parsed_results = parse_result_integer_counts(counts, plan, memory_slots, vectorized)
+            else:
+                parsed_results = parse_result_counts(counts, plan, vectorized)
+        span.count("outcomes", len(counts))
+        span.count("qubits", plan.num_qubits)
+    return _index_results(parsed_results, circuit, indexed_results)
 
-            if measurement_index is None:
-                continue
 
+def parse_result_counts(
+        counts: Dict[str, int], plan: MeasurementPlan, vectorized: bool = False) -> Dict[int, Dict[str, int]]:
+    """
+    parse counts of one experiment into a dictionary where keys are indices of qubits and values are dictionaries
+    containing results of states for that qubit (ignoring all other qubits)
+    :param counts: counts returned by results.get_counts()
+    :param plan: measurement plan of the circuit for which the counts were measured
+    :param vectorized: if true counts of all qubits are computed at once with numpy
+    :return: dictionary containing parsed results
+    """
+    if vectorized:
+        return _parse_counts_vectorized(counts, plan)
+
+    parsed_results = {}
+    for state, count in counts.items():
+        parsed_state = _parse_state(state)
+        for qubit_index, measurement_index in plan.measurements:
             qubit_state = parsed_state[measurement_index]
 
-            if key not in parsed_results:
-                parsed_results[key] = {'0': 0, '1': 0}
-            parsed_results[key][qubit_state] += count
+            if qubit_index not in parsed_results:
+                parsed_results[qubit_index] = {'0': 0, '1': 0}
+            parsed_results[qubit_index][qubit_state] += count
 
     return parsed_results
 
 
-def _get_qubit_mapping(circuit: QuantumCircuit, measurement_names: Set[str]) -> List[Union[None, int]]:
+def parse_result_integer_counts(
+        counts: Dict[int, int], plan: MeasurementPlan, memory_slots: int,
+        vectorized: bool = False) -> Dict[int, Dict[str, int]]:
     """
-    return mapping between index of a qubit and a real index of its
-    measurement result in the state returned by get_counts(). indices do not consider spaces so state must have spaces
-    removed before indices address correctly
-    :param circuit: circuit for which to create the mapping
-    :return: mapping between qubit indices and its measurement indices
+    parse counts of one experiment with states given as integers (as returned by raw_counts.get_raw_counts)
+    into the same dictionary as parse_result_counts does
+    :param counts: dictionary mapping integer states to number of times they were measured
+    :param plan: measurement plan of the circuit for which the counts were measured
+    :param memory_slots: number of memory slots of the experiment
+    :param vectorized: if true counts of all qubits are computed at once with numpy
+    :return: dictionary containing parsed results
     """
-    qubit_mapping = [None] * circuit.num_qubits
-    for instruction, qubits, bits in circuit.data:
-        if instruction.name in measurement_names:
-            qubit_index = circuit.qubits.index(qubits[0])
-            qubit_mapping[qubit_index] = _get_real_clbit_index(circuit, bits[0])
-    return qubit_mapping
+    if not counts:
+        return {}
+
+    if vectorized:
+        return parse_result_bit_matrix(*integer_counts_to_bit_matrix(counts, memory_slots), plan)
 
+    shifts = plan.get_bit_shifts(memory_slots)
+    ones = [0] * len(shifts)
+    shots = 0
+    for state, count in counts.items():
+        shots += count
+        for measurement, (_, shift) in enumerate(shifts):
+            if state >> shift & 1:
+                ones[measurement] += count
 
-def _get_real_clbit_index(circuit: QuantumCircuit, clbit: Clbit) -> int:
+    return {
+        qubit_index: {'0': shots - qubit_ones, '1': qubit_ones}
+        for (qubit_index, _), qubit_ones in zip(shifts, ones)
+    }
+
+
+def _index_results(
+        parsed_results: Dict[int, Dict[str, int]], circuit: QuantumCircuit,
+        indexed_results: bool) -> Dict[Union[Qubit, int], Dict[str, int]]:
     """
-    return the index of classical bit in the state returned by counts (indices don't consider spaces
-    - they must be removed for the indices to address correctly)
-    :param circuit: circuit that clbit is part of
-    :param clbit: clbit to get index of
-    :return:
+    :param parsed_results: dictionary where keys are indices of qubits
+    :param circuit: circuit for which the results were parsed
+    :param indexed_results: if true keys are left as indices if false they are replaced by Qubit objects
+    :return: dictionary containing parsed results
     """
-    creg_index = 0
-    for creg in reversed(circuit.cregs):
-        if clbit in creg:
-            clbit_index = creg.index(clbit)
-            return creg_index + (len(creg) - clbit_index - 1)
-        else:
-            creg_index += len(creg)
+    if indexed_results:
+        return parsed_results
+    return {circuit.qubits[qubit_index]: qubit_counts for qubit_index, qubit_counts in parsed_results.items()}
+
+
+def _parse_counts_vectorized(counts: Dict[str, int], plan: MeasurementPlan) -> Dict[int, Dict[str, int]]:
+    """
+    parse counts into the same dictionary as parse_result does but count states of all bits with one
+    weighted sum over the matrix of measured states
+    :param counts: counts returned by results.get_counts()
+    :param plan: measurement plan of the circuit
+    :return: dictionary containing parsed results
+    """
+    if not counts:
+        return {}
+    return parse_result_bit_matrix(*counts_to_bit_matrix(counts), plan)
+
+
+def parse_result_bit_matrix(
+        bit_matrix: np.ndarray, weights: np.ndarray, plan: MeasurementPlan) -> Dict[int, Dict[str, int]]:
+    """
+    parse states given as a matrix of bits into the same dictionary as parse_result_counts does
+    :param bit_matrix: matrix of measured states (see bit_matrix module)
+    :param weights: number of times each state was measured
+    :param plan: measurement plan of the circuit
+    :return: dictionary containing parsed results
+    """
+    if len(weights) == 0:
+        return {}
+
+    ones = weights @ bit_matrix
+    shots = int(weights.sum())
+
+    parsed_results = {}
+    for qubit_index, measurement_index in plan.measurements:
+        qubit_ones = int(ones[measurement_index])
+        parsed_results[qubit_index] = {'0': shots - qubit_ones, '1': qubit_ones}
+    return parsed_results
 
 
 def _parse_state(state: str) -> str:
@@ -0,0 +1,132 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from qiskit.result import Result
+from qiskit.result.models import ExperimentResult
+
+
+def get_raw_counts(
+        qiskit_result: Result, experiment: Optional[int] = None,
+        num_clbits: Optional[int] = None) -> Tuple[Dict[int, int], int]:
+    """
+    return counts of the experiment as stored by the backend (without formatting them into bitstrings like
+    results.get_counts() does), states are returned as integers where bit i is the value of memory slot i
+    :param qiskit_result: result returned by backend.run(circuit)
+    :param experiment: index of the experiment, can be omitted if result contains only one experiment
+    :param num_clbits: number of clbits of the circuit (MeasurementPlan.num_clbits), used as number of memory slots
+    if the header of the experiment doesn't contain memory_slots
+    :return: tuple of dictionary mapping states to number of times they were measured and number of memory slots
+    """
+    counts, memory_slots = get_stored_counts(qiskit_result, experiment, num_clbits)
+    return to_integer_counts(counts), memory_slots
+
+
+def get_stored_counts(
+        qiskit_result: Result, experiment: Optional[int] = None,
+        num_clbits: Optional[int] = None) -> Tuple[Dict[str, int], int]:
+    """
+    return counts of the experiment exactly as stored by the backend (usually hexadecimal states), nothing is
+    converted so the counts are cheap to get and to send to other processes (see to_integer_counts)
+    :param qiskit_result: result returned by backend.run(circuit)
+    :param experiment: index of the experiment, can be omitted if result contains only one experiment
+    :param num_clbits: number of clbits of the circuit, used if the header doesn't contain memory_slots
+    :return: tuple of dictionary mapping stored states to number of times they were measured and number of memory
+    slots
+    """
+    experiment_result = _get_experiment_result(qiskit_result, experiment)
+    counts = getattr(experiment_result.data, "counts", None)
+    if counts is None:
+        raise ValueError("experiment doesn't contain counts")
+    return counts, _get_memory_slots(experiment_result, num_clbits)
+
+
+def get_raw_counts_from_dict(
+        experiment: Dict[str, Any], num_clbits: Optional[int] = None) -> Tuple[Dict[int, int], int]:
+    """
+    the same as get_raw_counts but for an experiment given as a dictionary (an element of "results"
+    in Result.to_dict())
+    :param experiment: experiment result as a dictionary
+    :param num_clbits: number of clbits of the circuit, used if the header doesn't contain memory_slots
+    :return: tuple of dictionary mapping states to number of times they were measured and number of memory slots
+    """
+    counts = experiment.get("data", {}).get("counts")
+    if counts is None:
+        raise ValueError("experiment doesn't contain counts")
+
+    memory_slots = experiment.get("header", {}).get("memory_slots")
+    return to_integer_counts(counts), _resolve_memory_slots(memory_slots, num_clbits)
+
+
+def get_stored_memory(
+        qiskit_result: Result, experiment: Optional[int] = None,
+        num_clbits: Optional[int] = None) -> Tuple[List[str], int]:
+    """
+    return per-shot memory of the experiment exactly as stored by the backend (usually hexadecimal states), nothing
+    is converted (see bit_matrix.stored_states_to_bit_matrix)
+    :param qiskit_result: result returned by backend.run(circuit, memory=True)
+    :param experiment: index of the experiment, can be omitted if result contains only one experiment
+    :param num_clbits: number of clbits of the circuit, used if the header doesn't contain memory_slots
+    :return: tuple of list of stored states (one per shot) and number of memory slots
+    """
+    experiment_result = _get_experiment_result(qiskit_result, experiment)
+    memory = getattr(experiment_result.data, "memory", None)
+    if memory is None:
+        raise ValueError("experiment doesn't contain memory, run it with memory=True")
+    return memory, _get_memory_slots(experiment_result, num_clbits)
+
+
+def _get_memory_slots(experiment_result: ExperimentResult, num_clbits: Optional[int]) -> int:
+    """
+    :param experiment_result: result of the experiment
+    :param num_clbits: number of clbits of the circuit, used if the header of the experiment doesn't contain
+    memory_slots (states as stored by the backend have no leading zeros, so their width can't be used)
+    :return: number of memory slots of the experiment
+    """
+    return _resolve_memory_slots(getattr(experiment_result.header, "memory_slots", None), num_clbits)
+
+
+def _resolve_memory_slots(memory_slots: Optional[int], num_clbits: Optional[int]) -> int:
+    """
+    :param memory_slots: number of memory slots stored in the header of the experiment or None
+    :param num_clbits: number of clbits of the circuit or None
+    :return: number of memory slots of the experiment
+    """
+    if memory_slots is not None:
+        return memory_slots
+    if num_clbits is None:
+        raise ValueError("header of the experiment doesn't contain memory_slots, number of clbits must be provided")
+    return num_clbits
+
+
+def _get_experiment_result(qiskit_result: Result, experiment: Optional[int]) -> ExperimentResult:
+    """
+    :param qiskit_result: result returned by backend.run(circuit)
+    :param experiment: index of the experiment or None if result contains only one experiment
+    :return: result of the experiment
+    """
+    if experiment is None:
+        if len(qiskit_result.results) != 1:
+            raise ValueError("result contains more than one experiment, index of the experiment must be provided")
+        experiment = 0
+    return qiskit_result.results[experiment]
+
+
+def to_integer_counts(counts: Dict[str, int]) -> Dict[int, int]:
+    """
+    :param counts: counts with states as stored by the backend
+    :return: counts with states as integers
+    """
+    raw_counts = {}
+    for state, count in counts.items():
+        value = _state_to_int(state)
+        raw_counts[value] = raw_counts.get(value, 0) + count
+    return raw_counts
+
+
+def _state_to_int(state: str) -> int:
+    """
+    :param state: state as stored by the backend, either hexadecimal ("0x5") or bitstring ("1 01")
+    :return: state as integer
+    """
+    if state.startswith("0x"):
+        return int(state, 16)
+    return int(state.replace(" ", ""), 2)
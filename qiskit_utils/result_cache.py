@@ -0,0 +1,189 @@
+import hashlib
+import json
+import pickle
+import sqlite3
+from threading import Lock
+from typing import Any, Callable, Dict, Optional, Set, Union
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Measure
+from qiskit.result import Result
+
+from qiskit_utils.measurement_plan import MeasurementPlan, get_plan
+from qiskit_utils.parse_counts import parse_counts
+from qiskit_utils.parse_result import parse_result
+
+_OPTIONS_NOT_CHANGING_VALUE = {"vectorized", "raw_counts"}
+
+
+class ResultCache:
+    """
+    persistent cache of parsed results stored in a SQLite database, entries are keyed by job id (or hash of the result),
+    structural fingerprint of the circuit, measurement names and parsing options.
+    least recently used entries are evicted when the cache exceeds its limits
+    """
+
+    def __init__(self, path: str, max_entries: Optional[int] = None, max_bytes: Optional[int] = None,
+                 key_by_job_id: bool = True):
+        """
+        :param path: path of the database file (":memory:" for a cache kept only in memory)
+        :param max_entries: maximum number of entries, if None number of entries is not limited
+        :param max_bytes: maximum total size of stored parsed results in bytes, if None size is not limited
+        :param key_by_job_id: if true results are identified by their job id (if they have one), otherwise by hash
+        of their content
+        """
+        if max_entries is not None and max_entries < 0 or max_bytes is not None and max_bytes < 0:
+            raise ValueError("cache limits must not be negative")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.key_by_job_id = key_by_job_id
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, last_access INTEGER NOT NULL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)")
+
+    def parse_result(
+            self, qiskit_result: Result, circuit: QuantumCircuit, measurement_names: Set[str]={Measure().name},
+            indexed_results: bool = True, measurement_plan: Optional[MeasurementPlan] = None,
+            **kwargs: Any) -> Dict[Any, Dict[str, Union[int, float]]]:
+        """
+        cached version of parse_result, arguments are the same as of parse_result
+        :return: dictionary containing parsed results
+        """
+        plan = get_plan(circuit, measurement_names, measurement_plan)
+        parsed_results = self._get_or_parse(
+            "parse_result", qiskit_result, plan, measurement_names, kwargs,
+            lambda: parse_result(qiskit_result, circuit, measurement_names, measurement_plan=plan, **kwargs),
+        )
+        if indexed_results:
+            return parsed_results
+        return {circuit.qubits[qubit_index]: qubit_counts for qubit_index, qubit_counts in parsed_results.items()}
+
+    def parse_counts(
+            self, qiskit_result: Result, circuit: QuantumCircuit, measurement_names: Set[str]={Measure().name},
+            measurement_plan: Optional[MeasurementPlan] = None, **kwargs: Any) -> Any:
+        """
+        cached version of parse_counts, arguments are the same as of parse_counts
+        :return: parsed counts in the format requested by the arguments
+        """
+        plan = get_plan(circuit, measurement_names, measurement_plan)
+        return self._get_or_parse(
+            "parse_counts", qiskit_result, plan, measurement_names, kwargs,
+            lambda: parse_counts(qiskit_result, circuit, measurement_names, measurement_plan=plan, **kwargs),
+        )
+
+    def clear(self) -> None:
+        """
+        remove all entries and reset statistics
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM entries")
+            self.hits = 0
+            self.misses = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "ResultCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    @property
+    def size(self) -> int:
+        """
+        :return: total size of stored parsed results in bytes
+        """
+        with self._lock:
+            return self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def _get_or_parse(
+            self, function_name: str, qiskit_result: Result, plan: MeasurementPlan, measurement_names: Set[str],
+            options: Dict[str, Any], parse: Callable[[], Any]) -> Any:
+        """
+        :param function_name: name of the parsing function
+        :param qiskit_result: result to parse
+        :param plan: measurement plan of the circuit
+        :param measurement_names: names of instructions which are treated as measurements
+        :param options: other arguments of the parsing function (they change the parsed value)
+        :param parse: function parsing the result if it's not cached
+        :return: parsed result
+        """
+        key = self._get_key(function_name, qiskit_result, plan, measurement_names, options)
+        with self._lock, self._connection:
+            row = self._connection.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                self._connection.execute(
+                    "UPDATE entries SET last_access = (SELECT MAX(last_access) + 1 FROM entries) WHERE key = ?",
+                    (key,))
+                self.hits += 1
+                return pickle.loads(row[0])
+            self.misses += 1
+
+        parsed = parse()
+        value = pickle.dumps(parsed, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, last_access) "
+                "VALUES (?, ?, ?, (SELECT COALESCE(MAX(last_access), 0) + 1 FROM entries))",
+                (key, value, len(value)))
+            self._evict()
+        return parsed
+
+    def _evict(self) -> None:
+        """
+        remove least recently used entries until the cache is within its limits (must be called with the lock held)
+        """
+        if self.max_entries is not None:
+            self._connection.execute(
+                "DELETE FROM entries WHERE key IN ("
+                "SELECT key FROM entries ORDER BY last_access DESC LIMIT -1 OFFSET ?)", (self.max_entries,))
+        if self.max_bytes is not None:
+            total_size = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            rows = self._connection.execute("SELECT key, size FROM entries ORDER BY last_access")
+            evicted_keys = []
+            for key, size in rows:
+                if total_size <= self.max_bytes:
+                    break
+                evicted_keys.append((key,))
+                total_size -= size
+            self._connection.executemany("DELETE FROM entries WHERE key = ?", evicted_keys)
+
+    def _get_key(
+            self, function_name: str, qiskit_result: Result, plan: MeasurementPlan, measurement_names: Set[str],
+            options: Dict[str, Any]) -> str:
+        """
+        :return: key of the entry - hash of everything the parsed value depends on
+        """
+        options = {name: value for name, value in options.items() if name not in _OPTIONS_NOT_CHANGING_VALUE}
+        key = hashlib.sha256()
+        key.update(function_name.encode())
+        key.update(self._get_result_key(qiskit_result).encode())
+        key.update(repr(plan.fingerprint).encode())
+        key.update(repr(sorted(measurement_names)).encode())
+        key.update(pickle.dumps(sorted(options.items()), protocol=pickle.HIGHEST_PROTOCOL))
+        return key.hexdigest()
+
+    def _get_result_key(self, qiskit_result: Result) -> str:
+        """
+        :param qiskit_result: result to identify
+        :return: job id of the result (if used and present) or hash of the result
+        """
+        job_id = getattr(qiskit_result, "job_id", None)
+        if self.key_by_job_id and job_id:
+            return f"job:{job_id}"
+        result_json = json.dumps(qiskit_result.to_dict(), sort_keys=True, default=str)
+        return f"hash:{hashlib.sha256(result_json.encode()).hexdigest()}"
@@ -0,0 +1,72 @@
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence
+
+
+class SharedSequence:
+    """
+    list-like sequence supporting only insertion, built on top of a base sequence which is shared (never modified),
+    only inserted items and items replacing items of the base are stored, so many sequences derived from one base
+    take memory proportional to their differences from it
+    """
+
+    def __init__(self, base: Sequence[Any], replaced: Optional[Dict[int, Any]] = None):
+        """
+        :param base: shared base sequence, it must not be modified while the shared sequence exists
+        :param replaced: dictionary mapping indices in the base sequence to items replacing them
+        """
+        self._base = base
+        self._replaced = replaced if replaced is not None else {}
+        # sorted positions (in this sequence) of inserted items
+        self._positions: List[int] = []
+        self._inserted: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self._base) + len(self._inserted)
+
+    def __getitem__(self, index: int) -> Any:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("shared sequence index out of range")
+        num_inserted_before = bisect_left(self._positions, index)
+        if num_inserted_before < len(self._positions) and self._positions[num_inserted_before] == index:
+            return self._inserted[num_inserted_before]
+        base_index = index - num_inserted_before
+        if base_index in self._replaced:
+            return self._replaced[base_index]
+        return self._base[base_index]
+
+    def insert(self, index: int, item: Any) -> None:
+        """
+        insert item before index (with the same semantics as list.insert)
+        :param index: index where the item will be placed
+        :param item: item to insert
+        """
+        length = len(self)
+        if index < 0:
+            index = max(index + length, 0)
+        index = min(index, length)
+
+        insertion = bisect_left(self._positions, index)
+        for moved in range(insertion, len(self._positions)):
+            self._positions[moved] += 1
+        self._positions.insert(insertion, index)
+        self._inserted.insert(insertion, item)
+
+    def to_list(self) -> List[Any]:
+        """
+        :return: items of the sequence as a new list
+        """
+        base = list(self._base)
+        for base_index, item in self._replaced.items():
+            base[base_index] = item
+
+        items = []
+        start = 0
+        for num_inserted_before, (position, item) in enumerate(zip(self._positions, self._inserted)):
+            end = position - num_inserted_before
+            items.extend(base[start:end])
+            items.append(item)
+            start = end
+        items.extend(base[start:])
+        return items
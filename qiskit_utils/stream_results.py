@@ -0,0 +1,185 @@
+import json
+import os
+from typing import Any, Dict, Iterator, Sequence, Set, TextIO, Tuple, Union
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Measure
+
+from qiskit_utils.measurement_plan import MeasurementPlan, get_plan
+from qiskit_utils.parse_counts import parse_integer_counts_dict
+from qiskit_utils.parse_result import parse_result_integer_counts
+from qiskit_utils.raw_counts import get_raw_counts_from_dict
+
+
+def iter_result_file(
+        result_file: Union[str, os.PathLike, TextIO], circuits: Union[QuantumCircuit, Sequence[QuantumCircuit]],
+        measurement_names: Set[str]={Measure().name}, counts: bool = True,
+        chunk_size: int = 65536) -> Iterator[Tuple[int, Any]]:
+    """
+    parse experiments of a result saved as json (Result.to_dict()) one at a time without building Result objects,
+    the file is read in chunks so only one experiment is kept in memory at once
+    :param result_file: path of the json file or file opened in text mode
+    :param circuits: circuit for which all experiments were run or sequence of circuits
+    (i-th circuit corresponds to i-th experiment)
+    :param counts: if true experiments are parsed as parse_counts does, otherwise as parse_result does
+    :param chunk_size: number of characters read from the file at once
+    :return: iterator of tuples (index of the experiment, parsed experiment)
+    """
+    if isinstance(result_file, (str, os.PathLike)):
+        with open(result_file) as opened_file:
+            yield from iter_result_file(opened_file, circuits, measurement_names, counts, chunk_size)
+        return
+
+    plans: Dict[int, MeasurementPlan] = {}
+    for index, experiment in enumerate(iter_experiment_dicts(result_file, chunk_size)):
+        if isinstance(circuits, QuantumCircuit):
+            circuit = circuits
+        elif index < len(circuits):
+            circuit = circuits[index]
+        else:
+            raise ValueError("result contains more experiments than there are circuits")
+
+        plan = plans.get(id(circuit))
+        if plan is None:
+            plan = plans[id(circuit)] = get_plan(circuit, measurement_names)
+        yield index, parse_experiment_dict(experiment, plan, counts)
+
+
+def iter_experiment_dicts(result_file: TextIO, chunk_size: int = 65536) -> Iterator[Dict[str, Any]]:
+    """
+    read experiments of a result saved as json (Result.to_dict()) one at a time
+    :param result_file: file opened in text mode
+    :param chunk_size: number of characters read from the file at once
+    :return: iterator of experiments as dictionaries (elements of "results")
+    """
+    return _JsonResultReader(result_file, chunk_size).iter_experiments()
+
+
+def parse_experiment_dict(experiment: Dict[str, Any], plan: MeasurementPlan, counts: bool = True) -> Any:
+    """
+    parse experiment given as a dictionary (an element of "results" in Result.to_dict()),
+    classical registers stored in the header of the experiment must match the registers of the plan
+    :param experiment: experiment result as a dictionary
+    :param plan: measurement plan of the circuit for which the experiment was run
+    :param counts: if true the experiment is parsed as parse_counts does, otherwise as parse_result does
+    :return: parsed experiment
+    """
+    check_experiment_dict(experiment, plan)
+    raw_counts, memory_slots = get_raw_counts_from_dict(experiment, plan.num_clbits)
+    if counts:
+        return parse_integer_counts_dict(raw_counts, plan, memory_slots)
+    return parse_result_integer_counts(raw_counts, plan, memory_slots)
+
+
+def check_experiment_dict(experiment: Dict[str, Any], plan: MeasurementPlan) -> None:
+    """
+    raise exception if classical registers stored in the header of the experiment don't match registers of the plan
+    :param experiment: experiment result as a dictionary
+    :param plan: measurement plan of the circuit for which the experiment was run
+    """
+    creg_sizes = experiment.get("header", {}).get("creg_sizes")
+    if creg_sizes is not None and tuple(size for _, size in creg_sizes) != tuple(plan.creg_sizes):
+        raise ValueError(
+            f"classical registers of the experiment {creg_sizes} don't match registers of the circuit {plan.creg_sizes}")
+
+
+class _JsonResultReader:
+    """
+    incremental reader of a json object with "results" array, elements of the array are decoded one at a time
+    and other values are decoded and skipped
+    """
+    _WHITESPACE = " \t\n\r"
+
+    def __init__(self, result_file: TextIO, chunk_size: int):
+        self._file = result_file
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._eof = False
+
+    def iter_experiments(self) -> Iterator[Dict[str, Any]]:
+        """
+        :return: iterator of elements of "results" array
+        """
+        self._expect("{")
+        if self._peek() == "}":
+            return
+        while True:
+            key = self._decode()
+            self._expect(":")
+            if key == "results":
+                yield from self._iter_array()
+            else:
+                self._decode()
+            if self._expect(",}") == "}":
+                return
+
+    def _iter_array(self) -> Iterator[Any]:
+        self._expect("[")
+        if self._peek() == "]":
+            self._position += 1
+            return
+        while True:
+            yield self._decode()
+            if self._expect(",]") == "]":
+                return
+
+    def _decode(self) -> Any:
+        """
+        :return: next json value, more of the file is read until the value is complete (the buffer is doubled
+        every time so values longer than the chunk are decoded in linear time)
+        """
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                if not self._read(len(self._buffer) - self._position):
+                    raise
+                continue
+            # numbers (and literals) can be cut at the end of the buffer
+            if end == len(self._buffer) and self._read():
+                continue
+            self._position = end
+            return value
+
+    def _expect(self, characters: str) -> str:
+        """
+        :param characters: characters allowed at the next non-whitespace position
+        :return: the character found
+        """
+        character = self._peek()
+        if not character or character not in characters:
+            raise ValueError(f"invalid result json, expected one of {characters!r} but found {character!r}")
+        self._position += 1
+        return character
+
+    def _peek(self) -> str:
+        """
+        skip whitespace
+        :return: next non-whitespace character or empty string at the end of the file
+        """
+        while True:
+            while self._position < len(self._buffer) and self._buffer[self._position] in self._WHITESPACE:
+                self._position += 1
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._read():
+                return ""
+
+    def _read(self, size: int = 0) -> bool:
+        """
+        drop consumed part of the buffer and read next chunk of the file
+        :param size: number of characters to read if it's larger than the chunk size
+        :return: False if the end of the file was reached
+        """
+        if self._eof:
+            return False
+        chunk = self._file.read(max(size, self._chunk_size))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._position:] + chunk
+        self._position = 0
+        return True
@@ -14,8 +14,15 @@ setup(
     url='https://github.com/mgrzesiuk/qiskit-utils',
     keywords='utility-methods qiskit',
     install_requires=[
-          'qiskit>=0.34.2',
+          'qiskit>=0.37.0',
+          'numpy>=1.17',
       ],
+    extras_require={
+        'arrow': ['pyarrow>=10.0.0'],
+    },
+    entry_points={
+        'console_scripts': ['qiskit-utils=qiskit_utils.cli:main'],
+    },
     description="package containing utility methods for qiskit like result parsing and instruction insertion for circuits",
     long_description=long_description,
     long_description_content_type='text/markdown'
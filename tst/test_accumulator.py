@@ -0,0 +1,77 @@
+from unittest import TestCase
+
+from qiskit import QuantumCircuit, Aer, transpile, QuantumRegister, ClassicalRegister
+from qiskit.result import Result
+
+from qiskit_utils import CountsAccumulator, parse_counts, parse_result
+
+
+class TestCountsAccumulator(TestCase):
+    def test_accumulator_matches_parse_functions_for_one_result(self):
+        qc = self._prepare_circuit()
+        result = self._get_counts(qc)
+        accumulator = CountsAccumulator(qc).update(result)
+        assert accumulator.shots == 1024
+        assert accumulator.counts() == parse_counts(result, qc)
+        assert accumulator.marginals() == parse_result(result, qc)
+        assert accumulator.marginals(indexed_results=False) == parse_result(result, qc, indexed_results=False)
+
+    def test_accumulator_sums_many_results(self):
+        qc = self._prepare_circuit()
+        results = [self._get_counts(qc) for _ in range(3)]
+        accumulator = CountsAccumulator(qc).update_many(iter(results))
+
+        expected_counts = {}
+        for result in results:
+            for state, count in parse_counts(result, qc).items():
+                expected_counts[state] = expected_counts.get(state, 0) + count
+        assert accumulator.shots == 3 * 1024
+        assert accumulator.counts() == expected_counts
+
+        expected_marginals = {}
+        for result in results:
+            for qubit_index, qubit_counts in parse_result(result, qc).items():
+                totals = expected_marginals.setdefault(qubit_index, {'0': 0, '1': 0})
+                totals['0'] += qubit_counts['0']
+                totals['1'] += qubit_counts['1']
+        assert accumulator.marginals() == expected_marginals
+
+    def test_accumulator_snapshots_are_not_updated(self):
+        qc = QuantumCircuit(2, 1)
+        qc.x(1)
+        qc.measure(1, 0)
+        result = self._get_counts(qc)
+        accumulator = CountsAccumulator(qc)
+        assert accumulator.counts() == {}
+        assert accumulator.marginals() == {}
+
+        accumulator.update(result)
+        counts, marginals = accumulator.counts(), accumulator.marginals()
+        accumulator.update(result)
+        assert counts == {"-1": 1024}
+        assert marginals == {1: {'0': 0, '1': 1024}}
+        assert accumulator.counts() == {"-1": 2048}
+        assert accumulator.marginals() == {1: {'0': 0, '1': 2048}}
+
+    @staticmethod
+    def _prepare_circuit() -> QuantumCircuit:
+        qr1, qr2 = QuantumRegister(3), QuantumRegister(3)
+        cr1, cr2 = ClassicalRegister(2), ClassicalRegister(3)
+        qc = QuantumCircuit(qr1, cr1, qr2, cr2)
+
+        qc.h(qr1)
+        qc.h(qr2)
+        qc.cx(qr1[0], qr2[1])
+
+        qc.measure(qr1[0], cr2[2])
+        qc.measure(qr1[2], cr1[0])
+        qc.measure(qr2[0], cr2[0])
+        qc.measure(qr2[1], cr1[1])
+        qc.measure(qr1[1], cr2[1])
+        return qc
+
+    @staticmethod
+    def _get_counts(circuit: QuantumCircuit) -> Result:
+        backend = Aer.get_backend("aer_simulator")
+        transpiled_circuit = transpile(circuit, backend)
+        return backend.run(transpiled_circuit).result()
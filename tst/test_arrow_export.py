@@ -0,0 +1,115 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from pytest import importorskip, raises
+
+pa = importorskip("pyarrow")
+pq = importorskip("pyarrow.parquet")
+
+from qiskit import QuantumCircuit, Aer, transpile
+
+from qiskit_utils import (
+    ParquetExporter, counts_to_record_batch, marginals_to_record_batch, parse_counts_batch, parse_results_batch,
+)
+
+
+class TestArrowExport(TestCase):
+    def test_marginals_to_record_batch(self):
+        batch = marginals_to_record_batch(
+            [{0: {'0': 1, '1': 3}, 2: {'0': 4, '1': 0}}, {}, {1: {'0': 2, '1': 2}}], experiments=[10, 11, 12])
+        assert batch.schema.names == ["experiment", "qubit", "count_0", "count_1"]
+        assert batch.to_pydict() == {
+            "experiment": [10, 10, 12], "qubit": [0, 2, 1], "count_0": [1, 4, 2], "count_1": [3, 0, 2],
+        }
+
+    def test_counts_to_record_batch(self):
+        batch = counts_to_record_batch([{"01-": 3, "10-": 1}, {"111": 4}])
+        assert batch.to_pydict() == {"experiment": [0, 0, 1], "state": ["01-", "10-", "111"], "count": [3, 1, 4]}
+
+    def test_float_counts_are_exported_as_float64(self):
+        batch = counts_to_record_batch([{"01": 2.5, "10": 1.5}, {"11": 4}])
+        assert batch.schema.field("count").type == pa.float64()
+        assert batch.to_pydict()["count"] == [2.5, 1.5, 4.0]
+        batch = marginals_to_record_batch([{0: {'0': 0.25, '1': 0.75}}])
+        assert batch.schema.field("count_0").type == pa.float64()
+        assert batch.to_pydict()["count_1"] == [0.75]
+        assert counts_to_record_batch([{"01": 3}], float_counts=True).schema.field("count").type == pa.float64()
+
+    def test_float_counts_are_rejected_for_integer_columns(self):
+        with raises(ValueError):
+            counts_to_record_batch([{"01": 2.5}], float_counts=False)
+        with raises(ValueError):
+            marginals_to_record_batch([{0: {'0': 0.25, '1': 0.75}}], float_counts=False)
+
+    def test_record_batch_raises_value_error_when_experiments_do_not_match(self):
+        with raises(ValueError):
+            counts_to_record_batch([{"0": 1}], experiments=[0, 1])
+
+    def test_parquet_exporter_appends_batches(self):
+        circuits = [self._prepare_circuit(i) for i in range(1, 4)]
+        backend = Aer.get_backend("aer_simulator")
+        result = backend.run(transpile(circuits, backend)).result()
+        parsed_results = parse_results_batch(result, circuits)
+        parsed_counts = parse_counts_batch(result, circuits)
+
+        directory = self._get_directory()
+        marginals_path, counts_path = os.path.join(directory, "marginals.parquet"), os.path.join(directory, "c.parquet")
+        with ParquetExporter(marginals_path, counts_path) as exporter:
+            exporter.write_marginals(parsed_results[:2])
+            exporter.write_marginals(parsed_results[2:], experiments=[2])
+            exporter.write_counts(parsed_counts)
+
+        marginals = pq.read_table(marginals_path)
+        assert marginals.num_rows == 9
+        assert pq.ParquetFile(marginals_path).num_row_groups == 2
+        rows = marginals.to_pylist()
+        for experiment, parsed in enumerate(parsed_results):
+            assert {row["qubit"]: {'0': row["count_0"], '1': row["count_1"]}
+                    for row in rows if row["experiment"] == experiment} == parsed
+        counts = pq.read_table(counts_path).to_pylist()
+        assert {(row["experiment"], row["state"]): row["count"] for row in counts} == {
+            (experiment, state): count
+            for experiment, experiment_counts in enumerate(parsed_counts) for state, count in experiment_counts.items()
+        }
+
+    def test_parquet_exporter_writes_float_counts(self):
+        counts_path = os.path.join(self._get_directory(), "counts.parquet")
+        with ParquetExporter(counts_path=counts_path, float_counts=True) as exporter:
+            exporter.write_counts([{"01": 2.5}])
+            exporter.write_counts([{"11": 3}])
+        assert pq.read_table(counts_path).to_pydict()["count"] == [2.5, 3.0]
+
+        with ParquetExporter(counts_path=counts_path, overwrite=True) as exporter:
+            with raises(ValueError):
+                exporter.write_counts([{"01": 2.5}])
+
+    def test_parquet_exporter_does_not_overwrite_existing_file(self):
+        counts_path = os.path.join(self._get_directory(), "counts.parquet")
+        with ParquetExporter(counts_path=counts_path) as exporter:
+            exporter.write_counts([{"01": 3}])
+        with raises(FileExistsError):
+            ParquetExporter(counts_path=counts_path)
+        assert pq.read_table(counts_path).to_pydict()["count"] == [3]
+
+        with ParquetExporter(counts_path=counts_path, overwrite=True) as exporter:
+            exporter.write_counts([{"10": 5}])
+        assert pq.read_table(counts_path).to_pydict()["count"] == [5]
+
+    def test_parquet_exporter_raises_value_error_without_path(self):
+        with ParquetExporter(counts_path=os.path.join(self._get_directory(), "counts.parquet")) as exporter:
+            with raises(ValueError):
+                exporter.write_marginals([])
+
+    def _get_directory(self) -> str:
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        return directory.name
+
+    @staticmethod
+    def _prepare_circuit(num_x: int) -> QuantumCircuit:
+        qc = QuantumCircuit(3, 3)
+        for qubit in range(num_x):
+            qc.x(qubit)
+        qc.measure(range(3), [2, 0, 1])
+        return qc
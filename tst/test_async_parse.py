@@ -0,0 +1,70 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from qiskit import QuantumCircuit, Aer, transpile
+from pytest import raises
+
+from qiskit_utils import aparse_result, aparse_counts, parse_as_completed, parse_counts, parse_result
+
+
+class TestAsyncParse(TestCase):
+    def test_aparse_result_and_counts_of_job_and_result(self):
+        qc = self._prepare_circuit(1)
+        job = self._run(qc)
+        result = job.result()
+
+        async def parse():
+            return await asyncio.gather(
+                aparse_result(job, qc),
+                aparse_counts(result, qc),
+                aparse_result(result, qc, indexed_results=False),
+            )
+
+        parsed_result, parsed_counts, parsed_qubits = asyncio.run(parse())
+        assert parsed_result == parse_result(result, qc)
+        assert parsed_counts == parse_counts(result, qc)
+        assert parsed_qubits == parse_result(result, qc, indexed_results=False)
+
+    def test_parse_as_completed_yields_every_job(self):
+        circuits = [self._prepare_circuit(i) for i in range(4)]
+        jobs = [self._run(qc) for qc in circuits]
+
+        async def parse():
+            with ThreadPoolExecutor(2) as executor:
+                return [parsed async for parsed in parse_as_completed(jobs, circuits, executor=executor)]
+
+        parsed = dict(asyncio.run(parse()))
+        assert parsed == {i: parse_counts(jobs[i].result(), circuits[i]) for i in range(4)}
+
+    def test_parse_as_completed_with_parse_result(self):
+        circuits = [self._prepare_circuit(i) for i in range(2)]
+        results = [self._run(qc).result() for qc in circuits]
+
+        async def parse():
+            return [parsed async for parsed in parse_as_completed(results, circuits, counts=False, raw_counts=True)]
+
+        parsed = dict(asyncio.run(parse()))
+        assert parsed == {i: parse_result(results[i], circuits[i]) for i in range(2)}
+
+    def test_parse_as_completed_raises_value_error_when_lengths_differ(self):
+        qc = self._prepare_circuit(0)
+
+        async def parse():
+            return [parsed async for parsed in parse_as_completed([self._run(qc)], [qc, qc])]
+
+        with raises(ValueError):
+            asyncio.run(parse())
+
+    @staticmethod
+    def _prepare_circuit(num_x: int) -> QuantumCircuit:
+        qc = QuantumCircuit(4, 4)
+        for qubit in range(num_x):
+            qc.x(qubit)
+        qc.measure(range(4), [3, 1, 2, 0])
+        return qc
+
+    @staticmethod
+    def _run(circuit: QuantumCircuit):
+        backend = Aer.get_backend("aer_simulator")
+        return backend.run(transpile(circuit, backend))
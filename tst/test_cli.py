@@ -0,0 +1,93 @@
+import json
+import os
+import pickle
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import numpy as np
+from qiskit import QuantumCircuit, Aer, transpile, qpy
+from qiskit.result import Result
+
+from qiskit_utils import parse_counts, parse_result
+from qiskit_utils.cli import main
+
+
+class TestCli(TestCase):
+    def test_parse_directory_with_qpy_circuits(self):
+        directory = self._get_directory()
+        circuits = [self._prepare_circuit(1), self._prepare_circuit(2)]
+        results = [self._run(circuits) for _ in range(3)]
+        for i, result in enumerate(results):
+            self._save(result, os.path.join(directory, f"result_{i}.json"))
+        circuits_path = os.path.join(directory, "circuits.qpy")
+        with open(circuits_path, "wb") as circuits_file:
+            qpy.dump(circuits, circuits_file)
+        output_path = os.path.join(directory, "parsed.npz")
+
+        for workers in ("1", "2"):
+            assert main(["parse", directory, "--circuits", circuits_path, "--output", output_path,
+                         "--workers", workers]) == 0
+            columns = np.load(output_path)
+            assert columns["files"].tolist() == [os.path.join(directory, f"result_{i}.json") for i in range(3)]
+            assert columns["experiment_file"].tolist() == [0, 0, 1, 1, 2, 2]
+            assert columns["experiment_index"].tolist() == [0, 1, 0, 1, 0, 1]
+            assert columns["shots"].tolist() == [1024] * 6
+            for row in range(6):
+                result = self._get_experiment(results[columns["experiment_file"][row]], columns["experiment_index"][row])
+                circuit = circuits[columns["experiment_index"][row]]
+                marginals = parse_result(result, circuit)
+                assert columns["measured"][row].tolist() == [qubit in marginals for qubit in range(4)]
+                for qubit, qubit_counts in marginals.items():
+                    assert columns["marginals"][row, qubit].tolist() == [qubit_counts['0'], qubit_counts['1']]
+
+                start, end = columns["counts_offsets"][row], columns["counts_offsets"][row + 1]
+                counts = dict(zip(columns["counts_states"][start:end], columns["counts_values"][start:end]))
+                assert {state.decode(): value for state, value in counts.items()} == parse_counts(result, circuit)
+
+    def test_parse_glob_with_pickled_circuit(self):
+        directory = self._get_directory()
+        circuit = self._prepare_circuit(1)
+        self._save(self._run([circuit]), os.path.join(directory, "result.json"))
+        circuits_path = os.path.join(directory, "circuit.pickle")
+        with open(circuits_path, "wb") as circuits_file:
+            pickle.dump(circuit, circuits_file)
+        output_path = os.path.join(directory, "parsed.npz")
+
+        assert main(["parse", os.path.join(directory, "*.json"), "--circuits", circuits_path,
+                     "--output", output_path, "--workers", "1"]) == 0
+        columns = np.load(output_path)
+        assert columns["counts_states"].tolist() == [b"10-1"]
+        assert columns["counts_offsets"].tolist() == [0, 1]
+
+    @staticmethod
+    def _prepare_circuit(num_x: int) -> QuantumCircuit:
+        qc = QuantumCircuit(4, 3)
+        for qubit in range(num_x):
+            qc.x(qubit)
+        qc.measure(0, 2)
+        qc.measure(1, 0)
+        qc.measure(3, 1)
+        qc.x(3)
+        qc.measure(3, 1)
+        return qc
+
+    def _get_directory(self) -> str:
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        return directory.name
+
+    @staticmethod
+    def _get_experiment(result: Result, index: int) -> Result:
+        experiment_result = result.to_dict()
+        experiment_result["results"] = [experiment_result["results"][index]]
+        return Result.from_dict(experiment_result)
+
+    @staticmethod
+    def _save(result: Result, path: str) -> None:
+        with open(path, "w") as result_file:
+            json.dump(result.to_dict(), result_file, default=str)
+
+    @staticmethod
+    def _run(circuits) -> Result:
+        backend = Aer.get_backend("aer_simulator")
+        return backend.run(transpile(circuits, backend)).result()
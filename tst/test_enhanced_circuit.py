@@ -0,0 +1,121 @@
+from math import pi
+from unittest import TestCase
+from unittest.mock import patch
+
+from qiskit import transpile
+from qiskit.circuit import Parameter
+from qiskit.circuit.library import RGate, HGate, Measure, XGate, Barrier, CXGate
+from pytest import raises
+
+from qiskit_utils import QuantumCircuitEnhanced
+
+
+class TestQuantumCircuitEnhanced(TestCase):
+    def test_insert_correct_when_editing(self):
+        circuit = self._prepare_circuit()
+        expected_circuit = self._prepare_circuit()
+        with circuit.editing():
+            for index in (1, 2, 2, 5, 0):
+                circuit.insert(HGate(), (index % 3,), (), index)
+                expected_circuit.insert(HGate(), (index % 3,), (), index)
+        assert circuit == expected_circuit
+        assert not circuit.is_editing
+
+    def test_inserted_instructions_are_visible_when_circuit_is_read_while_editing(self):
+        circuit = self._prepare_circuit()
+        circuit.begin_editing()
+        circuit.insert(Measure(), (1,), (1,), 2)
+        assert circuit.data[2].operation.name == 'measure'
+        circuit.insert(HGate(), (1,), (), 0)
+        assert len(circuit.copy().data) == 6
+        assert len(transpile(circuit, basis_gates=['h', 'cx', 'ccx', 'measure']).data) == 6
+
+    def test_parameters_of_instructions_inserted_when_editing_are_registered(self):
+        circuit = self._prepare_circuit()
+        theta = Parameter('theta')
+        with circuit.editing():
+            circuit.insert(RGate(theta, pi / 4), (0,), (), 1)
+        assert circuit.parameters[0] == theta
+        bound_circuit = circuit.assign_parameters({theta: pi})
+        assert bound_circuit.data[1].operation.params[0] == pi
+
+    def test_insert_raises_index_error_when_editing_and_index_out_of_range(self):
+        circuit = self._prepare_circuit()
+        with raises(IndexError):
+            with circuit.editing():
+                circuit.insert(HGate(), (0,), (), 1)
+                circuit.insert(HGate(), (0,), (), 6)
+
+    def test_find_positions(self):
+        circuit = self._prepare_circuit()
+        circuit.cx(2, 1)
+        assert circuit.find_positions(name='cx') == [1, 4]
+        assert circuit.find_positions(qubit=2) == [1, 2, 4]
+        assert circuit.find_positions(name='cx', qubit=circuit.qubits[0]) == [1]
+        assert circuit.find_positions(name='rz') == []
+
+    def test_find_positions_correct_after_insert_and_append(self):
+        circuit = self._prepare_circuit()
+        assert circuit.find_positions(qubit=0) == [0, 1, 2]
+        circuit.insert(HGate(), (0,), (), 1)
+        circuit.x(0)
+        with circuit.editing():
+            circuit.insert(XGate(), (1,), (), 0)
+            assert circuit.find_positions(qubit=0) == [1, 2, 3, 4, 6]
+        assert circuit.find_positions(name='x') == [0, 6]
+        assert circuit.find_positions(qubit=1) == [0, 4, 5]
+
+    def test_find_positions_does_not_build_index_again_after_insert(self):
+        circuit = self._prepare_circuit()
+        assert circuit.find_positions(name='cx') == [1]
+        with patch("qiskit_utils.enhanced_circuit.InstructionIndex") as instruction_index:
+            circuit.insert(CXGate(), (1, 0), (), 0)
+            with circuit.editing():
+                circuit.insert(CXGate(), (0, 2), (), 3)
+                assert circuit.find_positions(name='cx') == [0, 2, 3]
+            assert circuit.find_positions(name='cx', qubit=2) == [2, 3]
+        instruction_index.assert_not_called()
+
+    def test_insert_before_every_measurement(self):
+        circuit = self._prepare_circuit()
+        circuit.measure(2, 1)
+        circuit.insert_before(Barrier(3), (0, 1, 2), (), name='measure')
+        assert [instruction.operation.name for instruction in circuit.data] == [
+            'h', 'cx', 'ccx', 'barrier', 'measure', 'barrier', 'measure'
+        ]
+
+    def test_insert_after_last_instruction_on_qubit(self):
+        circuit = self._prepare_circuit()
+        circuit.cx(0, 1)
+        circuit.h(2)
+        circuit.insert_after(XGate(), (2,), (), name='cx', qubit=0, occurrence='last')
+        circuit.insert_after(XGate(), (1,), (), name='cx', qubit=0, occurrence='first')
+        assert [instruction.operation.name for instruction in circuit.data] == [
+            'h', 'cx', 'x', 'ccx', 'measure', 'cx', 'x', 'h'
+        ]
+        assert circuit.data[6].qubits == (circuit.qubits[2],)
+
+    def test_insert_after_every_adjacent_match(self):
+        circuit = self._prepare_circuit()
+        circuit.find_positions()
+        circuit.insert_after(XGate(), (1,), (), qubit=2)
+        assert [instruction.operation.name for instruction in circuit.data] == [
+            'h', 'cx', 'x', 'ccx', 'x', 'measure'
+        ]
+        assert circuit.find_positions(name='x') == [2, 4]
+
+    def test_insert_before_when_predicate_given(self):
+        circuit = self._prepare_circuit()
+        circuit.h(1)
+        circuit.insert_before(
+            XGate(), (0,), (), name='h', predicate=lambda instruction: instruction.qubits[0] == circuit.qubits[1])
+        assert [instruction.operation.name for instruction in circuit.data] == ['h', 'cx', 'ccx', 'measure', 'x', 'h']
+
+    @staticmethod
+    def _prepare_circuit() -> QuantumCircuitEnhanced:
+        circuit = QuantumCircuitEnhanced(3, 2)
+        circuit.h(0)
+        circuit.cx(0, 2)
+        circuit.ccx(1, 2, 0)
+        circuit.measure(1, 0)
+        return circuit
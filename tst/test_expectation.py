@@ -0,0 +1,73 @@
+from unittest import TestCase
+
+import numpy as np
+from qiskit import QuantumCircuit, Aer, transpile, QuantumRegister, ClassicalRegister
+from qiskit.result import Result
+from pytest import raises
+
+from qiskit_utils import expectation_values, parse_counts
+
+
+class TestExpectationValues(TestCase):
+    def test_expectation_values_of_basis_state(self):
+        qc = QuantumCircuit(3, 3)
+        qc.x(0)
+        qc.measure(0, 2)
+        qc.measure(1, 0)
+        qc.measure(2, 1)
+        result = self._get_counts(qc)
+        values = expectation_values(result, qc, ["ZII", "IZI", (0, 2), (1, 2), "III", (0, 0)])
+        assert isinstance(values, np.ndarray)
+        assert values.tolist() == [-1.0, 1.0, -1.0, 1.0, 1.0, 1.0]
+
+    def test_expectation_values_match_parse_counts(self):
+        qc = self._prepare_circuit()
+        result = self._get_counts(qc)
+        observables = [(0,), (0, 3), (1, 2, 4), (0, 1, 2, 3, 4)]
+        counts = parse_counts(result, qc)
+        for raw_counts in (False, True):
+            values = expectation_values(result, qc, observables, raw_counts=raw_counts)
+            for value, observable in zip(values, observables):
+                expected = sum(
+                    count * (-1) ** sum(int(state[qubit]) for qubit in observable) for state, count in counts.items()
+                ) / 1024
+                assert np.isclose(value, expected)
+
+    def test_expectation_values_raise_value_error_for_not_measured_qubit(self):
+        qc = self._prepare_circuit()
+        result = self._get_counts(qc)
+        with raises(ValueError):
+            expectation_values(result, qc, [(0, 5)])
+        with raises(ValueError):
+            expectation_values(result, qc, ["ZIIIIZ"])
+
+    def test_expectation_values_raise_value_error_for_invalid_string(self):
+        qc = self._prepare_circuit()
+        result = self._get_counts(qc)
+        with raises(ValueError):
+            expectation_values(result, qc, ["ZX"])
+        with raises(ValueError):
+            expectation_values(result, qc, ["ZIIIIX"])
+
+    @staticmethod
+    def _prepare_circuit() -> QuantumCircuit:
+        qr1, qr2 = QuantumRegister(3), QuantumRegister(3)
+        cr1, cr2 = ClassicalRegister(2), ClassicalRegister(3)
+        qc = QuantumCircuit(qr1, cr1, qr2, cr2)
+
+        qc.h(qr1)
+        qc.h(qr2)
+        qc.cx(qr1[0], qr2[1])
+
+        qc.measure(qr1[0], cr2[2])
+        qc.measure(qr1[2], cr1[0])
+        qc.measure(qr2[0], cr2[0])
+        qc.measure(qr2[1], cr1[1])
+        qc.measure(qr1[1], cr2[1])
+        return qc
+
+    @staticmethod
+    def _get_counts(circuit: QuantumCircuit) -> Result:
+        backend = Aer.get_backend("aer_simulator")
+        transpiled_circuit = transpile(circuit, backend)
+        return backend.run(transpiled_circuit).result()
@@ -0,0 +1,22 @@
+from unittest import TestCase
+
+from qiskit_utils.gap_buffer import GapBuffer
+
+
+class TestGapBuffer(TestCase):
+    def test_insert_matches_list_insert(self):
+        buffer = GapBuffer(range(10))
+        expected = list(range(10))
+        for item, index in enumerate([3, 4, 4, 0, 15, 40, -2, -30, 7, 7, 7, 1, 12]):
+            buffer.insert(index, -item)
+            expected.insert(index, -item)
+        assert buffer.to_list() == expected
+        assert len(buffer) == len(expected)
+
+    def test_insert_many_items_at_same_position(self):
+        buffer = GapBuffer([])
+        expected = []
+        for item in range(100):
+            buffer.insert(len(buffer) // 2, item)
+            expected.insert(len(expected) // 2, item)
+        assert buffer.to_list() == expected
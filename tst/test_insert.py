@@ -1,13 +1,14 @@
 from math import pi
 from unittest import TestCase
+from unittest.mock import patch
 
-from qiskit import QuantumCircuit
-from qiskit.circuit import Clbit, Qubit
+from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+from qiskit.circuit import CircuitInstruction, Clbit, Parameter, Qubit
 from qiskit.circuit.exceptions import CircuitError
-from qiskit.circuit.library import RGate, Measure, iSwapGate
+from qiskit.circuit.library import RGate, Measure, XGate, iSwapGate
 from pytest import raises
 
-from qiskit_utils import insert_instruction
+from qiskit_utils import QuantumCircuitEnhanced, insert_instruction, insert_instructions, insert_into_many
 
 
 class TestInsert(TestCase):
@@ -32,6 +33,21 @@ class TestInsert(TestCase):
         assert instruction in circuit.get_instructions('iswap')[0]
         assert len(circuit.get_instructions('iswap')) == 1
 
+    def test_insert_correct_when_clbits_given_as_indices(self):
+        circuit = self._prepare_circuit()
+        instruction = Measure()
+        insert_instruction(circuit, instruction, (2,), (1,), 4)
+        assert circuit.data[4].qubits == (circuit.qubits[2],)
+        assert circuit.data[4].clbits == (circuit.clbits[1],)
+
+    def test_insert_correct_when_bits_added_after_circuit_creation(self):
+        circuit = self._prepare_circuit()
+        qreg = QuantumRegister(2)
+        circuit.add_register(qreg)
+        instruction = iSwapGate()
+        insert_instruction(circuit, instruction, (qreg[1], 0), (), 2)
+        assert circuit.data[2].qubits == (qreg[1], circuit.qubits[0])
+
     def test_insert_raises_circuit_error_when_mismatch_with_instruction_interface(self):
         with raises(CircuitError) as exc:
             circuit = self._prepare_circuit()
@@ -83,6 +99,157 @@ class TestInsert(TestCase):
             insert_instruction(circuit, instruction, (0,), (), 10)
         assert str(exc.value) == "index provided is larger than current number of instructions"
 
+    def test_insert_instructions_uses_indices_of_original_circuit(self):
+        circuit = self._prepare_circuit()
+        original_data = list(circuit.data)
+        first_instruction = RGate(pi / 2, pi / 4)
+        second_instruction = iSwapGate()
+        third_instruction = Measure()
+        insert_instructions(circuit, [
+            (third_instruction, (0,), (circuit.clbits[1],), 4),
+            (first_instruction, (0,), (), 1),
+            (second_instruction, (circuit.qubits[0], circuit.qubits[2]), (), 1),
+        ])
+        assert [instruction.operation for instruction in circuit.data] == [
+            original_data[0].operation, first_instruction, second_instruction, original_data[1].operation,
+            original_data[2].operation, original_data[3].operation, third_instruction
+        ]
+        assert circuit.data[6].clbits == (circuit.clbits[1],)
+
+    def test_insert_instructions_matches_insert_instruction(self):
+        circuit = self._prepare_circuit()
+        expected_circuit = self._prepare_circuit()
+        instructions = [(RGate(pi / 2, pi / 4), (index % 3,), (), index) for index in (0, 2, 2, 4)]
+        insert_instructions(circuit, instructions)
+        for offset, (instruction, qubits, clbits, index) in enumerate(instructions):
+            insert_instruction(expected_circuit, instruction, qubits, clbits, index + offset)
+        assert circuit == expected_circuit
+
+    def test_insert_instructions_when_not_in_place(self):
+        circuit = self._prepare_circuit()
+        new_circuit = insert_instructions(circuit, [(RGate(pi / 2, pi / 4), (0,), (), 4)], in_place=False)
+        assert len(circuit.data) == 4
+        assert len(new_circuit.data) == 5
+
+    def test_insert_instructions_does_not_modify_circuit_when_any_instruction_is_invalid(self):
+        circuit = self._prepare_circuit()
+        with raises(IndexError):
+            insert_instructions(circuit, [(RGate(pi / 2, pi / 4), (0,), (), 1), (RGate(pi / 2, pi / 4), (0,), (), 10)])
+        assert len(circuit.data) == 4
+
+    def test_insert_instructions_registers_parameters(self):
+        circuit = self._prepare_circuit()
+        theta = Parameter("theta")
+        insert_instructions(circuit, [(RGate(theta, pi / 4), (1,), (), 2)])
+        assert circuit.parameters == {theta}
+        bound_circuit = circuit.assign_parameters({theta: pi})
+        assert bound_circuit.data[2].operation.params[0] == pi
+
+    def test_insert_with_shared_data_matches_copy(self):
+        circuit = self._prepare_circuit()
+        expected_circuit = insert_instruction(circuit, Measure(), (2,), (1,), 2, in_place=False)
+        shared_circuit = insert_instruction(circuit, Measure(), (2,), (1,), 2, in_place=False, share_data=True)
+        assert len(shared_circuit) == 5
+        assert shared_circuit == expected_circuit
+        assert len(circuit.data) == 4
+
+    def test_insert_with_shared_data_assigns_parameters_independently(self):
+        circuit = self._prepare_circuit()
+        theta, phi = Parameter("theta"), Parameter("phi")
+        circuit.rz(theta, 0)
+        shared_circuit = insert_instruction(circuit, RGate(phi, 0), (1,), (), 0, in_place=False, share_data=True)
+        assert shared_circuit.parameters == {phi, theta}
+        shared_circuit.assign_parameters({theta: pi, phi: pi / 2}, inplace=True)
+        assert shared_circuit.data[5].operation.params[0] == pi
+        assert shared_circuit.data[0].operation.params[0] == pi / 2
+        assert circuit.parameters == {theta}
+
+    def test_insert_with_shared_data_is_not_affected_by_later_changes_of_circuit(self):
+        circuit = self._prepare_circuit()
+        shared_circuit = insert_instruction(circuit, Measure(), (2,), (1,), -1, in_place=False, share_data=True)
+        circuit.x(1)
+        insert_instruction(circuit, Measure(), (0,), (0,), 0)
+        next_shared_circuit = insert_instruction(circuit, Measure(), (2,), (1,), 0, in_place=False, share_data=True)
+        assert [instruction.operation.name for instruction in shared_circuit.data] == \
+               ['h', 'cx', 'ccx', 'measure', 'measure']
+        assert [instruction.operation.name for instruction in next_shared_circuit.data] == \
+               ['measure', 'measure', 'h', 'cx', 'ccx', 'measure', 'x']
+
+    def test_insert_with_shared_data_sees_circuit_changed_without_changing_its_length(self):
+        circuit = self._prepare_circuit()
+        insert_instruction(circuit, Measure(), (2,), (1,), 0, in_place=False, share_data=True)
+        circuit.data.pop()
+        circuit.z(1)
+        circuit.data[0] = CircuitInstruction(XGate(), (circuit.qubits[0],))
+        shared_circuit = insert_instruction(circuit, Measure(), (2,), (1,), 0, in_place=False, share_data=True)
+        assert [instruction.operation.name for instruction in shared_circuit.data] == \
+               ['measure', 'x', 'cx', 'ccx', 'z']
+
+    def test_insert_with_shared_data_matches_copy_when_index_negative(self):
+        circuit = self._prepare_circuit()
+        for index in (-1, -3, -10):
+            expected_circuit = insert_instruction(circuit, XGate(), (0,), (), index, in_place=False)
+            shared_circuit = insert_instruction(circuit, XGate(), (0,), (), index, in_place=False, share_data=True)
+            assert shared_circuit == expected_circuit
+        assert [instruction.operation.name for instruction in expected_circuit.data] == \
+               ['x', 'h', 'cx', 'ccx', 'measure']
+        assert [instruction.operation.name for instruction in
+                insert_instruction(circuit, XGate(), (0,), (), -1, in_place=False).data] == \
+               ['h', 'cx', 'ccx', 'x', 'measure']
+
+    def test_insert_into_many_matches_insert_instruction(self):
+        circuits = [self._prepare_circuit(), self._prepare_circuit(), QuantumCircuit(QuantumRegister(3), ClassicalRegister(2))]
+        circuits[1].h(2)
+        circuits[2].x(1)
+        expected_circuits = [
+            insert_instruction(circuit, Measure(), (2,), (1,), 1, in_place=False) for circuit in circuits
+        ]
+        new_circuits = insert_into_many(circuits, Measure(), (2,), (1,), 1, in_place=False)
+        shared_circuits = insert_into_many(circuits, Measure(), (2,), (1,), 1, in_place=False, share_data=True)
+        circuits_with_same_registers = insert_into_many(
+            circuits[:2], Measure(), (circuits[0].qubits[2],), (circuits[0].clbits[1],), 1, in_place=False)
+        assert new_circuits == expected_circuits
+        assert circuits_with_same_registers == expected_circuits[:2]
+        assert shared_circuits == expected_circuits
+        assert insert_into_many(circuits, Measure(), (2,), (1,), 1) == expected_circuits
+        assert circuits == expected_circuits
+
+    def test_insert_into_many_does_not_modify_circuits_when_index_out_of_range(self):
+        circuits = [self._prepare_circuit(), self._prepare_circuit(), QuantumCircuit(3, 2)]
+        with raises(IndexError):
+            insert_into_many(circuits, Measure(), (0,), (0,), 3)
+        assert [len(circuit.data) for circuit in circuits] == [4, 4, 0]
+
+    def test_insert_into_many_raises_circuit_error_when_missing_qubits(self):
+        circuits = [self._prepare_circuit(), QuantumCircuit(QuantumRegister(3, "r"), ClassicalRegister(2))]
+        with raises(CircuitError):
+            insert_into_many(circuits, Measure(), (circuits[0].qubits[0],), (0,), 0)
+
+    def test_insert_through_public_data_matches_direct_insert(self):
+        circuit = self._prepare_circuit()
+        theta = Parameter("theta")
+        instructions = [(RGate(theta, pi), (0,), (), 1), (XGate(), (2,), (), -1), (Measure(), (2,), (1,), 4)]
+        expected_circuits = [
+            insert_instructions(circuit, instructions, in_place=False),
+            insert_instruction(circuit, XGate(), (1,), (), -2, in_place=False),
+            insert_into_many([circuit], RGate(theta, pi), (1,), (), -1, in_place=False)[0],
+        ]
+        enhanced_circuit = QuantumCircuitEnhanced(3, 2)
+        enhanced_circuit.compose(circuit, inplace=True)
+        with patch("qiskit_utils.insert.HAS_LIST_DATA", False), \
+                patch("qiskit_utils.enhanced_circuit.HAS_LIST_DATA", False):
+            new_circuits = [
+                insert_instructions(circuit, instructions, in_place=False),
+                insert_instruction(circuit, XGate(), (1,), (), -2, in_place=False, share_data=True),
+                insert_into_many([circuit], RGate(theta, pi), (1,), (), -1, in_place=False, share_data=True)[0],
+            ]
+            with enhanced_circuit.editing():
+                enhanced_circuit.insert(XGate(), (1,), (), -2)
+        assert new_circuits == expected_circuits
+        assert all(type(new_circuit) is QuantumCircuit for new_circuit in new_circuits)
+        assert new_circuits[0].parameters == {theta}
+        assert enhanced_circuit == expected_circuits[1]
+
     @staticmethod
     def _prepare_circuit() -> QuantumCircuit:
         circuit = QuantumCircuit(3, 2)
@@ -0,0 +1,37 @@
+import random
+from unittest import TestCase
+from unittest.mock import patch
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import CircuitInstruction
+from qiskit.circuit.library import CXGate, HGate, XGate
+
+from qiskit_utils.instruction_index import InstructionIndex
+
+
+class TestInstructionIndex(TestCase):
+    def test_find_matches_scan_after_inserts_and_appends(self):
+        circuit = QuantumCircuit(4)
+        operations = [(HGate(), 1), (XGate(), 1), (CXGate(), 2)]
+        generator = random.Random(7)
+        data = []
+        with patch.object(InstructionIndex, "_MAX_BLOCK_SIZE", 8):
+            index = InstructionIndex([])
+            for _ in range(300):
+                operation, num_qubits = generator.choice(operations)
+                qubits = tuple(generator.sample(circuit.qubits, num_qubits))
+                circuit_instruction = CircuitInstruction(operation, qubits, ())
+                position = generator.choice([len(data), generator.randint(0, len(data)), 0])
+                data.insert(position, circuit_instruction)
+                if position == len(data) - 1 and generator.random() < 0.5:
+                    index.append(circuit_instruction)
+                else:
+                    index.insert(position, circuit_instruction)
+
+                name, qubit = generator.choice([None, "h", "x", "cx"]), generator.choice([None, *circuit.qubits])
+                assert index.find(name, qubit) == [
+                    position for position, instruction in enumerate(data)
+                    if name in (None, instruction.operation.name) and (qubit is None or qubit in instruction.qubits)
+                ]
+        assert index.size == 300
+        assert index.find(qubit=circuit.qubits[0]) == InstructionIndex(data).find(qubit=circuit.qubits[0])
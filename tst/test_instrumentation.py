@@ -0,0 +1,103 @@
+from math import pi
+from unittest import TestCase
+
+from qiskit import QuantumCircuit, Aer, transpile
+from qiskit.circuit.library import RGate
+from qiskit.result import Result
+
+from qiskit_utils import instrumentation, insert_instruction, parse_counts, parse_result, QuantumCircuitEnhanced
+from qiskit_utils.measurement_plan import MeasurementPlan
+
+
+class TestInstrumentation(TestCase):
+    def setUp(self):
+        instrumentation.reset_stats()
+        MeasurementPlan.cache_clear()
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset_stats()
+
+    def test_nothing_is_recorded_when_disabled(self):
+        events = []
+        instrumentation.add_hook(events.append)
+        try:
+            qc = self._prepare_circuit()
+            parse_result(self._get_counts(qc), qc)
+        finally:
+            instrumentation.remove_hook(events.append)
+        assert events == []
+        assert instrumentation.get_stats().functions == {}
+
+    def test_parse_functions_record_phases_and_counters(self):
+        qc = self._prepare_circuit()
+        result = self._get_counts(qc)
+        events = []
+        instrumentation.enable()
+        instrumentation.add_hook(events.append)
+        try:
+            parse_result(result, qc)
+            parse_counts(result, qc, raw_counts=True)
+            parse_counts(result, qc, as_array=True)
+        finally:
+            instrumentation.remove_hook(events.append)
+
+        assert [event.name for event in events] == ["parse_result", "parse_counts", "parse_counts"]
+        assert set(events[0].phases) == {"plan", "counts", "parse"}
+        assert events[0].counters == {"plan_cache_misses": 1, "outcomes": 1, "qubits": 3}
+        assert events[1].counters == {"plan_cache_hits": 1, "outcomes": 1, "qubits": 3}
+
+        stats = instrumentation.get_stats()
+        assert stats.functions["parse_result"].calls == 1
+        assert stats.functions["parse_counts"].calls == 2
+        assert stats.functions["parse_counts"].counters["plan_cache_hits"] == 2
+        assert stats.functions["parse_counts"].total_time >= stats.functions["parse_counts"].phases["parse"]
+        assert stats.plan_cache_hit_rate == 2 / 3
+
+    def test_plan_cache_is_counted_only_while_enabled(self):
+        qc = self._prepare_circuit()
+        result = self._get_counts(qc)
+        parse_result(result, qc)
+        instrumentation.enable()
+        parse_counts(result, qc)
+        parse_counts(result, qc)
+        instrumentation.disable()
+        parse_counts(result, qc)
+        assert instrumentation.get_stats().plan_cache[:2] == (2, 0)
+
+        instrumentation.reset_stats()
+        assert instrumentation.get_stats().plan_cache[:2] == (0, 0)
+        instrumentation.enable()
+        parse_result(result, qc)
+        assert instrumentation.get_stats().plan_cache[:2] == (1, 0)
+        assert instrumentation.get_stats().plan_cache_hit_rate == 1.0
+
+    def test_insert_functions_are_recorded(self):
+        instrumentation.enable()
+        circuit = QuantumCircuitEnhanced(2)
+        circuit.h(0)
+        circuit.h(1)
+        insert_instruction(circuit, RGate(pi, pi), [0], [], 1, in_place=False)
+        circuit.insert(RGate(pi, pi), [1], [], 0)
+        with circuit.editing():
+            circuit.insert(RGate(pi, pi), [1], [], 0)
+
+        functions = instrumentation.get_stats().functions
+        assert functions["insert_instruction"].calls == 2
+        assert set(functions["insert_instruction"].phases) == {"copy", "validate", "insert"}
+        assert functions["QuantumCircuitEnhanced.insert"].calls == 2
+        assert functions["QuantumCircuitEnhanced.insert"].counters == {"buffered_inserts": 1}
+
+    @staticmethod
+    def _prepare_circuit() -> QuantumCircuit:
+        qc = QuantumCircuit(3, 2)
+        qc.x(0)
+        qc.measure(0, 1)
+        qc.measure(2, 0)
+        return qc
+
+    @staticmethod
+    def _get_counts(circuit: QuantumCircuit) -> Result:
+        backend = Aer.get_backend("aer_simulator")
+        transpiled_circuit = transpile(circuit, backend)
+        return backend.run(transpiled_circuit).result()
@@ -0,0 +1,36 @@
+import subprocess
+import sys
+from unittest import TestCase
+
+from pytest import raises
+
+import qiskit_utils
+
+
+class TestLazyImport(TestCase):
+    def test_import_does_not_import_qiskit(self):
+        statement = "import sys, qiskit_utils; print(sorted(m for m in sys.modules if m.startswith(('qiskit', 'numpy'))))"
+        output = subprocess.run([sys.executable, "-c", statement], check=True, capture_output=True, text=True)
+        assert output.stdout.strip() == "['qiskit_utils']"
+
+    def test_public_names_are_resolved(self):
+        for name in qiskit_utils.__all__:
+            assert getattr(qiskit_utils, name).__name__ == name
+        assert set(qiskit_utils.__all__) <= set(dir(qiskit_utils))
+
+    def test_functions_are_not_replaced_by_submodules_with_the_same_name(self):
+        import qiskit_utils.parse_result
+        import qiskit_utils.parse_counts
+        from qiskit_utils import parse_result, parse_counts
+        assert callable(parse_result)
+        assert callable(parse_counts)
+
+    def test_submodules_are_accessible_as_attributes(self):
+        statement = "import qiskit_utils; print(qiskit_utils.insert.__name__, qiskit_utils.enhanced_circuit.__name__)"
+        output = subprocess.run([sys.executable, "-c", statement], check=True, capture_output=True, text=True)
+        assert output.stdout.strip() == "qiskit_utils.insert qiskit_utils.enhanced_circuit"
+        assert callable(qiskit_utils.insert.insert_instruction)
+
+    def test_unknown_attribute_raises_attribute_error(self):
+        with raises(AttributeError):
+            qiskit_utils.not_a_function
@@ -0,0 +1,105 @@
+from unittest import TestCase
+
+from qiskit import QuantumCircuit, Aer, transpile, QuantumRegister, ClassicalRegister
+from qiskit.circuit import Measure
+from qiskit.result import Result
+from pytest import raises
+
+from qiskit_utils import MeasurementPlan, insert_instruction, parse_counts, parse_result
+
+
+class TestMeasurementPlan(TestCase):
+    def setUp(self):
+        MeasurementPlan.cache_clear()
+        MeasurementPlan.set_cache_size(128)
+
+    def test_plan_maps_qubits_to_state_indices(self):
+        qc = self._prepare_circuit()
+        plan = MeasurementPlan.from_circuit(qc)
+        assert plan.qubit_clbit_mapping == [None, 4, 3, 2, 1, 0]
+        assert plan.num_clbits == 6
+
+    def test_plan_is_shared_between_circuits_with_same_structure(self):
+        plan = MeasurementPlan.from_circuit(self._prepare_circuit())
+        other_plan = MeasurementPlan.from_circuit(self._prepare_circuit())
+        assert plan is other_plan
+        assert MeasurementPlan.cache_info().hits == 1
+        assert MeasurementPlan.cache_info().misses == 1
+
+    def test_plan_differs_when_measurements_differ(self):
+        qc = self._prepare_circuit()
+        other_qc = self._prepare_circuit()
+        other_qc.measure(0, 0)
+        assert MeasurementPlan.from_circuit(qc) is not MeasurementPlan.from_circuit(other_qc)
+
+    def test_plan_changes_when_last_instruction_of_circuit_is_replaced(self):
+        qc = self._prepare_circuit()
+        plan = MeasurementPlan.from_circuit(qc)
+        qc.data.pop()
+        qc.measure(0, 0)
+        assert MeasurementPlan.from_circuit(qc).qubit_clbit_mapping == [5, 4, 3, 2, 1, None]
+        qc.measure(5, 5)
+        assert MeasurementPlan.from_circuit(qc).qubit_clbit_mapping == [5, 4, 3, 2, 1, 0]
+        qc.data = []
+        assert MeasurementPlan.from_circuit(qc).qubit_clbit_mapping == [None] * 6
+        assert plan.qubit_clbit_mapping == [None, 4, 3, 2, 1, 0]
+
+    def test_plan_changes_when_instruction_in_the_middle_is_replaced(self):
+        qc = QuantumCircuit(2, 2)
+        qc.h(0)
+        qc.measure(0, 0)
+        qc.x(1)
+        assert MeasurementPlan.from_circuit(qc).qubit_clbit_mapping == [1, None]
+        del qc.data[0]
+        insert_instruction(qc, Measure(), [1], [1], 0)
+        assert MeasurementPlan.from_circuit(qc).qubit_clbit_mapping == [1, 0]
+        qc.data[0] = qc.data[1]
+        assert MeasurementPlan.from_circuit(qc).qubit_clbit_mapping == [1, None]
+
+    def test_least_recently_used_plan_is_evicted(self):
+        MeasurementPlan.set_cache_size(2)
+        circuits = [QuantumCircuit(size, size) for size in range(1, 4)]
+        first_plan = MeasurementPlan.from_circuit(circuits[0])
+        MeasurementPlan.from_circuit(circuits[1])
+        MeasurementPlan.from_circuit(circuits[0])
+        MeasurementPlan.from_circuit(circuits[2])
+        assert MeasurementPlan.cache_info().currsize == 2
+        assert MeasurementPlan.from_circuit(circuits[0]) is first_plan
+        assert MeasurementPlan.cache_info().misses == 3
+
+    def test_plan_is_accepted_by_parse_result_and_parse_counts(self):
+        qc = self._prepare_circuit()
+        plan = MeasurementPlan.from_circuit(qc)
+        result = self._get_counts(qc)
+        assert parse_counts(result, qc, measurement_plan=plan) == {"-01101": 1024}
+        assert parse_result(result, qc, measurement_plan=plan) == parse_result(result, qc)
+
+    def test_parse_raises_value_error_when_plan_does_not_match_circuit(self):
+        qc = self._prepare_circuit()
+        plan = MeasurementPlan.from_circuit(QuantumCircuit(2, 2))
+        with raises(ValueError):
+            parse_counts(self._get_counts(qc), qc, measurement_plan=plan)
+
+    @staticmethod
+    def _prepare_circuit() -> QuantumCircuit:
+        qr1, qr2, qr3 = QuantumRegister(1), QuantumRegister(2), QuantumRegister(3)
+        cr1, cr2, cr3 = ClassicalRegister(1), ClassicalRegister(2), ClassicalRegister(3)
+        qc = QuantumCircuit(qr1, cr1, qr2, cr2, qr3, cr3)
+
+        qc.x(qr2[1])
+        qc.x(qr3[0])
+        qc.x(qr3[2])
+
+        qc.measure(qr2[0], cr2[0])
+        qc.measure(qr2[1], cr2[1])
+
+        qc.measure(qr3[0], cr3[0])
+        qc.measure(qr3[1], cr3[1])
+        qc.measure(qr3[2], cr3[2])
+        return qc
+
+    @staticmethod
+    def _get_counts(circuit: QuantumCircuit) -> Result:
+        backend = Aer.get_backend("aer_simulator")
+        transpiled_circuit = transpile(circuit, backend)
+        return backend.run(transpiled_circuit).result()
@@ -0,0 +1,76 @@
+from unittest import TestCase
+
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.result import Result
+from pytest import approx, raises
+
+from qiskit_utils import parse_counts, parse_result
+
+A0 = np.array([[0.9, 0.2], [0.1, 0.8]])
+A1 = np.array([[0.95, 0.05], [0.05, 0.95]])
+
+
+class TestMitigation(TestCase):
+    def test_parse_result_corrects_marginals(self):
+        qc, result = self._prepare_noisy_result()
+        for raw_counts in (False, True):
+            marginals = parse_result(result, qc, assignment_matrices={0: A0, 1: A1}, raw_counts=raw_counts)
+            assert marginals[0] == {'0': approx(0.0, abs=1e-9), '1': approx(1000.0)}
+            assert marginals[1] == {'0': approx(1000.0), '1': approx(0.0, abs=1e-9)}
+            assert marginals[2] == {'0': 1000.0, '1': 0.0}
+
+    def test_parse_result_corrects_marginals_of_blocks_and_qubit_keys(self):
+        qc, result = self._prepare_noisy_result()
+        marginals = parse_result(
+            result, qc, assignment_matrices={(qc.qubits[0], 1): np.kron(A0, A1)}, indexed_results=False)
+        assert marginals[qc.qubits[0]] == {'0': approx(0.0, abs=1e-9), '1': approx(1000.0)}
+        assert marginals[qc.qubits[1]] == {'0': approx(1000.0), '1': approx(0.0, abs=1e-9)}
+
+    def test_parse_counts_applies_tensored_inverse(self):
+        qc, result = self._prepare_noisy_result()
+        expected = np.zeros(8)
+        expected[0b100] = 1000
+        for assignment_matrices in ({0: A0, 1: A1}, {(0, 1): np.kron(A0, A1)}, {(1, 0): np.kron(A1, A0)}):
+            histogram = parse_counts(result, qc, as_array=True, assignment_matrices=assignment_matrices)
+            assert histogram == approx(expected, abs=1e-9)
+            counts = parse_counts(result, qc, assignment_matrices=assignment_matrices)
+            assert {state: count for state, count in counts.items() if abs(count) > 1e-9} == {"100": approx(1000.0)}
+
+    def test_parse_counts_without_matrices_of_some_qubits(self):
+        qc, result = self._prepare_noisy_result()
+        counts = parse_counts(result, qc, assignment_matrices={1: A1})
+        counts = {state: count for state, count in counts.items() if abs(count) > 1e-9}
+        assert counts == {"000": approx(200.0), "100": approx(800.0)}
+
+    def test_invalid_assignment_matrices_raise_value_error(self):
+        qc, result = self._prepare_noisy_result()
+        for assignment_matrices in ({0: A0, (0, 1): np.kron(A0, A1)}, {0: np.eye(4)}, {(1, 1): np.eye(4)}):
+            with raises(ValueError):
+                parse_counts(result, qc, assignment_matrices=assignment_matrices)
+
+    def test_not_measured_qubit_raises_value_error(self):
+        qc = QuantumCircuit(2, 1)
+        qc.measure(0, 0)
+        result = self._make_result(qc, {"0x0": 10})
+        with raises(ValueError):
+            parse_result(result, qc, assignment_matrices={1: A1})
+
+    def _prepare_noisy_result(self):
+        qc = QuantumCircuit(3, 3)
+        qc.measure(range(3), range(3))
+        # qubit 0 prepared in 1, qubits 1 and 2 in 0, readout of qubits 0 and 1 has errors given by A0 and A1
+        return qc, self._make_result(qc, {"0x0": 190, "0x1": 760, "0x2": 10, "0x3": 40})
+
+    @staticmethod
+    def _make_result(circuit: QuantumCircuit, counts) -> Result:
+        return Result.from_dict({
+            "backend_name": "test", "backend_version": "0.0.0", "qobj_id": "0", "job_id": "0", "success": True,
+            "results": [{
+                "shots": sum(counts.values()), "success": True, "data": {"counts": counts},
+                "header": {
+                    "creg_sizes": [[creg.name, creg.size] for creg in circuit.cregs],
+                    "memory_slots": circuit.num_clbits,
+                },
+            }],
+        })
@@ -0,0 +1,74 @@
+from unittest import TestCase
+
+from qiskit import QuantumCircuit, Aer, transpile, QuantumRegister, ClassicalRegister
+from qiskit.result import Result
+from pytest import raises
+
+from qiskit_utils import parse_all, parse_counts, parse_result
+
+
+class TestParseAll(TestCase):
+    def test_parse_all_views(self):
+        qc = QuantumCircuit(3, 2)
+        qc.x(0)
+        qc.measure(0, 0)
+        qc.measure(1, 1)
+        result = self._get_counts(qc)
+        parsed_views = parse_all(result, qc, parity_subsets=[(0,), (0, 1), (1,)])
+        assert parsed_views == {
+            "marginals": {0: {'0': 0, '1': 1024}, 1: {'0': 1024, '1': 0}},
+            "counts": {"10-": 1024},
+            "parities": {(0,): {'0': 0, '1': 1024}, (0, 1): {'0': 0, '1': 1024}, (1,): {'0': 1024, '1': 0}},
+        }
+
+    def test_parse_all_only_requested_views(self):
+        qc = QuantumCircuit(1, 1)
+        qc.measure(0, 0)
+        result = self._get_counts(qc)
+        assert parse_all(result, qc, marginals=False) == {"counts": {"0": 1024}}
+        assert parse_all(result, qc, counts=False, indexed_results=False) == {
+            "marginals": {qc.qubits[0]: {'0': 1024, '1': 0}}
+        }
+
+    def test_parse_all_matches_parse_result_and_parse_counts_for_many_states(self):
+        qc = self._prepare_circuit()
+        result = self._get_counts(qc)
+        for raw_counts in (False, True):
+            parsed_views = parse_all(result, qc, parity_subsets=[(0, 2, 4)], raw_counts=raw_counts)
+            assert parsed_views["marginals"] == parse_result(result, qc)
+            assert parsed_views["counts"] == parse_counts(result, qc)
+
+        odd = sum(
+            count for state, count in parse_counts(result, qc).items()
+            if (int(state[0]) + int(state[2]) + int(state[4])) % 2
+        )
+        assert parsed_views["parities"][(0, 2, 4)] == {'0': 1024 - odd, '1': odd}
+
+    def test_parse_all_raises_value_error_when_parity_of_not_measured_qubit(self):
+        qc = self._prepare_circuit()
+        result = self._get_counts(qc)
+        with raises(ValueError):
+            parse_all(result, qc, parity_subsets=[(0, 5)])
+
+    @staticmethod
+    def _prepare_circuit() -> QuantumCircuit:
+        qr1, qr2 = QuantumRegister(3), QuantumRegister(3)
+        cr1, cr2 = ClassicalRegister(2), ClassicalRegister(3)
+        qc = QuantumCircuit(qr1, cr1, qr2, cr2)
+
+        qc.h(qr1)
+        qc.h(qr2)
+        qc.cx(qr1[0], qr2[1])
+
+        qc.measure(qr1[0], cr2[2])
+        qc.measure(qr1[2], cr1[0])
+        qc.measure(qr2[0], cr2[0])
+        qc.measure(qr2[1], cr1[1])
+        qc.measure(qr1[1], cr2[1])
+        return qc
+
+    @staticmethod
+    def _get_counts(circuit: QuantumCircuit) -> Result:
+        backend = Aer.get_backend("aer_simulator")
+        transpiled_circuit = transpile(circuit, backend)
+        return backend.run(transpiled_circuit).result()
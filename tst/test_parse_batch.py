@@ -0,0 +1,82 @@
+from unittest import TestCase
+
+from qiskit import QuantumCircuit, Aer, transpile, QuantumRegister, ClassicalRegister
+from qiskit.result import Result
+from pytest import raises
+
+from qiskit_utils import parse_counts_batch, parse_results_batch
+
+
+class TestParseBatch(TestCase):
+    def test_parse_results_batch(self):
+        circuits = self._prepare_circuits()
+        result = self._get_counts(circuits)
+        parsed_results = parse_results_batch(result, circuits)
+        assert parsed_results == [
+            {0: {'0': 0, '1': 1024}, 1: {'0': 1024, '1': 0}},
+            {0: {'0': 1024, '1': 0}, 1: {'0': 0, '1': 1024}},
+            {0: {'0': 1024, '1': 0}, 1: {'0': 0, '1': 1024}, 2: {'0': 1024, '1': 0}, 3: {'0': 0, '1': 1024}},
+        ]
+
+    def test_parse_counts_batch(self):
+        circuits = self._prepare_circuits()
+        result = self._get_counts(circuits)
+        assert parse_counts_batch(result, circuits) == [{"10-": 1024}, {"01-": 1024}, {"0101": 1024}]
+
+    def test_parse_batch_in_thread_pool(self):
+        circuits = self._prepare_circuits() * 3
+        result = self._get_counts(circuits)
+        assert parse_counts_batch(result, circuits, workers=4, use_processes=False) == parse_counts_batch(
+            result, circuits)
+        assert parse_results_batch(
+            result, circuits, workers=4, vectorized=True, use_processes=False) == parse_results_batch(result, circuits)
+
+    def test_parse_batch_in_process_pool(self):
+        circuits = self._prepare_circuits() * 3
+        result = self._get_counts(circuits)
+        assert parse_counts_batch(result, circuits, workers=2) == parse_counts_batch(result, circuits)
+        assert parse_results_batch(result, circuits, workers=2) == parse_results_batch(result, circuits)
+
+    def test_parse_results_batch_when_indexed_results_false(self):
+        circuits = self._prepare_circuits()
+        result = self._get_counts(circuits)
+        parsed_results = parse_results_batch(result, circuits, indexed_results=False, workers=2)
+        assert parsed_results[2] == {
+            circuits[2].qubits[0]: {'0': 1024, '1': 0},
+            circuits[2].qubits[1]: {'0': 0, '1': 1024},
+            circuits[2].qubits[2]: {'0': 1024, '1': 0},
+            circuits[2].qubits[3]: {'0': 0, '1': 1024},
+        }
+
+    def test_parse_batch_raises_value_error_when_circuits_do_not_match_experiments(self):
+        circuits = self._prepare_circuits()
+        result = self._get_counts(circuits)
+        with raises(ValueError):
+            parse_counts_batch(result, circuits[:2])
+
+    @staticmethod
+    def _prepare_circuits() -> list:
+        first_qc = QuantumCircuit(3, 2)
+        first_qc.x(0)
+        first_qc.measure(0, 0)
+        first_qc.measure(1, 1)
+
+        second_qc = QuantumCircuit(3, 2)
+        second_qc.x(1)
+        second_qc.measure(0, 0)
+        second_qc.measure(1, 1)
+
+        qr1, qr2 = QuantumRegister(2), QuantumRegister(2)
+        cr1, cr2 = ClassicalRegister(2), ClassicalRegister(2)
+        third_qc = QuantumCircuit(qr1, cr1, qr2, cr2)
+        third_qc.x(qr1[1])
+        third_qc.x(qr2[1])
+        third_qc.measure(qr1, cr1)
+        third_qc.measure(qr2, cr2)
+        return [first_qc, second_qc, third_qc]
+
+    @staticmethod
+    def _get_counts(circuits: list) -> Result:
+        backend = Aer.get_backend("aer_simulator")
+        transpiled_circuits = transpile(circuits, backend)
+        return backend.run(transpiled_circuits).result()
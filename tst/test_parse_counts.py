@@ -2,8 +2,11 @@ from unittest import TestCase
 
 from qiskit import QuantumCircuit, Aer, transpile, QuantumRegister, ClassicalRegister
 from qiskit.result import Result
+from pytest import raises
+import numpy as np
 
-from qiskit_utils.parse_counts import parse_counts
+from qiskit_utils.measurement_plan import MeasurementPlan
+from qiskit_utils.parse_counts import parse_counts, parse_counts_array
 
 
 class TestParseCounts(TestCase):
@@ -115,6 +118,95 @@ class TestParseCounts(TestCase):
         assert parsed_counts == {"010101": 1024}
 
 
+    def test_parse_3_registers_when_raw_counts(self):
+        qr1, qr2, qr3 = QuantumRegister(1), QuantumRegister(2), QuantumRegister(3)
+        cr1, cr2, cr3 = ClassicalRegister(1), ClassicalRegister(2), ClassicalRegister(3)
+        qc = QuantumCircuit(qr1, cr1, qr2, cr2, qr3, cr3)
+
+        qc.x(qr2[1])
+        qc.x(qr3[0])
+        qc.x(qr3[2])
+
+        qc.measure(qr2[0], cr2[0])
+        qc.measure(qr2[1], cr2[1])
+
+        qc.measure(qr3[0], cr3[0])
+        qc.measure(qr3[1], cr3[1])
+        qc.measure(qr3[2], cr3[2])
+
+        result = self._get_counts(qc)
+        parsed_counts = parse_counts(result, qc, raw_counts=True)
+        assert parsed_counts == {"-01101": 1024}
+
+    def test_parse_when_raw_counts_matches_default_for_many_states(self):
+        qr1, qr2 = QuantumRegister(3), QuantumRegister(3)
+        cr1, cr2 = ClassicalRegister(2), ClassicalRegister(3)
+        qc = QuantumCircuit(qr1, cr1, qr2, cr2)
+
+        qc.h(qr1)
+        qc.h(qr2)
+        qc.cx(qr1[0], qr2[1])
+
+        qc.measure(qr1[0], cr2[2])
+        qc.measure(qr1[2], cr1[0])
+        qc.measure(qr2[0], cr2[0])
+        qc.measure(qr2[1], cr1[1])
+
+        result = self._get_counts(qc)
+        assert parse_counts(result, qc, raw_counts=True) == parse_counts(result, qc)
+
+    def test_parse_when_raw_counts_and_header_without_memory_slots(self):
+        qc = QuantumCircuit(3, 3)
+        qc.measure(range(3), range(3))
+        result = Result.from_dict({
+            "backend_name": "test", "backend_version": "1.0", "qobj_id": "0", "job_id": "0", "success": True,
+            "results": [{"shots": 15, "success": True, "header": {}, "data": {"counts": {"0x0": 10, "0x1": 5}}}],
+        })
+        assert parse_counts(result, qc, raw_counts=True) == {"000": 10, "100": 5}
+        assert parse_counts(result, qc, raw_counts=True, as_array=True).tolist() == [10, 0, 0, 0, 5, 0, 0, 0]
+
+    def test_parse_as_array_matches_dictionary(self):
+        qr1, qr2 = QuantumRegister(3), QuantumRegister(3)
+        cr1, cr2 = ClassicalRegister(2), ClassicalRegister(3)
+        qc = QuantumCircuit(qr1, cr1, qr2, cr2)
+
+        qc.h(qr1)
+        qc.h(qr2)
+        qc.cx(qr1[0], qr2[1])
+
+        qc.measure(qr1[0], cr2[2])
+        qc.measure(qr1[2], cr1[0])
+        qc.measure(qr2[0], cr2[0])
+        qc.measure(qr2[1], cr1[1])
+
+        result = self._get_counts(qc)
+        expected = np.zeros(16, dtype=np.int64)
+        for state, count in parse_counts(result, qc).items():
+            expected[int(state.replace('-', ''), 2)] += count
+        for raw_counts in (False, True):
+            histogram = parse_counts(result, qc, raw_counts=raw_counts, as_array=True)
+            assert histogram.dtype == np.int64
+            assert histogram.tolist() == expected.tolist()
+
+    def test_parse_counts_array_sparse_for_wide_circuits(self):
+        qc = QuantumCircuit(31, 30)
+        qc.measure(range(1, 31), range(30))
+        plan = MeasurementPlan.from_circuit(qc)
+        bit_matrix = np.zeros((3, 30), dtype=np.uint8)
+        bit_matrix[0, 29] = 1  # clbit 0 - qubit 1, the most significant measured qubit
+        bit_matrix[2, 0] = 1  # clbit 29 - qubit 30, the least significant measured qubit
+        weights = np.array([5, 7, 11], dtype=np.int64)
+        states, counts = parse_counts_array(bit_matrix, weights, plan)
+        assert states.tolist() == [0, 1, 1 << 29]
+        assert counts.tolist() == [7, 11, 5]
+
+    def test_parse_counts_array_raises_value_error_when_too_many_qubits_measured(self):
+        qc = QuantumCircuit(64, 64)
+        qc.measure(range(64), range(64))
+        plan = MeasurementPlan.from_circuit(qc)
+        with raises(ValueError):
+            parse_counts_array(np.zeros((1, 64), dtype=np.uint8), np.ones(1, dtype=np.int64), plan)
+
     @staticmethod
     def _get_counts(circuit: QuantumCircuit) -> Result:
         backend = Aer.get_backend("aer_simulator")
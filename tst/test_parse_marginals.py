@@ -0,0 +1,76 @@
+from unittest import TestCase
+
+import numpy as np
+
+from qiskit import QuantumCircuit, Aer, transpile, QuantumRegister, ClassicalRegister
+from qiskit.result import Result
+from pytest import raises
+
+from qiskit_utils import parse_marginals, parse_counts
+from qiskit_utils.parse_marginals import _parse_subset
+
+
+class TestParseMarginals(TestCase):
+    def test_parse_marginals_of_pairs(self):
+        qc = QuantumCircuit(3, 3)
+        qc.x(0)
+        qc.measure(0, 0)
+        qc.measure(1, 1)
+        qc.measure(2, 2)
+        result = self._get_counts(qc)
+        assert parse_marginals(result, qc, subsets=[(0, 1), (1, 2), (2, 0)]) == {
+            (0, 1): {"10": 1024},
+            (1, 2): {"00": 1024},
+            (2, 0): {"01": 1024},
+        }
+
+    def test_parse_marginals_matches_aggregated_parse_counts(self):
+        qc = self._prepare_circuit()
+        result = self._get_counts(qc)
+        subsets = [(0, 3), (4, 2, 0), (1,), (0, 1, 2, 3, 4)]
+        counts = parse_counts(result, qc)
+        for raw_counts in (False, True):
+            marginals = parse_marginals(result, qc, subsets, raw_counts=raw_counts)
+            for subset in subsets:
+                expected = {}
+                for state, count in counts.items():
+                    subset_state = ''.join(state[qubit] for qubit in subset)
+                    expected[subset_state] = expected.get(subset_state, 0) + count
+                assert marginals[subset] == expected
+
+    def test_parse_subset_large_subsets_match_small_subsets(self):
+        bit_matrix = np.array([[0, 1, 1], [1, 0, 1], [0, 1, 1]], dtype=np.uint8)
+        weights = np.array([3, 4, 5], dtype=np.int64)
+        columns = [2, 0, 1] * 8
+        expected = {"101" * 8: 8, "110" * 8: 4}
+        assert _parse_subset(bit_matrix, weights, columns) == expected
+        assert _parse_subset(bit_matrix, weights, [2, 0, 1]) == {"101": 8, "110": 4}
+
+    def test_parse_marginals_raises_value_error_when_qubit_not_measured(self):
+        qc = self._prepare_circuit()
+        result = self._get_counts(qc)
+        with raises(ValueError):
+            parse_marginals(result, qc, subsets=[(0, 5)])
+
+    @staticmethod
+    def _prepare_circuit() -> QuantumCircuit:
+        qr1, qr2 = QuantumRegister(3), QuantumRegister(3)
+        cr1, cr2 = ClassicalRegister(2), ClassicalRegister(3)
+        qc = QuantumCircuit(qr1, cr1, qr2, cr2)
+
+        qc.h(qr1)
+        qc.h(qr2)
+        qc.cx(qr1[0], qr2[1])
+
+        qc.measure(qr1[0], cr2[2])
+        qc.measure(qr1[2], cr1[0])
+        qc.measure(qr2[0], cr2[0])
+        qc.measure(qr2[1], cr1[1])
+        qc.measure(qr1[1], cr2[1])
+        return qc
+
+    @staticmethod
+    def _get_counts(circuit: QuantumCircuit) -> Result:
+        backend = Aer.get_backend("aer_simulator")
+        transpiled_circuit = transpile(circuit, backend)
+        return backend.run(transpiled_circuit).result()
@@ -0,0 +1,111 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+from qiskit import QuantumCircuit, Aer, transpile, QuantumRegister, ClassicalRegister
+from qiskit.result import Result
+
+from qiskit_utils import parse_memory, parse_counts, unpack_memory
+from qiskit_utils.bit_matrix import integers_to_bit_matrix, stored_states_to_bit_matrix
+
+
+class TestParseMemory(TestCase):
+    def test_parse_one_register(self):
+        qc = QuantumCircuit(3, 2)
+        qc.x(0)
+        qc.measure(0, 0)
+        qc.measure(1, 1)
+        result = self._get_memory(qc)
+        packed_memory = parse_memory(result, qc)
+        assert packed_memory.shape == (1024, 1)
+        assert (unpack_memory(packed_memory, 3) == [1, 0, 0]).all()
+
+    def test_parse_3_registers(self):
+        qc = self._prepare_circuit()
+        result = self._get_memory(qc)
+        memory = unpack_memory(parse_memory(result, qc), qc.num_qubits)
+        assert (memory == [0, 0, 1, 1, 0, 1]).all()
+
+    def test_parse_matches_counts_for_many_states(self):
+        qr1, qr2 = QuantumRegister(5), QuantumRegister(6)
+        cr1, cr2 = ClassicalRegister(4), ClassicalRegister(7)
+        qc = QuantumCircuit(qr1, cr1, qr2, cr2)
+        qc.h(qr1)
+        qc.h(qr2)
+        qc.measure(qr1[:4], cr1)
+        qc.measure(qr2, cr2[1:])
+
+        result = self._get_memory(qc)
+        memory = unpack_memory(parse_memory(result, qc, chunk_size=100), qc.num_qubits)
+        states, counts = np.unique(memory, axis=0, return_counts=True)
+        parsed_counts = parse_counts(result, qc)
+        assert len(states) == len(parsed_counts)
+        for state, count in zip(states, counts):
+            key = ''.join(str(bit) for bit in state)
+            key = key[:4] + '-' + key[5:]
+            assert parsed_counts[key] == count
+
+    def test_parse_raw_memory(self):
+        qc = self._prepare_circuit()
+        qc.h(0)
+        qc.measure_all()
+        result = self._get_memory(qc)
+        assert (parse_memory(result, qc) == parse_memory(result, qc, raw_memory=False)).all()
+        with patch.object(Result, "get_memory", side_effect=AssertionError("memory formatted into bitstrings")):
+            parse_memory(result, qc)
+
+    def test_parse_raw_memory_in_chunks(self):
+        qr1, qr2 = QuantumRegister(5), QuantumRegister(6)
+        cr1, cr2 = ClassicalRegister(4), ClassicalRegister(7)
+        qc = QuantumCircuit(qr1, cr1, qr2, cr2)
+        qc.h(qr1)
+        qc.h(qr2)
+        qc.measure(qr1[:4], cr1)
+        qc.measure(qr2, cr2[1:])
+        result = self._get_memory(qc)
+        assert (parse_memory(result, qc, chunk_size=100) == parse_memory(result, qc, raw_memory=False)).all()
+
+    def test_stored_states_to_bit_matrix(self):
+        states = [0, 1, 0x2a, 0x1ff, 0x3ff]
+        for width in [10, 11, 12, 16]:
+            stored_states = [hex(state) for state in states]
+            assert (stored_states_to_bit_matrix(stored_states, width) == integers_to_bit_matrix(states, width)).all()
+        assert (stored_states_to_bit_matrix(["0x1FF"], 9) == 1).all()
+        assert (stored_states_to_bit_matrix(["1 01", "0 10"], 3) == [[1, 0, 1], [0, 1, 0]]).all()
+        assert stored_states_to_bit_matrix([], 5).shape == (0, 5)
+
+    def test_parse_to_memmap(self):
+        qc = self._prepare_circuit()
+        result = self._get_memory(qc)
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "memory.npy")
+            packed_memory = parse_memory(result, qc, memmap_path=path)
+            assert isinstance(packed_memory, np.memmap)
+            assert (np.load(path) == parse_memory(result, qc)).all()
+            del packed_memory
+
+    @staticmethod
+    def _prepare_circuit() -> QuantumCircuit:
+        qr1, qr2, qr3 = QuantumRegister(1), QuantumRegister(2), QuantumRegister(3)
+        cr1, cr2, cr3 = ClassicalRegister(1), ClassicalRegister(2), ClassicalRegister(3)
+        qc = QuantumCircuit(qr1, cr1, qr2, cr2, qr3, cr3)
+
+        qc.x(qr2[1])
+        qc.x(qr3[0])
+        qc.x(qr3[2])
+
+        qc.measure(qr2[0], cr2[0])
+        qc.measure(qr2[1], cr2[1])
+
+        qc.measure(qr3[0], cr3[0])
+        qc.measure(qr3[1], cr3[1])
+        qc.measure(qr3[2], cr3[2])
+        return qc
+
+    @staticmethod
+    def _get_memory(circuit: QuantumCircuit) -> Result:
+        backend = Aer.get_backend("aer_simulator")
+        transpiled_circuit = transpile(circuit, backend)
+        return backend.run(transpiled_circuit, memory=True).result()
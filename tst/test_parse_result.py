@@ -231,6 +231,69 @@ class TestParseResult(TestCase):
             qr2[0]: {'0': 1024, '1': 0},
         }
 
+    def test_parse_3_registers_when_vectorized(self):
+        qr1, qr2, qr3 = QuantumRegister(1), QuantumRegister(2), QuantumRegister(3)
+        cr1, cr2, cr3 = ClassicalRegister(1), ClassicalRegister(2), ClassicalRegister(3)
+        qc = QuantumCircuit(qr1, cr1, qr2, cr2, qr3, cr3)
+
+        qc.x(qr2[1])
+        qc.x(qr3[0])
+        qc.x(qr3[2])
+
+        qc.measure(qr2[0], cr2[0])
+        qc.measure(qr2[1], cr2[1])
+
+        qc.measure(qr3[0], cr3[0])
+        qc.measure(qr3[1], cr3[1])
+        qc.measure(qr3[2], cr3[2])
+
+        result = self._get_counts(qc)
+        parsed_counts = parse_result(result, qc, vectorized=True)
+        assert parsed_counts == {
+            1: {'0': 1024, '1': 0},
+            2: {'0': 0, '1': 1024},
+            3: {'0': 0, '1': 1024},
+            4: {'0': 1024, '1': 0},
+            5: {'0': 0, '1': 1024}
+        }
+
+    def test_parse_when_vectorized_matches_default_for_many_states(self):
+        qr1, qr2 = QuantumRegister(3), QuantumRegister(3)
+        cr1, cr2 = ClassicalRegister(2), ClassicalRegister(3)
+        qc = QuantumCircuit(qr1, cr1, qr2, cr2)
+
+        qc.h(qr1)
+        qc.h(qr2)
+        qc.cx(qr1[0], qr2[1])
+
+        qc.measure(qr1[0], cr2[2])
+        qc.measure(qr1[2], cr1[0])
+        qc.measure(qr2[0], cr2[0])
+        qc.measure(qr2[1], cr1[1])
+
+        result = self._get_counts(qc)
+        assert parse_result(result, qc, vectorized=True) == parse_result(result, qc)
+        assert parse_result(result, qc, indexed_results=False, vectorized=True) == parse_result(
+            result, qc, indexed_results=False)
+
+    def test_parse_when_raw_counts_matches_default_for_many_states(self):
+        qr1, qr2 = QuantumRegister(3), QuantumRegister(3)
+        cr1, cr2 = ClassicalRegister(2), ClassicalRegister(3)
+        qc = QuantumCircuit(qr1, cr1, qr2, cr2)
+
+        qc.h(qr1)
+        qc.h(qr2)
+        qc.cx(qr1[0], qr2[1])
+
+        qc.measure(qr1[0], cr2[2])
+        qc.measure(qr1[2], cr1[0])
+        qc.measure(qr2[0], cr2[0])
+        qc.measure(qr2[1], cr1[1])
+
+        result = self._get_counts(qc)
+        assert parse_result(result, qc, raw_counts=True) == parse_result(result, qc)
+        assert parse_result(result, qc, raw_counts=True, vectorized=True) == parse_result(result, qc)
+
     @staticmethod
     def _get_counts(circuit: QuantumCircuit) -> Result:
         backend = Aer.get_backend("aer_simulator")
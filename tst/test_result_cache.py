@@ -0,0 +1,97 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+from qiskit import QuantumCircuit, Aer, transpile
+from qiskit.result import Result
+
+from qiskit_utils import ResultCache, parse_counts, parse_result
+
+
+class TestResultCache(TestCase):
+    def test_cached_values_match_parse_functions(self):
+        qc = self._prepare_circuit(1)
+        result = self._get_counts(qc)
+        with ResultCache(":memory:") as cache:
+            for _ in range(2):
+                assert cache.parse_result(result, qc) == parse_result(result, qc)
+                assert cache.parse_result(result, qc, indexed_results=False) == \
+                    parse_result(result, qc, indexed_results=False)
+                assert cache.parse_counts(result, qc) == parse_counts(result, qc)
+                assert np.array_equal(cache.parse_counts(result, qc, as_array=True),
+                                      parse_counts(result, qc, as_array=True))
+            assert cache.misses == 3
+            assert cache.hits == 5
+            assert len(cache) == 3
+
+    def test_cache_persists_in_file(self):
+        qc = self._prepare_circuit(1)
+        result = self._get_counts(qc)
+        path = self._get_path()
+        with ResultCache(path) as cache:
+            expected = cache.parse_counts(result, qc)
+        with ResultCache(path) as cache:
+            with patch("qiskit_utils.result_cache.parse_counts") as parse_counts_mock:
+                assert cache.parse_counts(result, qc) == expected
+            parse_counts_mock.assert_not_called()
+            assert cache.hits == 1
+
+    def test_entries_are_keyed_by_result_and_circuit(self):
+        first_circuit, second_circuit = self._prepare_circuit(1), self._prepare_circuit(2)
+        second_circuit.measure(1, 1)
+        first_result, second_result = self._get_counts(first_circuit), self._get_counts(second_circuit)
+        with ResultCache(":memory:", key_by_job_id=False) as cache:
+            assert cache.parse_counts(first_result, first_circuit) == parse_counts(first_result, first_circuit)
+            assert cache.parse_counts(second_result, first_circuit) == parse_counts(second_result, first_circuit)
+            assert cache.parse_counts(second_result, second_circuit) == parse_counts(second_result, second_circuit)
+            assert cache.parse_counts(first_result, first_circuit, {"measure", "reset"}) == \
+                parse_counts(first_result, first_circuit, {"measure", "reset"})
+            assert cache.misses == 4
+
+    def test_least_recently_used_entries_are_evicted(self):
+        qc = self._prepare_circuit(1)
+        results = [self._get_counts(qc) for _ in range(3)]
+        with ResultCache(":memory:", max_entries=2) as cache:
+            cache.parse_counts(results[0], qc)
+            cache.parse_counts(results[1], qc)
+            cache.parse_counts(results[0], qc)
+            cache.parse_counts(results[2], qc)
+            assert len(cache) == 2
+            cache.parse_counts(results[0], qc)
+            assert cache.hits == 2
+            cache.parse_counts(results[1], qc)
+            assert cache.misses == 4
+
+    def test_cache_is_limited_by_size(self):
+        qc = self._prepare_circuit(1)
+        results = [self._get_counts(qc) for _ in range(3)]
+        with ResultCache(":memory:") as unlimited_cache:
+            unlimited_cache.parse_counts(results[0], qc)
+            entry_size = unlimited_cache.size
+        with ResultCache(":memory:", max_bytes=2 * entry_size) as cache:
+            for result in results:
+                cache.parse_counts(result, qc)
+            assert len(cache) == 2
+            assert cache.size <= 2 * entry_size
+
+    def _get_path(self) -> str:
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        return os.path.join(directory.name, "cache.sqlite")
+
+    @staticmethod
+    def _prepare_circuit(num_x: int) -> QuantumCircuit:
+        qc = QuantumCircuit(3, 2)
+        for qubit in range(num_x):
+            qc.x(qubit)
+        qc.measure(0, 1)
+        qc.measure(2, 0)
+        return qc
+
+    @staticmethod
+    def _get_counts(circuit: QuantumCircuit) -> Result:
+        backend = Aer.get_backend("aer_simulator")
+        transpiled_circuit = transpile(circuit, backend)
+        return backend.run(transpiled_circuit).result()
@@ -0,0 +1,25 @@
+from unittest import TestCase
+
+from pytest import raises
+
+from qiskit_utils.shared_sequence import SharedSequence
+
+
+class TestSharedSequence(TestCase):
+    def test_insert_matches_list_insert(self):
+        base = tuple(range(10))
+        sequence = SharedSequence(base, {2: 'two', 9: 'nine'})
+        expected = [0, 1, 'two', 3, 4, 5, 6, 7, 8, 'nine']
+        for item, index in enumerate([3, 4, 4, 0, 15, 40, -2, -30, 7, 7, 7, 1, 12]):
+            sequence.insert(index, -item)
+            expected.insert(index, -item)
+        assert sequence.to_list() == expected
+        assert [sequence[index] for index in range(-len(expected), len(expected))] == expected + expected
+        assert len(sequence) == len(expected)
+        assert base == tuple(range(10))
+
+    def test_index_out_of_range_raises_index_error(self):
+        sequence = SharedSequence((1, 2))
+        sequence.insert(0, 0)
+        with raises(IndexError):
+            sequence[3]
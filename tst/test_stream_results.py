@@ -0,0 +1,91 @@
+import io
+import json
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from qiskit import QuantumCircuit, Aer, transpile, QuantumRegister, ClassicalRegister
+from qiskit.result import Result
+from pytest import raises
+
+from qiskit_utils import MeasurementPlan, iter_result_file, parse_counts, parse_result
+from qiskit_utils.stream_results import parse_experiment_dict
+
+
+class TestStreamResults(TestCase):
+    def test_iter_result_file_matches_parse_functions(self):
+        circuits = [self._prepare_circuit(i) for i in range(1, 4)]
+        result = self._run(circuits)
+        path = self._save(result)
+        for chunk_size in (7, 65536):
+            parsed = list(iter_result_file(path, circuits, chunk_size=chunk_size))
+            assert parsed == [
+                (i, parse_counts(self._get_experiment(result, i), circuits[i])) for i in range(3)
+            ]
+            parsed = list(iter_result_file(path, circuits, counts=False, chunk_size=chunk_size))
+            assert parsed == [
+                (i, parse_result(self._get_experiment(result, i), circuits[i])) for i in range(3)
+            ]
+
+    def test_iter_result_file_with_one_circuit_and_file_object(self):
+        circuit = self._prepare_circuit(1)
+        result = self._run([circuit, circuit])
+        result_file = io.StringIO(json.dumps(result.to_dict(), default=str, indent=2))
+        parsed = dict(iter_result_file(result_file, circuit, chunk_size=16))
+        assert parsed == {0: parse_counts(self._get_experiment(result, 0), circuit),
+                          1: parse_counts(self._get_experiment(result, 1), circuit)}
+
+    def test_parse_experiment_dict_when_header_without_memory_slots(self):
+        qc = QuantumCircuit(3, 3)
+        qc.measure(range(3), range(3))
+        plan = MeasurementPlan.from_circuit(qc)
+        experiment = {"data": {"counts": {"0x0": 10, "0x1": 5}}, "header": {}}
+        assert parse_experiment_dict(experiment, plan) == {"000": 10, "100": 5}
+        assert parse_experiment_dict(experiment, plan, counts=False)[0] == {'0': 10, '1': 5}
+
+    def test_iter_result_file_raises_value_error_when_registers_do_not_match(self):
+        result = self._run([self._prepare_circuit(1)])
+        other_circuit = QuantumCircuit(6, 5)
+        with raises(ValueError):
+            list(iter_result_file(self._save(result), other_circuit))
+
+    def test_iter_result_file_raises_value_error_when_too_few_circuits(self):
+        circuit = self._prepare_circuit(1)
+        result = self._run([circuit, circuit])
+        with raises(ValueError):
+            list(iter_result_file(self._save(result), [circuit]))
+
+    @staticmethod
+    def _prepare_circuit(num_x: int) -> QuantumCircuit:
+        qr1, qr2 = QuantumRegister(3), QuantumRegister(3)
+        cr1, cr2 = ClassicalRegister(2), ClassicalRegister(3)
+        qc = QuantumCircuit(qr1, cr1, qr2, cr2)
+        for qubit in range(num_x):
+            qc.x(qubit)
+        qc.h(qr2[2])
+
+        qc.measure(qr1[0], cr2[2])
+        qc.measure(qr1[2], cr1[0])
+        qc.measure(qr2[0], cr2[0])
+        qc.measure(qr2[2], cr1[1])
+        qc.measure(qr1[1], cr2[1])
+        return qc
+
+    @staticmethod
+    def _get_experiment(result: Result, index: int) -> Result:
+        experiment_result = result.to_dict()
+        experiment_result["results"] = [experiment_result["results"][index]]
+        return Result.from_dict(experiment_result)
+
+    def _save(self, result: Result) -> str:
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "result.json")
+        with open(path, "w") as result_file:
+            json.dump(result.to_dict(), result_file, default=str)
+        return path
+
+    @staticmethod
+    def _run(circuits) -> Result:
+        backend = Aer.get_backend("aer_simulator")
+        return backend.run(transpile(circuits, backend)).result()